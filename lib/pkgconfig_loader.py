@@ -8,7 +8,6 @@ import os
 import sys
 
 # Standard library imports - Utility modules
-import inspect
 import json
 
 # Standard library imports - Date and time handling
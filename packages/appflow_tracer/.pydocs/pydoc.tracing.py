@@ -30,10 +30,12 @@ Usage:
         python tracing.py
 
 Dependencies:
-    - `sys` - Provides system-level operations, including path management.
+    - `sys` - Provides system-level operations, including path management and caller-frame lookup.
     - `json` - Enables structured logging in JSON format.
-    - `inspect` - Used for function introspection and execution tracing.
     - `logging` - Handles structured logging and message formatting.
+    - `logging.handlers` - Queues log records for a background `QueueListener`.
+    - `queue` - Provides the queue shared between the logger and its listener.
+    - `atexit` - Drains queued log records before the interpreter exits.
     - `builtins` - Overrides `print` statements for structured logging.
     - `pathlib.Path` - Resolves file and directory paths dynamically.
     - `datetime` - Used for timestamping and log file management.
@@ -47,9 +49,14 @@ Global Variables:
     - `LOGGING` (bool): Flag indicating whether logging has been initialized.
     - `CONFIGS` (dict): Stores the effective logging and tracing configurations.
     - `logger` (logging.Logger): Global logger instance used for structured logging.
+    - `LISTENERS` (dict): Background `FlushingQueueListener` instances keyed by logger name.
+    - `CONFIG_CACHE` (dict): Parsed configurations reused by `cached_configs()`.
 
 Primary Functions:
     - `setup_logging(configs, logname_override, events)`: Initializes structured logging.
+    - `stop_logging(logger_name)`: Drains and stops background log listeners.
+    - `cached_configs(absolute_path, logname_override, events)`: Loads configurations once per module (until their file changes).
+    - `print_logged(*args, sep)`: Replacement for `builtins.print` that routes output to the logger.
     - `main()`: Entry point for standalone execution, setting up tracing and logging.
     - `PrintCapture.emit(record)`: Captures print statements and redirects them to logs.
     - `ANSIFileHandler.emit(record)`: Ensures log files do not contain ANSI escape sequences.
@@ -75,7 +82,8 @@ class PrintCapture(logging.StreamHandler):
     while ensuring they are displayed in the console.
 
     This ensures that print statements are properly logged without affecting
-    real-time console output.
+    real-time console output. The real stdout's `write`/`flush` methods are bound
+    once when the handler is created.
 
     def emit(self, record: logging.LogRecord) -> None:
 
@@ -92,6 +100,15 @@ class PrintCapture(logging.StreamHandler):
         Returns:
             None
 
+    def flush(self) -> None:
+
+        Flushes the real stdout that records are written to. The inherited
+        `self.stream` (stderr when the handler was created) is never written,
+        and may have been closed since (e.g., by pytest's output capture).
+
+        Returns:
+            None
+
 class ANSIFileHandler(logging.FileHandler):
 
     Custom FileHandler that removes ANSI codes from log output
@@ -106,7 +123,16 @@ class ANSIFileHandler(logging.FileHandler):
         and filters out logs from the internal Python logging module.
 
         This prevents unnecessary ANSI escape codes from appearing in log files
-        and ensures only relevant logs are recorded.
+        and ensures only relevant logs are recorded. Records are skipped when their
+        module is `__init__` and their path ends with `skip_suffix`
+        (`logging/__init__.py`, using the platform's path separator).
+
+        The stream is opened with a `buffer_size` write buffer. Unlike
+        `StreamHandler.emit()`, records are not flushed one by one: the buffer is
+        flushed only once `flush_interval` seconds have passed since the last
+        flush, so bursts of records share a single write(). The records left
+        at the end of a burst are written by `FlushingQueueListener` as soon as
+        its queue drains (or by `flush()` / `close()`).
 
         Args:
             record (logging.LogRecord): The log record to be emitted, including
@@ -114,6 +140,32 @@ class ANSIFileHandler(logging.FileHandler):
 
         Returns:
             None
+
+    def flush(self) -> None:
+
+        Writes any buffered log records to the log file immediately.
+
+        Returns:
+            None
+
+class FlushingQueueListener(QueueListener):
+
+    QueueListener that flushes its handlers whenever its queue drains.
+
+    `ANSIFileHandler` only flushes on a later record once `flush_interval` has
+    passed, so without this the last records of a burst could stay buffered
+    until the next record or process exit.
+
+    def handle(self, record: logging.LogRecord) -> None:
+
+        Dispatches the record to every handler, then flushes all handlers
+        when no further records are queued.
+
+        Args:
+            record (logging.LogRecord): The record taken from the queue.
+
+        Returns:
+            None
 """
 
 FUNCTION_DOCSTRINGS = {
@@ -122,13 +174,15 @@ FUNCTION_DOCSTRINGS = {
 
     This function sets up the logging environment, creating log files and adding handlers
     for both file-based and console-based logging. It ensures proper logging behavior
-    even when no configuration is provided.
+    even when no configuration is provided. A repeated call whose logger already writes
+    to the same log file keeps the running listener and its open file handler.
 
     Args:
         configs (dict, optional): A dictionary containing logging configurations.
             If None, the default global configurations are used.
         logname_override (str, optional): A custom name for the log file.
-            If None, the log file name is derived from the calling script.
+            If None, the log file name is derived from the calling script
+            (its module is resolved from `sys._getframe(1)`).
         events (bool, list, or dict, optional):
             - `None` / `False` → Disables all event logging.
             - `True` → Enables all event logging.
@@ -152,6 +206,68 @@ FUNCTION_DOCSTRINGS = {
             ...
         }
     """,
+    "stop_logging": """
+    Drains and stops the background log listener(s).
+
+    Log records are queued by a `QueueHandler` on the caller thread and written to the
+    log file and console by a `FlushingQueueListener` thread. Stopping a listener blocks until
+    every queued record has been handled; its handlers are then closed, which flushes
+    anything still buffered and releases the log file. This function is registered
+    with `atexit`.
+
+    Args:
+        logger_name (str, optional): The logger whose listener should be stopped.
+            If None, all active listeners are stopped.
+
+    Returns:
+        None
+
+    Example:
+        >>> stop_logging()
+        # All pending log records are flushed to their handlers.
+    """,
+    "cached_configs": """
+    Loads a module's configuration through `pkgconfig.setup_configs()`, reusing earlier results.
+
+    Entries in `CONFIG_CACHE` are keyed by the module path, log name and `events` setting,
+    and are stored with the modification time of the module's JSON config file (taken after
+    `setup_configs()` rewrites it). A later call with the same arguments returns a copy of the
+    cached configuration unless the file has changed on disk since then.
+
+    Args:
+        absolute_path (Path): Path of the module whose configuration is loaded.
+        logname_override (str or Path, optional): Log name passed on to `setup_configs()`.
+        events (bool, list, or dict, optional): Event settings passed on to `setup_configs()`.
+
+    Returns:
+        dict: A deep copy of the effective configuration (safe for callers to modify).
+
+    Example:
+        >>> cached_configs(Path("packages/appflow_tracer/tracing"), "tracing", ["call", "return"])
+        {"logging": {...}, "tracing": {...}, "events": {...}, ...}
+    """,
+    "print_logged": """
+    Routes `print()` output through the global logger.
+
+    `setup_logging()` installs this function as `builtins.print`. It is defined once at
+    module scope, so each call runs a single Python frame (no lambda or generator
+    expression) before handing one joined string to `logger.info()`, through the `_log_info`
+    binding made by `setup_logging()`.
+
+    Args:
+        *args (object): The values to print; each is converted with `str()`.
+        sep (str, optional): Separator placed between values. Defaults to a single space.
+        end (str, optional): Accepted for `print()` compatibility; each call is one log record.
+        file (object, optional): Accepted for `print()` compatibility; output always goes to the logger.
+        flush (bool, optional): Accepted for `print()` compatibility; the log handlers manage flushing.
+
+    Returns:
+        None
+
+    Example:
+        >>> print_logged("Tracing", "enabled")
+        # Logged as: Tracing enabled
+    """,
     "main": """
     Entry point for running the tracing module as a standalone program.
 
@@ -189,5 +305,23 @@ VARIABLE_DOCSTRINGS = {
     - Type: logging.Logger
     - Default: None
     - Usage: Handles structured logs for function calls, execution tracing, and errors.
+    """,
+    "LISTENERS": """
+    - Description: Background log listeners, keyed by logger name.
+    - Type: dict[str, FlushingQueueListener]
+    - Default: {}
+    - Usage: Owns the file and console handlers so log I/O happens off the caller thread.
+    """,
+    "_log_info": """
+    - Description: The global logger's `info` method, bound when `setup_logging()` creates the logger.
+    - Type: Callable | None
+    - Default: None
+    - Usage: Lets `print_logged()` emit records without looking up `logger.info` on every print.
+    """,
+    "CONFIG_CACHE": """
+    - Description: Parsed configurations, each stored with its JSON file's modification time.
+    - Type: dict[tuple[str, str, str], tuple[int | None, dict]]
+    - Default: {}
+    - Usage: Lets repeated `setup_logging()` calls skip `pkgconfig.setup_configs()` until the config file changes.
     """
 }
@@ -10,7 +10,9 @@ import sys
 from pathlib import Path
 
 # Ensure the current directory is added to sys.path
-sys.path.insert(0, str(Path(__file__).resolve().parent))
+_HERE_DIR = str(Path(__file__).resolve().parent)  # Resolved once for both the check and the insert
+if _HERE_DIR not in sys.path:
+    sys.path.insert(0, _HERE_DIR)  # Insert once; avoids duplicate search-path entries
 
 from packages.appflow_tracer.tracing import main
 
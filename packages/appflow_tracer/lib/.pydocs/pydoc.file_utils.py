@@ -29,6 +29,7 @@ Usage:
 Dependencies:
     - sys - Handles system interactions.
     - re - Provides regex utilities for ANSI escape sequence removal.
+    - functools - Caches project-file checks (`lru_cache`).
     - pathlib - Handles file system operations.
     - lib.system_variables - Imports project-wide settings.
     - lib.log_utils - Logs file management operations.
@@ -79,6 +80,7 @@ FUNCTION_DOCSTRINGS = {
     Behavior:
         - Resolves the absolute path before performing the check.
         - Returns False if the filename is None or an empty string.
+        - Results are cached per filename with `functools.lru_cache(maxsize=4096)`.
 
     Error Handling:
         - Gracefully handles unexpected inputs such as None or invalid paths.
@@ -32,6 +32,7 @@ Dependencies:
     - logging - Provides core logging functionalities.
     - datetime - Manages log timestamps.
     - lib.system_variables - Loads global configuration settings.
+    - serialize_utils - Encodes structured JSON data (via `orjson` when available).
 
 Global Behavior:
     - Logs messages to both console and files based on configuration settings.
@@ -59,6 +60,42 @@ Exit Codes:
 """
 
 FUNCTION_DOCSTRINGS = {
+    "_validate_colors": """
+    Function: _validate_colors(colors: dict) -> tuple
+    Description:
+        Builds (once per palette) a color table where every entry is a valid ANSI escape code.
+
+    Parameters:
+        - colors (dict): The `configs["colors"]` mapping of log categories to ANSI codes.
+
+    Returns:
+        - tuple: The validated color table and the `RESET` code.
+
+    Workflow:
+        1. Returns the cached table when this same palette was the last one validated and its items are unchanged.
+        2. Replaces any entry that does not start with `\\033` with the `RESET` code.
+        3. Adds every `log_levels` category and a lower-case alias for each key.
+        4. Replaces the single cache entry with this palette, a copy of its items and the table.
+
+    Example:
+        >>> colors, reset = _validate_colors(configs["colors"])
+        >>> colors.get("INFO", reset)
+    """,
+    "_has_content": """
+    Function: _has_content(message: str) -> bool
+    Description:
+        Checks whether a message contains at least one non-whitespace character.
+
+    Parameters:
+        - message (str): The message to inspect.
+
+    Returns:
+        - bool: True if the message has content, False if it is empty or whitespace-only.
+
+    Notes:
+        - Equivalent to `bool(message.strip())`, but `str.isspace()` scans in C and
+          stops at the first non-whitespace character without allocating a new string.
+    """,
     "log_message": """
     Function: log_message(
         message: str,
@@ -66,7 +103,10 @@ FUNCTION_DOCSTRINGS = {
         json_data: dict = None,
         serialize_json: bool = False,
         configs: dict = None,
-        handler: logging.Logger = None
+        handler: logging.Logger = None,
+        _log_levels: dict = log_levels,
+        _get_logger: Callable = logging.getLogger,
+        _json_dumps: Callable = serialize_utils.json_dumps
     ) -> None
     Description:
         Logs a structured message with optional JSON data to both console and log files.
@@ -78,6 +118,7 @@ FUNCTION_DOCSTRINGS = {
         - serialize_json (bool, optional): If True, serializes `json_data` into a JSON string.
         - configs (dict, optional): Configuration dictionary. Defaults to global `CONFIGS` if not provided.
         - handler (logging.Logger, optional): The specific logger instance to use.
+        - _log_levels, _get_logger, _json_dumps (internal): Bound at definition time as fast locals; not meant to be passed.
 
     Raises:
         - KeyError: If the provided log category is invalid.
@@ -87,7 +128,7 @@ FUNCTION_DOCSTRINGS = {
         - None
 
     Workflow:
-        1. Determines the correct log level based on `log_category`.
+        1. Determines the correct log level based on `log_category` (upper-casing only on a lookup miss).
         2. Serializes JSON data if `serialize_json` is enabled.
         3. Logs the message to a file if file logging is enabled.
         4. Displays the message in the console if tracing is enabled.
@@ -102,7 +143,8 @@ FUNCTION_DOCSTRINGS = {
         logger: logging.Logger,
         message: str,
         log_category: str = "INFO",
-        json_data: dict = None
+        json_data: dict = None,
+        _json_dumps: Callable = serialize_utils.json_dumps
     ) -> None
     Description:
         Writes a structured log message to a designated log file.
@@ -112,6 +154,7 @@ FUNCTION_DOCSTRINGS = {
         - message (str): The log message text.
         - log_category (str, optional): The log level/category (defaults to "INFO").
         - json_data (dict, optional): Additional structured JSON data for the log entry.
+        - _json_dumps (internal): Bound at definition time as a fast local; not meant to be passed.
 
     Raises:
         - OSError: If the log file cannot be accessed or written to.
@@ -120,8 +163,8 @@ FUNCTION_DOCSTRINGS = {
         - None
 
     Workflow:
-        1. Formats the log message with category and timestamp.
-        2. Appends structured JSON data if provided.
+        1. Passes the category and message as `%s` arguments so formatting is deferred to the handler.
+        2. Places structured JSON data (if provided) on the following line; strings are written as-is.
         3. Writes the log entry to the designated log file.
 
     Example:
@@ -133,7 +176,9 @@ FUNCTION_DOCSTRINGS = {
         message: str,
         log_category: str,
         json_data: dict = None,
-        configs: dict = None
+        configs: dict = None,
+        _json_dumps: Callable = serialize_utils.json_dumps,
+        _default_indent: int = default_indent
     ) -> None
     Description:
         Displays a structured log message in the console with optional ANSI color formatting.
@@ -143,6 +188,7 @@ FUNCTION_DOCSTRINGS = {
         - log_category (str): The logging category (e.g., category.info.id, category.error.id).
         - json_data (dict, optional): Additional structured JSON data for output.
         - configs (dict, optional): Configuration dictionary for colors and formatting.
+        - _json_dumps, _default_indent (internal): Bound at definition time as fast locals; not meant to be passed.
 
     Raises:
         - KeyError: If an invalid log category is provided.
@@ -152,10 +198,10 @@ FUNCTION_DOCSTRINGS = {
         - None
 
     Workflow:
-        1. Determines the ANSI color for the log category.
+        1. Looks up the ANSI color for the log category in the validated color table.
         2. Formats the message with ANSI color codes.
-        3. Prints the formatted message to the console.
-        4. Displays structured JSON data if provided.
+        3. Appends structured JSON data (if provided) on the following line.
+        4. Prints the combined output to the console in a single write.
 
     Example:
         >>> output_console("Service started", category.info.id)
@@ -200,6 +246,12 @@ VARIABLE_DOCSTRINGS = {
         - `warning` (Red): Logs warning messages.
         - `reset` (Default): Resets terminal color formatting.
     """,
+    "_color_table": """
+    - Description: Single-entry cache holding the last palette validated by `_validate_colors()`,
+      a copy of its items (to detect in-place changes), the validated table and the `RESET` code.
+    - Type: tuple
+    - Usage: Lets `output_console()` skip the per-call ANSI prefix check and `RESET` lookups.
+    """,
     "log_levels": """
     - Description: Maps log categories to their respective logging levels.
     - Type: dict[str, int]
@@ -12,8 +12,8 @@ Description:
 
 Core Features:
     - **Safe Serialization**: Converts Python objects to JSON-friendly formats.
+    - **Accelerated Encoding**: Uses `orjson` for compact JSON output when it is installed.
     - **String Sanitization**: Cleans and trims code strings while removing comments.
-    - **Structured Logging Integration**: Logs serialization results using `log_utils`.
 
 Usage:
     To safely serialize a Python object:
@@ -26,10 +26,10 @@ Usage:
 
 Dependencies:
     - json - Enables structured JSON serialization.
-    - tokenize - Tokenizes code for proper comment removal.
-    - io.StringIO - Handles text processing for tokenization.
+    - orjson (optional) - Faster compact JSON encoding; `json` is used when unavailable.
+    - re - Precompiled patterns that locate comments outside string literals.
+    - re2 (optional) - Linear-time (DFA) matching for the comment pattern; `re` is used when unavailable.
     - lib.system_variables - Provides project-wide settings.
-    - log_utils - Supports structured logging of serialization operations.
 
 Global Behavior:
     - `safe_serialize()` gracefully handles non-serializable objects.
@@ -47,12 +47,61 @@ Exit Codes:
 """
 
 FUNCTION_DOCSTRINGS = {
+    "json_dumps": """
+    Function: json_dumps(
+        data: any,
+        indent: int = None,
+        default: Callable = None
+    ) -> str
+    Description:
+        Encodes Python data as a JSON string, using `orjson` when available.
+
+    Parameters:
+        - data (any): The Python object to encode.
+        - indent (int, optional): Indentation level for pretty-printed output.
+        - default (Callable, optional): Fallback encoder for unsupported types (e.g., `str`).
+
+    Raises:
+        - TypeError: If the data contains unsupported types and no `default` is provided.
+        - ValueError: If the data contains circular references.
+
+    Returns:
+        - str: Compact JSON (no whitespace) when `indent` is None, otherwise indented JSON.
+
+    Workflow:
+        1. Encodes compact output with `orjson` when it is installed.
+        2. Falls back to `json.dumps()` for indented output or anything `orjson` rejects.
+        3. Keeps Unicode characters unescaped in both cases.
+
+    Example:
+        >>> json_dumps({"key": "value"})
+        '{"key":"value"}'
+    """,
+    "SerializeResult": """
+    Class: SerializeResult(NamedTuple)
+    Description:
+        Lightweight, immutable result record returned by `safe_serialize()`.
+
+    Fields:
+        - success (bool): Indicates if serialization was successful.
+        - serialized (str): JSON string of serialized data or an error message.
+        - type (str): The type of the original object.
+        - error (str, optional): Error message if serialization failed. Defaults to None.
+
+    Workflow:
+        1. Allocated once per `safe_serialize()` call (a single tuple, no per-call hash table).
+        2. Fields are read by attribute (e.g., `result.success`); `result._asdict()` returns a dictionary.
+
+    Example:
+        >>> SerializeResult(True, "1", "int")
+        SerializeResult(success=True, serialized='1', type='int', error=None)
+    """,
     "safe_serialize": """
     Function: safe_serialize(
         data: any,
         configs: dict,
         verbose: bool = False
-    ) -> dict
+    ) -> SerializeResult
     Description:
         Converts Python objects into a JSON-compatible format with metadata.
 
@@ -66,24 +115,26 @@ FUNCTION_DOCSTRINGS = {
         - ValueError: If there is an issue converting data to JSON.
 
     Returns:
-        - dict: A structured response containing serialization results:
+        - SerializeResult: A structured response containing serialization results:
             - `success` (bool): Indicates if serialization was successful.
             - `serialized` (str): JSON string of serialized data or an error message.
             - `type` (str): The type of the original object.
             - `error` (str, optional): Error message if serialization failed.
 
     Workflow:
-        1. Attempts to serialize the input data using `json.dumps()`.
-        2. If serialization fails, checks for attributes (`__dict__`) and serializes them.
-        3. If the object is iterable, converts it into a list.
-        4. Returns a structured response indicating success or failure.
+        1. Returns pre-rendered JSON for `None`, booleans, integers, and finite floats.
+        2. Sends non-native types (custom objects, iterators) straight to the fallback path.
+        3. Serializes native data types using `json_dumps()`.
+        4. On fallback or failure, checks for attributes (`__dict__`) and serializes them.
+        5. If the object is iterable, converts it into a list.
+        6. Returns a structured response indicating success or failure.
 
     Example:
         >>> safe_serialize({"key": "value"}, configs=configs)
-        {'success': True, 'serialized': '{"key": "value"}', 'type': 'dict'}
+        SerializeResult(success=True, serialized='{"key":"value"}', type='dict', error=None)
 
         >>> safe_serialize(object(), configs=configs)
-        {'success': False, 'serialized': '[Unserializable data]', 'type': 'object', 'error': 'TypeError'}
+        SerializeResult(success=False, serialized='[Unserializable data]', type='object', error='Object is not JSON serializable')
     """,
     "sanitize_token_string": """
     Function: sanitize_token_string(line: str) -> str
@@ -94,16 +145,23 @@ FUNCTION_DOCSTRINGS = {
         - line (str): A single line of text that may contain comments and extra spaces.
 
     Raises:
-        - Exception: If an unexpected error occurs while parsing tokens.
+        - None: Lines the pattern cannot split are returned stripped instead.
 
     Returns:
         - str: The sanitized version of the input line with comments removed.
 
     Workflow:
-        1. Tokenizes the input string using Python's `tokenize` module.
-        2. Iterates through tokens and removes comments (`# ...`).
-        3. Preserves meaningful text while ensuring proper spacing.
-        4. Returns the cleaned version of the input line.
+        1. Returns the stripped line immediately when it contains no `#`.
+        2. Cuts the line at the first `#` when it contains no quotes.
+        3. Otherwise skips complete string literals with a precompiled regex (`re2` when installed) and cuts at the first `#` outside them.
+        4. Returns the stripped line unchanged when every `#` sits inside a string literal.
+
+    Notes:
+        - Results are cached with `functools.lru_cache(maxsize=4096)`; the function is pure.
+        - Use `sanitize_token_string.cache_clear()` to reset the cache.
+        - Inner spacing is kept as written (`x  =  1` stays `x  =  1`); only the ends are trimmed.
+          The former `tokenize` implementation re-joined tokens (`x=1`), which no caller relied on:
+          the result is only displayed in trace logs.
 
     Example:
         >>> sanitize_token_string("some_code()  # this is a comment")
@@ -111,6 +169,9 @@ FUNCTION_DOCSTRINGS = {
 
         >>> sanitize_token_string("   another_line   ")
         'another_line'
+
+        >>> sanitize_token_string('x = "a # b"  # c')
+        'x = "a # b"'
     """,
     "main": """
     Function: main() -> None
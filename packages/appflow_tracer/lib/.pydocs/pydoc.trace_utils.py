@@ -25,9 +25,11 @@ Usage:
         trace_utils.start_tracing()
 
 Dependencies:
-    - sys - Provides system-level tracing hooks.
-    - json - Enables structured JSON serialization for tracing.
-    - inspect - Extracts function metadata dynamically.
+    - os - Provides the path separator for the project-root prefix check.
+    - sys - Provides PEP 669 event monitoring (`sys.monitoring`, Python 3.12+) and the `sys.setprofile` fallback.
+    - threading - Restricts monitoring callbacks to the thread that started tracing.
+    - linecache - Reads source lines for traced frames.
+    - functools - Caches per call-site frame context (`lru_cache`).
     - logging - Supports structured execution logging.
     - lib.system_variables - Provides logging categories.
     - lib.log_utils - Manages structured logging output.
@@ -36,6 +38,7 @@ Dependencies:
 
 Global Behavior:
     - Tracing activates only when **enabled in the configuration**.
+    - On Python 3.12+ events arrive through `sys.monitoring`, which stops reporting non-project code after its first event.
     - Calls, returns, and execution paths are **logged dynamically**.
     - Non-project files and system-level operations are **excluded from tracing**.
     - Return values are **serialized safely** for structured logging.
@@ -55,6 +58,124 @@ Example:
 """
 
 FUNCTION_DOCSTRINGS = {
+    "_coerce": """
+    Function: _coerce(
+        value: object,
+        active: set = None
+    ) -> object
+    Description:
+        Converts a value into JSON-compatible data in a single pass (no encode/decode round-trip).
+
+    Parameters:
+        - value (object): The value to convert (typically a traced function argument).
+        - active (set, optional): Ids of the containers currently being converted (cycle detection).
+
+    Raises:
+        - ValueError: If the value contains a circular reference.
+        - TypeError: If a dictionary key is not a str, int, float, bool or None (as `json.dumps()` does).
+
+    Returns:
+        - object: Scalars unchanged, dicts with string keys, lists for lists/tuples, and `str()` for anything else.
+
+    Workflow:
+        1. Returns JSON-native scalars as-is.
+        2. Recursively converts dictionaries, lists, and tuples, spelling keys with `_coerce_key()`.
+        3. Stringifies every other object, matching `json.dumps(..., default=str)`.
+
+    Example:
+        >>> _coerce({"path": Path("/tmp"), "items": (1, 2)})
+        {'path': '/tmp', 'items': [1, 2]}
+    """,
+    "_coerce_key": """
+    Function: _coerce_key(
+        key: object
+    ) -> str
+    Description:
+        Converts a dictionary key into the string `json.dumps()` would write for it.
+
+    Parameters:
+        - key (object): The dictionary key to convert.
+
+    Raises:
+        - TypeError: If the key is not a str, int, float, bool or None (`default=str` does not apply to keys).
+
+    Returns:
+        - str: The key unchanged for strings, otherwise its JSON spelling (e.g., `True` -> "true", `None` -> "null").
+
+    Example:
+        >>> _coerce_key(None)
+        'null'
+    """,
+    "_relative_name": """
+    Function: _relative_name(
+        filename: str
+    ) -> str
+    Description:
+        Returns the interned, project-relative name of a source file (cached).
+
+    Parameters:
+        - filename (str): The absolute source path (`frame.f_code.co_filename`).
+
+    Returns:
+        - str: The result of `file_utils.relative_path()`, interned with `sys.intern()`.
+
+    Workflow:
+        1. Converts the filename with `file_utils.relative_path()` (path resolution happens once per file).
+        2. Interns the result so every message built for that file reuses the same string object.
+        3. Caches the result with `functools.lru_cache(maxsize=2048)`.
+
+    Example:
+        >>> _relative_name(frame.f_code.co_filename)
+        'packages/appflow_tracer/tracing'
+    """,
+    "_frame_context": """
+    Function: _frame_context(
+        filename: str,
+        lineno: int
+    ) -> tuple
+    Description:
+        Returns the project-relative filename and the sanitized source line for a frame location (cached).
+
+    Parameters:
+        - filename (str): The absolute source path (`frame.f_code.co_filename`).
+        - lineno (int): The line number being executed (`frame.f_lineno`).
+
+    Returns:
+        - tuple: `(relative_filename, source_line)`; `source_line` is `"Unknown"` when unavailable.
+
+    Workflow:
+        1. Converts the filename with `_relative_name()`.
+        2. Reads the line with `linecache.getline()` and strips comments/whitespace with `sanitize_token_string()`.
+        3. Caches the pair with `functools.lru_cache(maxsize=8192)` so a repeated call site costs one lookup.
+
+    Example:
+        >>> _frame_context(frame.f_code.co_filename, frame.f_lineno)
+        ('packages/appflow_tracer/tracing', 'trace_utils.start_tracing(')
+    """,
+    "_excluded_codes": """
+    Function: _excluded_codes() -> frozenset
+    Description:
+        Collects the code objects of the functions the tracer must never report on.
+
+    Returns:
+        - frozenset: Code objects of `log_utils.log_message()`, `serialize_utils.safe_serialize()`,
+          `serialize_utils.sanitize_token_string()`, a Python-level `builtins.print` replacement
+          (e.g., `tracing.print_logged()`), every `emit()` defined by a `logging.Handler` subclass, and the
+          frames that are installing the tracer.
+
+    Workflow:
+        1. Unwraps decorated functions (e.g., `lru_cache`) to reach their underlying code objects.
+        2. Walks the `logging.Handler` class hierarchy for `emit()` overrides (e.g., `PrintCapture`, `ANSIFileHandler`).
+        3. Skips anything without a `__code__` attribute (e.g., mocked functions).
+        4. Walks up the calling stack through this module's frames (`trace_all()`, `monitor_events()`,
+           `start_tracing()`) up to and including the first outside caller (e.g., `tracing.setup_logging()`).
+           Those frames are already running when tracing starts, so their returns would otherwise be
+           logged (`setup_logging()` returns the whole CONFIGS dict).
+
+    Example:
+        >>> log_utils.log_message.__code__ in _excluded_codes()
+        True
+    """,
     "start_tracing": """
     Function: start_tracing(
         logger: logging.Logger = None,
@@ -77,11 +198,73 @@ FUNCTION_DOCSTRINGS = {
         1. Sets up function tracing based on configuration.
         2. Ensures logging is enabled before activating tracing.
         3. Calls `trace_all()` to generate a trace handler.
+        4. Skips installation when `tracing_active()` reports a tracer is already running.
+        5. Installs it with `monitor_events()` when `sys.monitoring` is available and its profiler tool id is free,
+           otherwise with `sys.setprofile()` (call/return events only).
 
     Example:
         >>> start_tracing()
         # Tracing starts using the global configuration.
     """,
+    "tracing_active": """
+    Function: tracing_active() -> bool
+    Description:
+        Reports whether a tracer is already installed on either backend.
+
+    Returns:
+        - bool: True if a profile hook is set on the current thread or this module's monitoring tool is registered.
+
+    Example:
+        >>> tracing_active()
+        False
+    """,
+    "stop_tracing": """
+    Function: stop_tracing() -> None
+    Description:
+        Removes the tracer installed by `start_tracing()`, whichever backend it uses.
+
+    Returns:
+        - None
+
+    Workflow:
+        1. Clears the current thread's profile hook (`sys.setprofile(None)`).
+        2. Turns off every event for this module's monitoring tool and frees its tool id
+           (monitoring tools, unlike profile hooks, stay active until released).
+
+    Example:
+        >>> stop_tracing()
+        >>> tracing_active()
+        False
+    """,
+    "monitor_events": """
+    Function: monitor_events(
+        trace_func: Callable
+    ) -> None
+    Description:
+        Feeds PEP 669 (`sys.monitoring`) events to a profile-style trace function.
+
+    Parameters:
+        - trace_func (Callable): Handler with the `sys.setprofile()` signature `(frame, event, arg)`,
+          typically the function returned by `trace_all()`.
+
+    Returns:
+        - None
+
+    Workflow:
+        1. Claims the profiler tool id (`sys.monitoring.PROFILER_ID`) under the name `appflow_tracer`.
+        2. Maps PY_START/PY_RESUME/PY_THROW to "call" and PY_RETURN/PY_YIELD/PY_UNWIND to "return",
+           matching the events `sys.setprofile()` reports for Python functions.
+        3. Returns `sys.monitoring.DISABLE` for excluded or non-project code objects, so the interpreter
+           stops reporting those locations in C instead of calling Python on every call. A code file
+           outside the project-root prefix is still checked with the cached `file_utils.is_project_file()`
+           (which resolves the path) when it is absolute, so a project reached through a symlink is not
+           disabled while pseudo-files such as `<frozen os>` are.
+        4. Ignores events from threads other than the one that installed the tracer (profile hooks are per-thread).
+
+    Example:
+        >>> monitor_events(trace_all(logger, configs))
+        # Project function calls and returns now reach `trace_events()`.
+    """,
     "trace_all": """
     Function: trace_all(
         logger: logging.Logger,
@@ -98,15 +281,16 @@ FUNCTION_DOCSTRINGS = {
         - ValueError: If tracing configurations are missing or invalid.
 
     Returns:
-        - Callable: A trace function that can be passed to `sys.settrace()`.
+        - Callable: A trace function that can be passed to `sys.setprofile()` or `monitor_events()`.
 
     Workflow:
         1. Ensures tracing configurations are valid.
-        2. Defines `trace_events()` to handle function call and return tracing.
-        3. Returns the trace handler function.
+        2. Resolves loop-invariant values (event names, event toggles, excluded code objects, project prefix) once.
+        3. Defines `trace_events()` to handle function call and return tracing.
+        4. Returns the trace handler function.
 
     Example:
-        >>> sys.settrace(trace_all(logger, configs))
+        >>> sys.setprofile(trace_all(logger, configs))
         # Function tracing begins dynamically.
     """,
     "trace_events": """
@@ -130,10 +314,13 @@ FUNCTION_DOCSTRINGS = {
         - None
 
     Workflow:
-        1. Identifies function call and return events.
-        2. Ensures tracing is restricted to project-specific files.
-        3. Calls `call_events()` for function calls.
-        4. Calls `return_events()` for function returns.
+        1. Identifies function call and return events (ignoring C-function profile events).
+        2. Skips the tracer's own logging/serialization helpers by code-object identity.
+        3. Rejects frames whose code file (`frame.f_code.co_filename`) is outside the project root with a prefix check,
+           falling back to the cached `file_utils.is_project_file()` for unresolved absolute (e.g. symlinked) paths.
+        4. Ensures tracing is restricted to project-specific files.
+        5. Calls `call_events()` for function calls (only when call events are enabled).
+        6. Calls `return_events()` for function returns (only when return events are enabled).
 
     Example:
         >>> trace_events(frame, "call", None)
@@ -161,9 +348,10 @@ FUNCTION_DOCSTRINGS = {
         - None
 
     Workflow:
-        1. Extracts caller function details.
-        2. Logs function execution metadata, including arguments.
-        3. Filters out system and external function calls.
+        1. Returns immediately when call events are disabled in `configs["events"]`.
+        2. Extracts caller function details.
+        3. Logs function execution metadata, including arguments read straight from `frame.f_code` / `frame.f_locals` (converted with `_coerce()`).
+        4. Filters out system and external function calls.
 
     Example:
         >>> call_events(logger, frame, "file.py", args, configs)
@@ -190,9 +378,10 @@ FUNCTION_DOCSTRINGS = {
         - None
 
     Workflow:
-        1. Captures return values and execution flow.
-        2. Serializes return data for structured debugging.
-        3. Filters out system-level returns to avoid excessive logs.
+        1. Returns immediately when return events are disabled in `configs["events"]`.
+        2. Captures return values and execution flow.
+        3. Derives the loggable return data without serializing it: scalars as-is, other objects via a single `__dict__` probe; `log_message()` serializes it once.
+        4. Filters out system-level returns to avoid excessive logs.
 
     Example:
         >>> return_events(logger, frame, "file.py", return_value, configs)
@@ -216,6 +405,32 @@ FUNCTION_DOCSTRINGS = {
 }
 
 VARIABLE_DOCSTRINGS = {
+    "_JSON_SCALARS": """
+    - Description: JSON-native scalar types that `_coerce()` passes through unchanged.
+    - Type: tuple[type, ...]
+    - Usage: Short-circuits the conversion of traced function arguments.
+    """,
+    "_RETURN_SCALARS": """
+    - Description: Exact scalar types (`None`, `bool`, `int`, `float`, `str`) that `return_events()` logs unchanged.
+    - Type: frozenset[type]
+    - Usage: Lets common return values skip the `__dict__` probe; subclasses (e.g., enums) still expose their attributes.
+    """,
+    "_MONITORING": """
+    - Description: The `sys.monitoring` namespace (PEP 669), or None before Python 3.12.
+    - Type: ModuleType | None
+    - Usage: Selects the tracing backend in `start_tracing()`; None falls back to `sys.setprofile()`.
+    """,
+    "_MODULE_GLOBALS": """
+    - Description: This module's globals dictionary.
+    - Type: dict
+    - Usage: Lets `_excluded_codes()` recognise this module's own frames on the calling stack (`frame.f_globals`).
+    """,
+    "_MONITORING_TOOL": """
+    - Description: Name registered for the profiler tool id while this module's tracer is installed.
+    - Type: str
+    - Default: "appflow_tracer"
+    - Usage: Lets `tracing_active()` and `stop_tracing()` tell this tracer apart from other tools (e.g., cProfile).
+    """,
     "category": """
     - Description: Namespace containing ANSI color codes for categorized logging.
     - Type: SimpleNamespace
@@ -9,10 +9,15 @@ import sys
 # Standard library imports - Utility module
 import re
 
+# Standard library imports - Function tools
+from functools import lru_cache
+
 # Standard library imports - File system-related module
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).resolve().parent))
+_HERE_DIR = str(Path(__file__).resolve().parent)  # Resolved once for both the check and the insert
+if _HERE_DIR not in sys.path:
+    sys.path.insert(0, _HERE_DIR)  # Insert once; every lib module shares this directory
 
 # Import system_variables from lib.system_variables
 from lib.system_variables import (
@@ -27,6 +32,7 @@ from . import (
     log_utils
 )
 
+@lru_cache(maxsize=4096)  # Called on every traced event; the set of source files is small and stable
 def is_project_file(
     filename: str
 ) -> bool:
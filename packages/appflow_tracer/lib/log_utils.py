@@ -7,9 +7,11 @@ __version__ = "0.1.0"  ## Package version
 import sys
 
 # Standard library imports - Utility modules
-import json  # If structured data is part of logging
 import logging
 
+# Standard library imports - Type-related modules
+from typing import Callable
+
 # Standard library imports - Date and time handling
 from datetime import datetime  # If timestamps are used or manipulated
 
@@ -17,7 +19,9 @@ from datetime import datetime  # If timestamps are used or manipulated
 from pathlib import Path
 
 # Ensure the current directory is added to sys.path
-sys.path.insert(0, str(Path(__file__).resolve().parent))
+_HERE_DIR = str(Path(__file__).resolve().parent)  # Resolved once for both the check and the insert
+if _HERE_DIR not in sys.path:
+    sys.path.insert(0, _HERE_DIR)  # Insert once; every lib module shares this directory
 
 # Import category from system_variables
 from lib.system_variables import (
@@ -25,6 +29,10 @@ from lib.system_variables import (
     category
 )
 
+from . import (
+    serialize_utils
+)
+
 # Determine the correct logging level dynamically
 log_levels = {
     category.calls.id:    logging.INFO,
@@ -37,79 +45,121 @@ log_levels = {
     category.critical.id: logging.CRITICAL
 }
 
+# Last validated console color table: (palette, snapshot of its items, table, reset)
+_color_table = (None, None, None, None)
+
+def _validate_colors(colors: dict) -> tuple:
+
+    global _color_table
+
+    # Resolve each color once per palette instead of re-checking the ANSI prefix on every call
+    cached = _color_table
+    if cached[0] is colors and cached[1] == colors:  # Same palette, not mutated in place since
+        return cached[2], cached[3]
+    reset = colors["RESET"]
+    table = {
+        key: (value if isinstance(value, str) and value.startswith("\033") else reset)
+        for key, value in colors.items()
+    }
+    # Register every log category (and its lower-case alias) so `output_console()` resolves in one lookup
+    for key in log_levels:
+        table.setdefault(key, reset)
+    for key in list(table):
+        table.setdefault(key.lower(), table[key])
+    _color_table = (colors, dict(colors), table, reset)  # Single entry: a new palette replaces it
+    return table, reset
+
+def _has_content(message: str) -> bool:
+
+    # Same outcome as `message.strip()` without allocating a stripped copy
+    return bool(message) and not message.isspace()
+
 def log_message(
     message: str,
     log_category: str = "INFO",
     json_data: dict = None,
     serialize_json: bool = False,
     configs: dict = None,
-    handler: logging.Logger = None
+    handler: logging.Logger = None,
+    _log_levels: dict = log_levels,
+    _get_logger: Callable = logging.getLogger,
+    _json_dumps: Callable = serialize_utils.json_dumps
 ) -> None:
 
+    # Trailing underscore parameters are bound at definition time (LOAD_FAST instead of global lookups)
     # configs = configs or CONFIGS  # Default to global CONFIGS if not provided
     # print(f'log_message(configs): {json.dumps(configs, indent=default_indent, ensure_ascii=False)}')
     # Define logger if not available
-    logger = handler or logging.getLogger(f'{configs["logging"]["package_name"]}.{configs["logging"]["module_name"]}')
+    logger = handler or _get_logger(f'{configs["logging"]["package_name"]}.{configs["logging"]["module_name"]}')
     # print(f'Logger: {logger}')
 
-    log_level = log_levels.get(log_category.upper(), logging.INFO)
+    # Callers pass `category.*.id` (already upper-case); only normalize on a miss
+    log_level = _log_levels.get(log_category)
+    if log_level is None:
+        log_level = _log_levels.get(log_category.upper(), logging.INFO)
 
     # If json_data exists, append it to the message
     if json_data:
         if serialize_json:
-            json_data = json.dumps(json_data, separators=(",", ":"), ensure_ascii=False)
+            json_data = _json_dumps(json_data)
 
-    if configs["logging"].get("enable", False) and not configs["tracing"].get("enable", False):
-        if message.strip():
+    tracing_enabled = configs["tracing"].get("enable", False)
+    if configs["logging"].get("enable", False) and not tracing_enabled:
+        if _has_content(message):
             output_logfile(logger, message, log_level, json_data or False)  # Write ONLY to log file if tracing is disabled
 
-    if configs["tracing"].get("enable", False):
-        if message.strip():
+    if tracing_enabled:
+        if _has_content(message):
             output_console(message, log_category, json_data or False, configs)  # Write to console
 
 def output_logfile(
     logger: logging.Logger,
     message: str,
     log_category: str = "INFO",
-    json_data: dict = None
+    json_data: dict = None,
+    _json_dumps: Callable = serialize_utils.json_dumps
 ) -> None:
 
-    logfile_message = f'{log_category}: {message}'
-
-    # if json_data:
-    #     logfile_message += f'\n{json_data}'
-    if json_data:
-        logfile_message += "\n" + json.dumps(json_data, separators=(',', ':'))  # Ensure proper JSON formatting
-
     # Disabling the removal of ANSI escape codes allowing end-users to see the original output experience.
     # message = file_utils.remove_ansi_escape_codes(message)
-    logger.info(logfile_message)  # Write to log file
+    # %-style arguments defer building the entry until a handler accepts the record
+    if json_data:
+        # JSON payload on its own line; pre-serialized strings are written as-is
+        payload = json_data if isinstance(json_data, str) else _json_dumps(json_data)
+        logger.info('%s: %s\n%s', log_category, message, payload)  # Write to log file
+    else:
+        logger.info('%s: %s', log_category, message)  # Write to log file
 
 def output_console(
     message: str,
     log_category: str,
     json_data: dict = None,
-    configs: dict = None
+    configs: dict = None,
+    _json_dumps: Callable = serialize_utils.json_dumps,
+    _default_indent: int = default_indent
 ) -> None:
 
-    color = configs["colors"].get(log_category.upper(), configs["colors"]["RESET"])
-    if not color.startswith("\033"):  # Ensure it's an ANSI color code
-        color = configs["colors"]["RESET"]
-    console_message = f'{color}{message}{configs["colors"]["RESET"]}'
-    print(console_message)  # Print colored message
+    # `print` is deliberately not bound here: it is redirected (and patched in tests) after import
+    colors, reset = _validate_colors(configs["colors"])
+    color = colors.get(log_category)
+    if color is None:
+        color = colors.get(log_category.upper(), reset)
+    # Single pre-joined string: `print` may be redirected to `logger.info`, which ignores `sep`
+    console_message = f'{color}{message}{reset}'
     if json_data:
         compressed = configs["tracing"]["json"].get("compressed", None)
         # print(f'DEBUG: compressed={compressed} json_data={json_data}')  # Debugging output
         if compressed is not None:
             if isinstance(json_data, str):
                 # Print strings as-is (no JSON formatting)
-                print(json_data)
+                payload = json_data
+            elif compressed:
+                payload = _json_dumps(json_data)
             else:
-                if compressed:
-                    print(json.dumps(json_data, separators=(",", ":"), ensure_ascii=False))
-                else:
-                    # Pretty-print JSON while keeping Unicode characters
-                    print(json.dumps(json_data, indent=default_indent, ensure_ascii=False))
+                # Pretty-print JSON while keeping Unicode characters
+                payload = _json_dumps(json_data, indent=_default_indent)
+            console_message = f'{console_message}\n{payload}'
+    print(console_message)  # One write per record (message and JSON payload together)
 
 # Load documentation dynamically and apply module, function and objects docstrings
 from lib.pydoc_loader import load_pydocs
@@ -8,18 +8,40 @@ import sys
 
 # Standard library imports - Utility modules
 import json  # Handles JSON serialization and deserialization
-import tokenize  # Used for tokenizing Python source code
+import math  # Finite-float check for the scalar fast path
+import re  # Precompiled pattern that skips string literals when stripping comments
 
-# Standard library imports - IO operations
-from io import StringIO  # In-memory file-like object
+# Standard library imports - Function tools
+from functools import lru_cache
 
 # Standard library imports - File system-related module
 from pathlib import Path
 
+# Standard library imports - Type-related modules
+from typing import (
+    Callable,
+    NamedTuple,
+    Optional
+)
+
+# Third-party imports - Optional accelerated JSON encoder (falls back to `json`)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Third-party imports - Optional linear-time (DFA) regex engine (falls back to `re`)
+try:
+    import re2
+except ImportError:
+    re2 = None
+
 # Duplicate import removed: `json` was imported twice
 
 # Ensure the current directory is added to sys.path
-sys.path.insert(0, str(Path(__file__).resolve().parent))
+_HERE_DIR = str(Path(__file__).resolve().parent)  # Resolved once for both the check and the insert
+if _HERE_DIR not in sys.path:
+    sys.path.insert(0, _HERE_DIR)  # Insert once; every lib module shares this directory
 
 # Import category from system_variables
 from lib.system_variables import (
@@ -27,27 +49,73 @@ from lib.system_variables import (
     category
 )
 
-from . import (
-    log_utils
+# Types `safe_serialize()` hands to the JSON encoder (everything else takes the fallback path)
+_JSON_NATIVE_TYPES = (dict, list, tuple, str, int, float, bool, set, type(None))
+_JSON_NATIVE = frozenset(_JSON_NATIVE_TYPES)
+
+# Pre-rendered JSON for singleton scalars (fast path in `safe_serialize()`)
+_SCALAR_JSON = {None: "null", True: "true", False: "false"}
+
+# Comment pattern for `sanitize_token_string()` (lines mixing `#` and quotes)
+_COMMENT = (re2 or re).compile(  # No backtracking under re2, however quote-heavy the line
+    r'''((?:[^#'"]|'(?:\\.|[^'\\])*'|"(?:\\.|[^"\\])*")*)#'''
 )
 
+def json_dumps(
+    data: any,
+    indent: int = None,
+    default: Callable = None
+) -> str:
+
+    # orjson only supports 2-space indentation, so indented output stays with `json`
+    if orjson is not None and indent is None:
+        try:
+            return orjson.dumps(
+                data,
+                default=default,
+                option=orjson.OPT_NON_STR_KEYS
+            ).decode("utf-8")
+        except TypeError:
+            pass  # Let `json` decide (and raise) on anything orjson rejects
+    return json.dumps(
+        data,
+        indent=indent,
+        separators=None if indent else (",", ":"),
+        default=default,
+        ensure_ascii=False
+    )
+
+class SerializeResult(NamedTuple):
+
+    # One tuple allocation per call instead of a fresh dict hash table
+    success: bool
+    serialized: str
+    type: str
+    error: Optional[str] = None
+
 def safe_serialize(
     data: any,
     configs: dict,
     verbose: bool = False
-) -> dict:
+) -> SerializeResult:
 
     try:
-        json_dumps = json.dumps(
+        # Fast path: scalars have a fixed JSON spelling, so the encoder is skipped entirely
+        data_type = type(data)
+        if data is None or data_type is bool:
+            return SerializeResult(True, _SCALAR_JSON[data], data_type.__name__)
+        if data_type is int or (data_type is float and math.isfinite(data)):
+            return SerializeResult(True, repr(data), data_type.__name__)
+        # Route complex objects to the fallback path before paying for a serialization
+        # Exact built-in types hit the frozenset; subclasses (e.g. OrderedDict) still pass via isinstance
+        if data_type not in _JSON_NATIVE and not isinstance(data, _JSON_NATIVE_TYPES):
+            raise TypeError("Object is not JSON serializable")
+        serialized = json_dumps(
             data,
             indent=default_indent if verbose else None,
-            default=str,
-            ensure_ascii=False
+            default=str
         )
-        # Ensure that complex objects aren't falsely marked as serializable
-        if isinstance(data, object) and not isinstance(data, (dict, list, tuple, str, int, float, bool, set, type(None))):
-            raise TypeError("Object is not JSON serializable")
-        serialized_data = {"success": True, "serialized": json_dumps, "type": type(data).__name__}
+        serialized_data = SerializeResult(True, serialized, data_type.__name__)
         # log_utils.log_message(
         #     f'\nSerialized Data: {serialized_data}',
         #     log_category=category.debug.id,
@@ -56,46 +124,45 @@ def safe_serialize(
         return serialized_data
     except (TypeError, ValueError) as e:
         # Handle objects with attributes (custom classes)
-        if hasattr(data, "__dict__"):
-            serialized_attrs = {k: str(v) for k, v in vars(data).items()}
-            serialized_data = {
-                "success": False,
-                "serialized": json.dumps(
+        attributes = getattr(data, "__dict__", None)  # Single probe, reused below
+        if attributes is not None:
+            serialized_attrs = {k: str(v) for k, v in attributes.items()}
+            serialized_data = SerializeResult(
+                success=False,
+                serialized=json_dumps(
                     serialized_attrs,
-                    indent=default_indent if verbose else None,
-                    ensure_ascii=False
+                    indent=default_indent if verbose else None
                 ),
-                "type": type(data).__name__,
-                "error": str(e)
-            }
+                type=type(data).__name__,
+                error=str(e)
+            )
         # Handle iterators (list, tuple, set)
-        elif hasattr(data, "__iter__") and not isinstance(data, (str, bytes, dict)):
+        elif getattr(data, "__iter__", None) is not None and not isinstance(data, (str, bytes, dict)):
             try:
-                serialized_data = {
-                    "success": False,
-                    "serialized": json.dumps(
+                serialized_data = SerializeResult(
+                    success=False,
+                    serialized=json_dumps(
                         list(data),
-                        indent=default_indent if verbose else None,
-                        ensure_ascii=False
+                        indent=default_indent if verbose else None
                     ),
-                    "type": "iterator",
-                    "error": "Converted from iterator"
-                }
+                    type="iterator",
+                    error="Converted from iterator"
+                )
             except Exception as iter_error:
-                serialized_data = {
-                    "success": False,
-                    "serialized": "[Unserializable iterator]",
-                    "type": "iterator",
-                    "error": str(iter_error)
-                }
+                serialized_data = SerializeResult(
+                    success=False,
+                    serialized="[Unserializable iterator]",
+                    type="iterator",
+                    error=str(iter_error)
+                )
         # Default fallback for completely non-serializable objects
         else:
-            serialized_data = {
-                "success": False,
-                "serialized": "[Unserializable data]",
-                "type": type(data).__name__,
-                "error": str(e)
-            }
+            serialized_data = SerializeResult(
+                success=False,
+                serialized="[Unserializable data]",
+                type=type(data).__name__,
+                error=str(e)
+            )
         # log_utils.log_message(
         #     f'\nSerialized Data: {serialized_data}',
         #     log_category=category.debug.id,
@@ -103,6 +170,7 @@ def safe_serialize(
         # )
         return serialized_data
 
+@lru_cache(maxsize=4096)  # Hot source lines (loops, repeated call sites) skip re-parsing
 def sanitize_token_string(line: str) -> str:
 
     # # Legacy code:
@@ -123,22 +191,19 @@ def sanitize_token_string(line: str) -> str:
     # except Exception:
     #     return line.strip()  # Ensure fallback trims spaces
 
-    try:
-        tokens = tokenize.generate_tokens(StringIO(line).readline)
-        new_line = []
-        last_token_was_name = False  # Track if the last token was an identifier or keyword
-
-        for token in tokens:
-            if token.type == tokenize.COMMENT:
-                break  # Stop at the first comment outside of strings
-            if last_token_was_name and token.type in (tokenize.NAME, tokenize.NUMBER):
-                new_line.append(" ")  # Add space between concatenated names/numbers
-            new_line.append(token.string)
-            last_token_was_name = token.type in (tokenize.NAME, tokenize.NUMBER)
-
-        return "".join(new_line).strip()  # Trim spaces/tabs/newlines
-    except Exception:
-        return line.strip()  # Ensure fallback trims spaces
+    # Fast path: no `#` means there is no comment to remove
+    if '#' not in line:
+        return line.strip()
+
+    # No quotes means the first `#` cannot sit inside a string literal
+    if '"' not in line and "'" not in line:
+        return line[:line.index('#')].strip()
+
+    # Skip over complete string literals; a match ends at the first `#` outside of them
+    match = _COMMENT.match(line)
+    if match is not None:
+        return match.group(1).strip()
+    return line.strip()  # Every `#` sits inside a string literal
 
 # Load documentation dynamically and apply module, function and objects docstrings
 from lib.pydoc_loader import load_pydocs
@@ -4,12 +4,18 @@
 __version__ = "0.1.0"  ## Package version
 
 # Standard library imports - Core system module
+import builtins
+import os
 import sys
 
 # Standard library imports - Utility modules
-import json
-import inspect
+import json  # Spells non-string dict keys exactly as the JSON encoder does
+import linecache
 import logging
+import threading
+
+# Standard library imports - Function tools
+from functools import lru_cache
 
 # Standard library imports - Type-related modules
 from types import FrameType
@@ -19,7 +25,9 @@ from typing import Callable
 from pathlib import Path
 
 # Ensure the current directory is added to sys.path
-sys.path.insert(0, str(Path(__file__).resolve().parent))
+_HERE_DIR = str(Path(__file__).resolve().parent)  # Resolved once for both the check and the insert
+if _HERE_DIR not in sys.path:
+    sys.path.insert(0, _HERE_DIR)  # Insert once; every lib module shares this directory
 
 from . import (
     log_utils,
@@ -29,9 +37,108 @@ from . import (
 
 # Import category from system_variables
 from lib.system_variables import (
+    project_root,
     category
 )
 
+# JSON-native scalars passed through unchanged by `_coerce()`
+_JSON_SCALARS = (str, int, float, bool, type(None))
+# Exact scalar types `return_events()` logs as-is (subclasses such as enums still expose their attributes)
+_RETURN_SCALARS = frozenset(_JSON_SCALARS)
+# PEP 669 event monitoring (Python 3.12+); `None` falls back to `sys.setprofile()`
+_MONITORING = getattr(sys, "monitoring", None)
+_MONITORING_TOOL = "appflow_tracer"  # Name registered for the profiler tool id
+# Identifies this module's own frames on the stack (see `_excluded_codes()`)
+_MODULE_GLOBALS = globals()
+
+def _coerce_key(
+    key: object
+) -> str:
+
+    # `default=str` never applies to keys: json spells scalar keys as JSON (True -> "true", None -> "null")
+    # and rejects every other key type, so the same is done here
+    if isinstance(key, str):
+        return key
+    if key is None or isinstance(key, (int, float)):
+        return json.dumps(key)
+    raise TypeError(f"keys must be str, int, float, bool or None, not {type(key).__name__}")
+
+def _coerce(
+    value: object,
+    active: set = None
+) -> object:
+
+    # Same result as `json.loads(json.dumps(value, default=str))`, built in a single pass
+    if isinstance(value, _JSON_SCALARS):
+        return value
+    if isinstance(value, (dict, list, tuple)):
+        active = active if active is not None else set()
+        if id(value) in active:
+            raise ValueError("Circular reference detected")
+        active.add(id(value))
+        if isinstance(value, dict):
+            coerced = {
+                (key if isinstance(key, str) else _coerce_key(key)): _coerce(item, active)
+                for key, item in value.items()
+            }
+        else:
+            coerced = [_coerce(item, active) for item in value]
+        active.discard(id(value))
+        return coerced
+    return str(value)
+
+@lru_cache(maxsize=2048)  # A traced run only touches a handful of distinct source files
+def _relative_name(
+    filename: str
+) -> str:
+
+    # Resolve each file once and intern it so every trace message shares a single string object
+    return sys.intern(file_utils.relative_path(filename))
+
+@lru_cache(maxsize=8192)  # Hot call sites resolve the same (filename, lineno) repeatedly
+def _frame_context(
+    filename: str,
+    lineno: int
+) -> tuple:
+
+    # Replaces `inspect.getframeinfo()`: no FrameInfo allocation, path resolution, or source lookup per event
+    # The line is sanitized here too, so a repeated call site costs a single cache lookup per event
+    source_line = serialize_utils.sanitize_token_string(linecache.getline(filename, lineno) or "Unknown")
+    return _relative_name(filename), source_line
+
+def _excluded_codes() -> frozenset:
+
+    # The tracer's own logging/serialization helpers plus every `logging.Handler.emit()` override
+    functions = [
+        log_utils.log_message,
+        serialize_utils.safe_serialize,
+        serialize_utils.sanitize_token_string,
+        builtins.print  # The logger-backed replacement installed by `setup_logging()` (the C builtin has no code)
+    ]
+    handlers = [logging.Handler]
+    while handlers:
+        handler = handlers.pop()
+        handlers.extend(handler.__subclasses__())
+        functions.append(handler.__dict__.get("emit"))
+    codes = set()
+    for function in functions:
+        # Follow `__wrapped__` (e.g., `lru_cache`) without importing `inspect` just for `inspect.unwrap()`
+        while getattr(function, "__wrapped__", None) is not None:
+            function = function.__wrapped__
+        code = getattr(function, "__code__", None)
+        if code is not None:
+            codes.add(code)
+    # Frames already on the stack when tracing starts still report their returns: skip this module's
+    # own frames (`start_tracing()`, `monitor_events()`) and the caller that installed the tracer
+    # (e.g. `tracing.setup_logging()`, whose return value is the whole CONFIGS dict)
+    frame = sys._getframe(1)
+    while frame is not None:
+        codes.add(frame.f_code)
+        if frame.f_globals is not _MODULE_GLOBALS:
+            break
+        frame = frame.f_back
+    return frozenset(codes)
+
 def start_tracing(
     logger: logging.Logger = None,
     configs: dict = None
@@ -51,16 +158,102 @@ def start_tracing(
     # print(f'Trace All result: {trace_all(configs)}')
     # print(f'Trace All type: {type(trace_all(configs))}')
 
-    if configs["tracing"].get("enable", True) and sys.gettrace() is None:  # Prevent multiple traces
+    if configs["tracing"].get("enable", True) and not tracing_active():  # Prevent multiple traces
         trace_func = trace_all(logger=logger, configs=configs)
         if trace_func is None:
             print("Trace function is None, skipping tracing.")
             return
         # sys.settrace(lambda frame, event, arg: trace_all(configs)(frame, event, arg))
-        sys.settrace(lambda frame, event, arg: trace_func(frame, event, arg))
+        if _MONITORING is not None and _MONITORING.get_tool(_MONITORING.PROFILER_ID) is None:
+            # Non-project code objects are switched off in C after their first event
+            monitor_events(trace_func)
+        else:
+            # Profile hooks fire only on call/return (no per-line events) and need no wrapper lambda
+            sys.setprofile(trace_func)
     # message = f'Start Tracing invoked!'
     # log_utils.log_message(message, category.calls.id, configs=configs)
 
+def tracing_active() -> bool:
+
+    # Either backend counts: a profile hook on this thread or this tracer's monitoring tool
+    if sys.getprofile() is not None:
+        return True
+    return _MONITORING is not None and _MONITORING.get_tool(_MONITORING.PROFILER_ID) == _MONITORING_TOOL
+
+def stop_tracing() -> None:
+
+    # Unlike `sys.setprofile(None)`, monitoring tools stay registered until explicitly freed
+    sys.setprofile(None)
+    if _MONITORING is not None and _MONITORING.get_tool(_MONITORING.PROFILER_ID) == _MONITORING_TOOL:
+        _MONITORING.set_events(_MONITORING.PROFILER_ID, 0)
+        _MONITORING.free_tool_id(_MONITORING.PROFILER_ID)
+
+def monitor_events(
+    trace_func: Callable
+) -> None:
+
+    tool_id = _MONITORING.PROFILER_ID
+    events = _MONITORING.events
+    disable = _MONITORING.DISABLE
+    get_frame = sys._getframe
+    get_ident = threading.get_ident
+    # Profile hooks only see the installing thread; monitoring callbacks fire on every thread
+    thread_id = get_ident()
+    call_event = category.calls.id.lower()
+    return_event = category.returns.id.lower()
+    # Same static filters as `trace_events()`: both depend only on the code object
+    excluded_codes = _excluded_codes()
+    project_prefix = f'{project_root}{os.sep}'
+    is_project_file = file_utils.is_project_file
+    isabs = os.path.isabs
+
+    def traced(code) -> bool:
+        # Prefix test first; unresolved paths (e.g. a symlinked checkout) fall back to the cached resolve
+        if code in excluded_codes:
+            return False
+        filename = code.co_filename
+        if filename.startswith(project_prefix):
+            return True
+        # Pseudo-files (`<frozen os>`, `<string>`) are relative and would resolve under the working directory
+        return isabs(filename) and is_project_file(filename)
+
+    def on_call(code, offset):
+        # PY_START / PY_RESUME: returning DISABLE turns this code location off for the rest of the run
+        if not traced(code):
+            return disable
+        if get_ident() == thread_id:
+            trace_func(get_frame(1), call_event, None)  # Frame 1 is the monitored function itself
+
+    def on_return(code, offset, retval):
+        # PY_RETURN / PY_YIELD
+        if not traced(code):
+            return disable
+        if get_ident() == thread_id:
+            trace_func(get_frame(1), return_event, retval)
+
+    def on_throw(code, offset, exception):
+        # PY_THROW (generator resumed by `throw()`): a non-local event that cannot be disabled
+        if get_ident() == thread_id and traced(code):
+            trace_func(get_frame(1), call_event, exception)  # Profile hooks pass the thrown exception too
+
+    def on_unwind(code, offset, exception):
+        # PY_UNWIND (exit by exception): reported like the profile hook's `return` with no value
+        if get_ident() == thread_id and traced(code):
+            trace_func(get_frame(1), return_event, None)
+
+    _MONITORING.use_tool_id(tool_id, _MONITORING_TOOL)
+    callbacks = {
+        events.PY_START: on_call,
+        events.PY_RESUME: on_call,
+        events.PY_THROW: on_throw,
+        events.PY_RETURN: on_return,
+        events.PY_YIELD: on_return,
+        events.PY_UNWIND: on_unwind
+    }
+    for event, callback in callbacks.items():
+        _MONITORING.register_callback(tool_id, event, callback)
+    _MONITORING.set_events(tool_id, sum(callbacks))
+
 def trace_all(
     logger: logging.Logger,
     configs: dict
@@ -75,6 +268,21 @@ def trace_all(
     # Ensure the logger is properly initialized
     # global logger
 
+    # Loop-invariant values resolved once per tracer instead of on every event
+    call_event = category.calls.id.lower()
+    return_event = category.returns.id.lower()
+    # Event toggles are fixed once logging is configured, so they are read once per tracer
+    events = configs.get("events", {})
+    print_call = events.get(call_event, False)
+    print_return = events.get(return_event, False)
+    # Define functions to be ignored (matched by code-object identity, not by name)
+    excluded_codes = _excluded_codes()
+    # Project files all live under this (resolved) directory prefix
+    project_prefix = f'{project_root}{os.sep}'
+    # Closure locals survive module-global teardown at interpreter shutdown (late profile events)
+    isabs = os.path.isabs
+    is_project_file = file_utils.is_project_file
+
     def trace_events(
         frame: FrameType,
         event: str,
@@ -83,11 +291,23 @@ def trace_all(
 
         # print(f'\nTracing activated in {__name__}\n')
 
-        # Define functions to be ignored
-        excluded_functions = {"emit", "log_utils.log_message"}
-        if frame.f_code.co_name in excluded_functions:
+        # Profile hooks also report C-function events (c_call, c_return, c_exception)
+        if event != call_event and event != return_event:
+            return None
+
+        code = frame.f_code  # Bound once; every check below reads from the code object
+        if code in excluded_codes:
             return  # Skip tracing these functions
 
+        # Cheapest possible reject: most frames (stdlib, site-packages) live outside the project root
+        # (unresolved absolute paths, e.g. a symlinked checkout, fall back to the cached resolve;
+        # pseudo-files like `<frozen os>` are relative and would resolve under the working directory)
+        filename = code.co_filename
+        if not filename.startswith(project_prefix) and not (
+            isabs(filename) and is_project_file(filename)
+        ):
+            return None
+
         # # Excluding non-project specific sources
         # filename = frame.f_globals.get("__file__", "")
         # if not file_utils.is_project_file(filename):
@@ -95,12 +315,8 @@ def trace_all(
         #     return None  # Stop tracing for non-project files
 
         try:
-            # Excluding non-project specific sources
-            filename = frame.f_globals.get("__file__", "")
-            if not filename:
-                # If filename is None or an empty string, skip further processing
-                return None
-            if not file_utils.is_project_file(filename):
+            # Excluding non-project specific sources (the code object's filename needs no `f_globals` lookup)
+            if not is_project_file(filename):
                 # print(f'Excluding: {filename}')
                 return None  # Stop tracing for non-project files
             # Additional logic can follow here, like calling file_utils.is_project_file(filename)
@@ -115,15 +331,17 @@ def trace_all(
         # print( f'\nArg: {arg}' )
         # print( f'Configs: {configs}\n' )
 
-        if event == category.calls.id.lower():
-            call_events(
-                logger=logger,
-                frame=frame,
-                filename=filename,
-                arg=arg,
-                configs=configs
-            )
-        elif event == category.returns.id.lower():
+        # Disabled events never reach the handlers (no call, no `configs` lookups)
+        if event == call_event:
+            if print_call:
+                call_events(
+                    logger=logger,
+                    frame=frame,
+                    filename=filename,
+                    arg=arg,
+                    configs=configs
+                )
+        elif print_return:
             return_events(
                 logger=logger,
                 frame=frame,
@@ -132,7 +350,7 @@ def trace_all(
                 configs=configs
             )
 
-        return trace_events  # trace_events function (Continue tracing)
+        return None  # Profile hooks ignore the return value (no local trace function)
 
     return trace_events      # trace_all function (Return Function)
 
@@ -148,43 +366,47 @@ def call_events(
 
         log_category = category.calls.id
         print_event = configs["events"].get(category.calls.id.lower(), False)
+        if not print_event:
+            return  # Event category disabled: skip frame inspection and serialization entirely
         message = ""  # Initialize message early
 
+        code = frame.f_code
         caller_frame = frame.f_back  # Get caller frame
         if caller_frame:
 
-            caller_info = inspect.getframeinfo(caller_frame)
-            caller_filename = file_utils.relative_path(caller_info.filename)  # Convert absolute path to relative
-            invoking_line = caller_info.code_context[0] if caller_info.code_context else "Unknown"
-            invoking_line = serialize_utils.sanitize_token_string(invoking_line)
+            caller_code = caller_frame.f_code
+            caller_lineno = caller_frame.f_lineno
+            caller_filename, invoking_line = _frame_context(caller_code.co_filename, caller_lineno)  # Sanitized
             # {file_utils.relative_path(filename)} ({frame.f_code.co_name})[{frame.f_code.co_firstlineno}]"
 
-            message = f'\n[{log_category}] {caller_filename} ( {invoking_line} )'.strip()
-            if print_event:
-                log_utils.log_message(message, log_category, configs=configs)
+            # Messages are only assembled once `print_event` is known to be enabled (see early return)
+            message = f'[{log_category}] {caller_filename} ( {invoking_line} )'
+            log_utils.log_message(message, log_category, configs=configs)
 
-            if caller_frame.f_code.co_name == "<module>":
-                caller_lineno = caller_info.lineno
-                caller_module = caller_filename if "/" not in caller_filename else caller_filename.split("/")[-1]
-                message  = f'[{log_category}] {caller_module}[{caller_lineno}] ( {invoking_line} ) '
-                message += f'-> {file_utils.relative_path(filename)} ({frame.f_code.co_name})[{frame.f_code.co_firstlineno}]'
-                if print_event:
-                    log_utils.log_message(message.strip(), log_category, configs=configs)
+            if caller_code.co_name == "<module>":
+                caller_module = os.path.basename(caller_filename)  # No list allocation; unchanged when there is no separator
+                message = (
+                    f'[{log_category}] {caller_module}[{caller_lineno}] ( {invoking_line} ) '
+                    f'-> {_relative_name(filename)} ({code.co_name})[{code.co_firstlineno}]'
+                )
+                log_utils.log_message(message, log_category, configs=configs)
 
             else:
-                caller_co_name = caller_frame.f_code.co_name
-                callee_info = inspect.getframeinfo(frame)
-                arg_values = inspect.getargvalues(frame)
-                arg_list = {arg: arg_values.locals[arg] for arg in arg_values.args}
-                message  = f'[{log_category}] {caller_filename} ({caller_co_name})[{caller_info.lineno}] '
-                message += f'-> {file_utils.relative_path(callee_info.filename)} ({frame.f_code.co_name})[{callee_info.lineno}]'
-                # Fix: Ensure JSON serialization before passing data
+                caller_co_name = caller_code.co_name
+                callee_filename = _relative_name(code.co_filename)  # The callee's source line is never displayed
+                # Direct equivalent of `inspect.getargvalues(frame)`: named (positional + keyword-only) parameters
+                arg_names = code.co_varnames[:code.co_argcount + code.co_kwonlyargcount]
+                frame_locals = frame.f_locals
+                message = (
+                    f'[{log_category}] {caller_filename} ({caller_co_name})[{caller_lineno}] '
+                    f'-> {callee_filename} ({code.co_name})[{frame.f_lineno}]'
+                )
+                # Fix: Ensure JSON-compatible data before passing it on (no encode/decode round-trip)
                 try:
-                    arg_list = json.loads(json.dumps({arg: arg_values.locals[arg] for arg in arg_values.args}, default=str))
+                    arg_list = {arg: _coerce(frame_locals[arg]) for arg in arg_names}
                 except (TypeError, ValueError):
                     arg_list = "[Unserializable data]"
-                if print_event:
-                    log_utils.log_message(message.strip(), log_category, json_data=arg_list, configs=configs)
+                log_utils.log_message(message, log_category, json_data=arg_list, configs=configs)
 
     except Exception as e:
         logger.error(f'Error in trace_all: {e}')
@@ -201,11 +423,14 @@ def return_events(
 
         log_category = category.returns.id
         print_event = configs["events"].get(category.returns.id.lower(), False)
+        if not print_event:
+            return  # Event category disabled: skip frame inspection and serialization entirely
         message = ""  # Initialize message early
 
-        return_filename = file_utils.relative_path(filename)
+        code = frame.f_code
         return_lineno = frame.f_lineno
-        return_type = type(arg).__name__
+        # Relative filename and sanitized source line of the returning location (cached per call site)
+        return_filename, return_line = _frame_context(code.co_filename, return_lineno)
 
         # Inspecting return_value (dict)
         # {
@@ -214,54 +439,34 @@ def return_events(
         #     "type": type
         # }
         # return_value = serialize_utils.safe_serialize(arg)  # Ensure JSON serializability
-        serialized_result = serialize_utils.safe_serialize(
-            data=arg,
-            configs=configs
-        )
-        if serialized_result["success"]:
-            return_value = serialized_result["serialized"]  # Use the properly serialized string
-        else:
-            return_value = f'[Unserializable: {serialized_result["type"]}] Error: {serialized_result.get("error", "Unknown")}'
+        # Not serialized here: `return_value` is derived from `arg` below and serialized once by `log_message()`
         # message  = f'\n[RETURN] {return_filename}[{return_lineno}] '
         # message += f'-> RETURN VALUE (Type: {return_type}): {return_value}'
         # , "RETURN", configs=configs)
 
         # Get the returning module/function name
-        if frame.f_code.co_name == "<module>":
-            return_filename = file_utils.relative_path(frame.f_globals.get("__file__", ""))
+        if code.co_name == "<module>":
             return_co_name = return_filename  # Use filename instead of <module>
         else:
-            return_co_name = frame.f_code.co_name
-
-        # Capture the exact line of code causing the return
-        return_info = inspect.getframeinfo(frame)
-        return_lineno = return_info.lineno
-        # Extract the actual return statement (if available)
-        return_line = return_info.code_context[0] if return_info.code_context else "Unknown"
-        return_line = serialize_utils.sanitize_token_string(return_line)  # Clean up comments and spaces
+            return_co_name = code.co_name
 
         # Print the type of the return value and inspect its structure
-        arg_type = type(arg).__name__
-        # If it's an argparse.Namespace or other complex object, print its full structure
-        # Check if it's a complex object (e.g., argparse.Namespace)
-        if hasattr(arg, "__dict__"):
-            return_value = vars(arg)  # Convert Namespace or similar object to a dictionary
-        elif arg is None:  # Correct way to check for NoneType
-            return_value = None
-        elif isinstance(arg, bool):  # Ensures booleans remain as True/False
-            return_value = arg  # Keep as boolean
-            # print(f'Return Value (Boolean): {return_value}')
+        arg_type = type(arg)
+        # Common scalar returns (None, bool, int, float, str) are kept as-is without probing for attributes
+        if arg_type in _RETURN_SCALARS:
+            return_value = arg
         else:
-            return_value = arg  # Keep original
+            # If it's an argparse.Namespace or other complex object, print its full structure
+            attributes = getattr(arg, "__dict__", None)  # Single probe instead of hasattr() + vars()
+            return_value = arg if attributes is None else attributes
 
-        message  = f'[{log_category}] {return_filename}[{return_lineno}] ( {return_line} ) '
-        if return_value in [None, "null", ""] or isinstance(return_value, bool):
-            message += f'-> {arg_type}: {return_value}'
+        # Single f-string per message (only reached when `print_event` is enabled)
+        if return_value is None or arg_type is bool or (arg_type is str and return_value in ("null", "")):
+            message = f'[{log_category}] {return_filename}[{return_lineno}] ( {return_line} ) -> {arg_type.__name__}: {return_value}'.rstrip()
         else:
-            message += f'-> {arg_type}:'
+            message = f'[{log_category}] {return_filename}[{return_lineno}] ( {return_line} ) -> {arg_type.__name__}:'
 
-        if print_event:
-            log_utils.log_message(message.strip(), log_category, json_data=return_value, configs=configs)
+        log_utils.log_message(message, log_category, json_data=return_value, configs=configs)
 
     # except Exception:
     #     pass  # Ignore frames that cannot be inspected
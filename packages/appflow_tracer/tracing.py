@@ -4,18 +4,23 @@
 __version__ = "0.1.0"  ## Package version
 
 # Standard library imports - Core system module
+import os
 import sys
 
 # Standard library imports - Built-in utilities
+import atexit
 import builtins
+import copy
+import queue
 import warnings
 
 # Standard library imports - Utility modules
 import json
-import inspect
 import logging
+from logging.handlers import QueueHandler, QueueListener
 
 # Standard library imports - Date and time handling
+import time
 from datetime import datetime
 
 # Standard library imports - File system-related module
@@ -25,7 +30,8 @@ from pathlib import Path
 from typing import Optional, Union
 
 # Define base directories
-LIB_DIR = Path(__file__).resolve().parent.parent.parent / "lib"
+_HERE = Path(__file__).resolve()  # Resolved once; every path below derives from it
+LIB_DIR = _HERE.parent.parent.parent / "lib"
 if str(LIB_DIR) not in sys.path:
     sys.path.insert(0, str(LIB_DIR))  # Dynamically add `lib/` to sys.path only if not present
 
@@ -35,7 +41,9 @@ if str(LIB_DIR) not in sys.path:
 #     print(f'  - {path}')
 
 # Ensure the current directory is added to sys.path
-sys.path.insert(0, str(Path(__file__).resolve().parent))
+_HERE_DIR = str(_HERE.parent)
+if _HERE_DIR not in sys.path:
+    sys.path.insert(0, _HERE_DIR)  # Insert once; avoids duplicate search-path entries
 
 # Import system_variables from lib.system_variables
 from lib.system_variables import (
@@ -64,39 +72,38 @@ def setup_logging(
 ) -> Union[bool, dict]:
 
     # Ensure the variable exists globally
-    global LOGGING, CONFIGS, logger
-    try:
-        if not LOGGING:  # Check if logging has already been initialized
-            LOGGING = True  # Mark logging as initialized
-            # print(f'\nInitializing Setup Logging ... \n')
-    except NameError:
-        return False
+    global LOGGING, CONFIGS, logger, _log_info
+    # `LOGGING` is defined at module scope, so a plain assignment replaces the `NameError` guard
+    LOGGING = True  # Mark logging as initialized
     if logname_override:
         log_filename = logname_override
-    # Inspect the stack to find the caller’s module name or file
-    caller_frame = inspect.stack()[1]
-    # Determine the caller's module or file
-    caller_module = inspect.getmodule(caller_frame[0])
-    if caller_module and caller_module.__file__:
+    # Only the immediate caller is needed: `sys._getframe(1)` skips building FrameInfo for the whole stack
+    caller_frame = sys._getframe(1)
+    # Determine the caller's module or file (O(1) `sys.modules` lookup, no `inspect.getmodule()` scan)
+    caller_name = caller_frame.f_globals.get("__name__")
+    caller_module = sys.modules.get(caller_name) if caller_name else None
+    # Modules missing from `sys.modules` (or without `__file__`) fall back to the frame's own globals
+    caller_file = getattr(caller_module, "__file__", None) or caller_frame.f_globals.get("__file__")
+    # Resolved once; the log name and every path derived below reuse it
+    caller_path = Path(caller_file).resolve() if caller_file else None
+    if caller_path:
         # Extract the script/module name without extension
-        log_filename = Path(caller_module.__file__).stem
+        log_filename = caller_path.stem
     else:
         # Fallback if the name can’t be determined
         log_filename = "unknown"
     # Handle the case where __main__ is used
     if log_filename == "__main__":
         # Use the module that defines setup_logging as a fallback
-        current_frame = inspect.currentframe()
-        this_module = inspect.getmodule(current_frame)
-        if this_module and this_module.__file__:
-            log_filename = Path(this_module.__file__).stem
+        this_file = globals().get("__file__")  # This module's own file (no frame inspection needed)
+        if this_file:
+            log_filename = Path(this_file).stem
         else:
             # Fallback if the name can’t be determined
             log_filename = "default"
     absolute_path = None
     # Construct the full log path separately
-    if caller_module and caller_module.__file__:
-        caller_path = Path(caller_module.__file__).resolve()
+    if caller_path:
         absolute_path = caller_path.with_name(log_filename)
         if caller_path.is_relative_to(project_root):
             # If the caller is within project_root, construct a relative log path
@@ -112,8 +119,8 @@ def setup_logging(
     if configs:
         CONFIGS = configs
     else:
-        CONFIGS = pkgconfig.setup_configs(
-            absolute_path=Path(absolute_path),
+        CONFIGS = cached_configs(
+            absolute_path=absolute_path,  # Already a Path (derived from caller_path)
             logname_override=log_filename,
             events=events
         )
@@ -121,31 +128,47 @@ def setup_logging(
         raise ValueError("Configs must be a dictionary")
     # print( f'CONFIGS: {json.dumps(CONFIGS, indent=default_indent)}' )
     logfile = CONFIGS["logging"].get("log_filename", False)
-    logger = logging.getLogger(f'{CONFIGS["logging"]["package_name"]}.{CONFIGS["logging"]["module_name"]}')
+    logger_name = f'{CONFIGS["logging"]["package_name"]}.{CONFIGS["logging"]["module_name"]}'
+    logger = logging.getLogger(logger_name)
     logger.propagate = False  # Prevent handler duplication
     logger.setLevel(logging.DEBUG)
-    # Remove existing handlers before adding new ones (Prevents duplicate logging)
-    if logger.hasHandlers():
-        logger.handlers.clear()  # Ensure handlers are properly cleared before adding new ones
-    else:
-        # Use ANSIFileHandler as logfile handler
-        file_handler = ANSIFileHandler(logfile, mode='a')
-        logger.addHandler(file_handler)
-        # formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-        # file_handler.setFormatter(formatter)
-        # file_handler.setLevel(logging.DEBUG)
-        # Console handler (keeps ANSI color but ensures immediate output)
-        console_handler = PrintCapture()
-        logger.addHandler(console_handler)
-        # console_handler.setFormatter(formatter)
-        # console_handler.setLevel(logging.DEBUG)
+    # Bound once per setup so every redirected print skips the `logger` attribute lookups
+    _log_info = logger.info
+    # Same logger already writing to the same file (e.g., cached configs): keep its listener and open file
+    listener = LISTENERS.get(logger_name)
+    if listener is None or listener.handlers[0].baseFilename != os.path.abspath(logfile):
+        # Drain and stop this logger's previous listener (its handlers are about to be replaced)
+        stop_logging(logger_name)
+        # Remove existing handlers before adding new ones (Prevents duplicate logging)
+        if logger.hasHandlers():
+            logger.handlers.clear()  # Ensure handlers are properly cleared before adding new ones
+        else:
+            # Use ANSIFileHandler as logfile handler
+            file_handler = ANSIFileHandler(logfile, mode='a')
+            # formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+            # file_handler.setFormatter(formatter)
+            # file_handler.setLevel(logging.DEBUG)
+            # Console handler (keeps ANSI color but ensures immediate output)
+            console_handler = PrintCapture()
+            # console_handler.setFormatter(formatter)
+            # console_handler.setLevel(logging.DEBUG)
+            # Queue records on the caller thread; a background listener owns the real handlers
+            log_queue = queue.SimpleQueue()
+            logger.addHandler(QueueHandler(log_queue))
+            LISTENERS[logger_name] = FlushingQueueListener(
+                log_queue,
+                file_handler,
+                console_handler,
+                respect_handler_level=True
+            )
+            LISTENERS[logger_name].start()
     # Redirect print function statements to logger
-    builtins.print = lambda *args, **kwargs: logger.info(" ".join(str(arg) for arg in args))
+    # builtins.print = lambda *args, **kwargs: logger.info(" ".join(str(arg) for arg in args))
+    builtins.print = print_logged
     # if CONFIGS["logging"].get("enable", False):
     #     builtins.print = lambda *args, **kwargs: sys.__stdout__.write(" ".join(str(arg) for arg in args) + "\n")
-    # Ensure all logs are flushed immediately
-    sys.stdout.flush()
-    sys.stderr.flush()
+    # No explicit sys.stdout/sys.stderr flush: PrintCapture writes (and flushes) through the same
+    # `sys.__stdout__` buffer, so ordering holds, and the interpreter flushes both streams at exit
     # if not LOGGING:  # Check if logging has already been initialized
     if CONFIGS["tracing"].get("enable", True):
         try:
@@ -161,35 +184,151 @@ def setup_logging(
     file_utils.manage_logfiles(CONFIGS)
     return CONFIGS
 
+def stop_logging(
+    logger_name: Optional[str] = None
+) -> None:
+
+    # Stop a single logger's listener, or all of them when no name is given
+    names = [logger_name] if logger_name is not None else list(LISTENERS)
+    for name in names:
+        listener = LISTENERS.pop(name, None)
+        if listener is not None:
+            listener.stop()  # Blocks until every queued record has been handled
+            for handler in listener.handlers:
+                handler.close()  # Flushes any buffered records and releases the log file
+
+def cached_configs(
+    absolute_path: Path,
+    logname_override: Optional[Union[str, Path]] = None,
+    events: Optional[Union[bool, list, dict]] = None
+) -> dict:
+
+    # Repeated setup_logging() calls for the same module reuse the parsed configuration
+    # until its JSON file changes on disk (setup_configs() rewrites it, so the post-call mtime is stored)
+    config_file = absolute_path.with_name(f'{absolute_path.stem}.json')
+    cache_key = (str(absolute_path), str(logname_override), json.dumps(events, sort_keys=True))
+    try:
+        mtime = config_file.stat().st_mtime_ns
+    except OSError:
+        mtime = None
+    cached = CONFIG_CACHE.get(cache_key)
+    if cached is None or cached[0] != mtime:
+        config = pkgconfig.setup_configs(
+            absolute_path=absolute_path,
+            logname_override=logname_override,
+            events=events
+        )
+        try:
+            mtime = config_file.stat().st_mtime_ns
+        except OSError:
+            mtime = None
+        cached = CONFIG_CACHE[cache_key] = (mtime, config)
+    return copy.deepcopy(cached[1])  # Callers may mutate their configs
+
+def print_logged(
+    *args: object,
+    sep: Optional[str] = " ",
+    end: Optional[str] = "\n",
+    file: object = None,
+    flush: bool = False
+) -> None:
+
+    # Replacement for `builtins.print`: one frame per call (no lambda + generator expression)
+    _log_info((" " if sep is None else sep).join(map(str, args)))
+
 class PrintCapture(logging.StreamHandler):
 
+    # `logging.Handler` has no `__slots__` (instances keep a `__dict__`); this only stores the bound writers in slots
+    __slots__ = ("_stdout_write", "_stdout_flush")
+
+    def __init__(self, *args, **kwargs) -> None:
+
+        super().__init__(*args, **kwargs)
+        # Bound once per handler instead of resolving `sys.__stdout__.write` on every record
+        self._stdout_write = sys.__stdout__.write
+        self._stdout_flush = sys.__stdout__.flush
+
     # def emit(self, record):
     def emit(self, record: logging.LogRecord) -> None:
 
-        log_entry = self.format(record)
-        sys.__stdout__.write(log_entry + "\n")  # Write to actual stdout
-        sys.__stdout__.flush()  # Ensure immediate flushing
+        self._stdout_write(self.format(record) + "\n")  # Write to actual stdout
+        self._stdout_flush()  # Ensure immediate flushing
 
-    # def emit(self, record):
-    #     log_entry = self.format(record)
-    #     sys.__stdout__.write(log_entry + "\n")  # Write to actual stdout
-    #     sys.__stdout__.flush()  # Ensure immediate flushing
+    def flush(self) -> None:
+
+        # Flush the stream records are written to, not `self.stream` (stderr as of construction, possibly closed since)
+        self._stdout_flush()
 
 class ANSIFileHandler(logging.FileHandler):
 
+    __slots__ = ("_last_flush",)  # Time of the last flush kept in a slot (base handlers still carry a `__dict__`)
+    buffer_size = 65536  # Bytes buffered in memory before the stream issues a write()
+    flush_interval = 0.1  # Min seconds between flushes while records keep arriving
+    skip_suffix = os.path.join("logging", "__init__.py")  # Records raised from within the logging module itself
+
+    def __init__(self, *args, **kwargs) -> None:
+
+        self._last_flush = time.monotonic()
+        super().__init__(*args, **kwargs)
+
+    def _open(self):
+
+        # Open with a large buffer so many log records share a single write() syscall
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.buffer_size,
+            encoding=self.encoding,
+            errors=self.errors
+        )
+
     # def emit(self, record):
     def emit(self, record: logging.LogRecord) -> None:
 
-        # Ensure only Python's internal logging system is ignored
-        if "logging/__init__.py" in record.pathname:
+        # Ensure only Python's internal logging system is ignored (cheap module-name check first)
+        if record.module == "__init__" and record.pathname.endswith(self.skip_suffix):
             return  # Skip internal Python logging module logs
-        super().emit(record)  # Proceed with normal logging
+        if self.stream is None:
+            super().emit(record)  # FileHandler opens a delayed stream (and flushes this first record)
+            return
+        # StreamHandler.emit() without its per-record flush: records written within
+        # `flush_interval` of the last flush are coalesced into one write()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if time.monotonic() - self._last_flush >= self.flush_interval:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+
+        super().flush()  # Write out the buffered records
+        self._last_flush = time.monotonic()
+
+class FlushingQueueListener(QueueListener):
+
+    def handle(self, record: logging.LogRecord) -> None:
+
+        super().handle(record)
+        # Queue drained: the burst is over, so write out what the handlers still buffer
+        # (bounds how long the last records of a burst wait in `ANSIFileHandler`'s buffer)
+        if self.queue.empty():
+            for handler in self.handlers:
+                handler.flush()
 
 # ---------- Module Global variables:
 
 LOGGING = None
 CONFIGS = None
 logger = None  # Global logger instance
+_log_info = None  # `logger.info` bound by setup_logging() for print_logged()
+LISTENERS = {}  # Background FlushingQueueListener (per logger name) writing log records
+CONFIG_CACHE = {}  # Parsed configs (with their JSON file mtime) keyed by module path, log name and events
+
+# Flush any queued log records before the interpreter exits
+atexit.register(stop_logging)
 
 # ---------- Module operations:
 
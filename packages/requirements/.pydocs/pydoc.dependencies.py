@@ -103,7 +103,7 @@ FUNCTION_DOCSTRINGS = {
 
     Behavior:
         - Parses command-line arguments.
-        - Loads package requirement definitions.
+        - Loads package requirement definitions via `package_utils.read_dependencies()`.
         - Detects the system's Python environment and applies installation policies.
         - Handles backup, restore, and migration operations.
         - Enforces policy-based dependency management.
@@ -6,14 +6,8 @@ __version__ = "0.1.0"  ## Package version
 # Standard library imports - Core system module
 import sys
 
-# Standard library imports - File system-related module
-from pathlib import Path
-
-# Ensure the current directory is added to sys.path
-sys.path.insert(0, str(Path(__file__).resolve().parent))
-
 # Import the main function from dependencies.py
-from packages.requirements.dependencies import main
+from .dependencies import main
 
 if __name__ == "__main__":
     main()
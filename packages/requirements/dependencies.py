@@ -29,7 +29,8 @@ from pathlib import Path
 from typing import Optional, Union
 
 # Define base directories
-LIB_DIR = Path(__file__).resolve().parent.parent.parent / "lib"
+_HERE = Path(__file__).resolve()  # Resolved once; every path below derives from it
+LIB_DIR = _HERE.parent.parent.parent / "lib"
 if str(LIB_DIR) not in sys.path:
     sys.path.insert(0, str(LIB_DIR))  # Dynamically add `lib/` to sys.path only if not present
 
@@ -39,7 +40,9 @@ if str(LIB_DIR) not in sys.path:
 #     print(f'  - {path}')
 
 # Ensure the current directory is added to sys.path
-sys.path.insert(0, str(Path(__file__).resolve().parent))
+_HERE_DIR = str(_HERE.parent)
+if _HERE_DIR not in sys.path:
+    sys.path.insert(0, _HERE_DIR)  # Insert once; avoids duplicate search-path entries
 
 from lib import system_variables as environment
 
@@ -125,8 +128,7 @@ def main() -> None:
         )
         sys.exit(1)
 
-    with location.open("r") as f:
-        CONFIGS["requirements"] = json.load(f).get("dependencies", [])
+    CONFIGS["requirements"] = list(package_utils.read_dependencies(location))
 
     log_utils.log_message(
         f'\nInitializing Package Dependencies Management process...',
@@ -62,13 +62,12 @@ FUNCTION_DOCSTRINGS = {
 
     Returns:
         - bool:
-          - True if Homebrew is installed and functional.
+          - True if the Homebrew binary is found on PATH.
           - False if Homebrew is unavailable or the system is not macOS.
 
     Behavior:
-        - Uses shutil.which() to detect the Brew binary.
-        - Runs 'brew --version' to verify Brew functionality.
-        - Uses an LRU cache to avoid redundant system calls.
+        - Uses shutil.which() to detect the Brew binary (no `brew` subprocess is started).
+        - Uses an LRU cache so the lookup runs once per process.
 
     Error Handling:
         - If Homebrew is missing, the function returns False.
@@ -124,7 +123,8 @@ FUNCTION_DOCSTRINGS = {
         - Optional[str]: The installed version of the package if found, otherwise None.
 
     Behavior:
-        - Runs 'brew list --versions <package>' and extracts the installed version.
+        - Returns the version collected by `prefetch_versions()` when available.
+        - Otherwise runs 'brew list --versions <package>' and extracts the installed version.
         - Returns None if the package is not installed via Homebrew.
 
     Error Handling:
@@ -142,15 +142,101 @@ FUNCTION_DOCSTRINGS = {
         - Optional[str]: The latest available version from Homebrew, otherwise None.
 
     Behavior:
-        - Runs 'brew info <package>' and extracts the stable version.
+        - Returns the version collected by `prefetch_versions()` when available.
+        - Otherwise runs 'brew info <package>' and extracts the stable version.
         - Uses regex to parse the latest version from Homebrew output.
 
     Error Handling:
         - If Brew command fails or package is missing, returns None.
     """,
+    "prefetch_versions": """
+    Function: prefetch_versions(packages: list) -> None
+    Description:
+        Collects latest (and installed) Homebrew versions for many packages in one Brew call.
+
+    Parameters:
+        - packages (list): The package names to query.
+
+    Returns:
+        - None: Results are stored in `LATEST_VERSIONS` and `INSTALLED_VERSIONS`.
+
+    Behavior:
+        - Skips names already in `LATEST_VERSIONS`; returns without running Brew when none are left.
+        - Runs 'brew info --json=v2 --formula <packages...>' and records each entry via `record_formula()`,
+          under both the requested name and the canonical name (see `formula_names()`).
+        - Installed versions come from the same entries' `installed` field (no 'brew list' run).
+
+    Error Handling:
+        - Brew rejects the whole `brew info` batch if any formula is unknown; each name not yet cached
+          is then queried on its own via `formula_available()`.
+        - Unexpected JSON leaves the latest versions to the per-package queries.
+        - Returns quietly when Brew is not installed.
+    """,
+    "formula_names": """
+    Function: formula_names(formula: dict) -> set
+    Description:
+        Lists every name Homebrew resolves to one `brew info --json=v2` formula entry.
+
+    Parameters:
+        - formula (dict): A single entry of the "formulae" array.
+
+    Returns:
+        - set: The canonical name, the full and tap-qualified names, aliases and former names.
+    """,
+    "record_formula": """
+    Function: record_formula(formula: dict, requested: Optional[str] = None) -> None
+    Description:
+        Stores the versions reported by one `brew info --json=v2` formula entry.
+
+    Parameters:
+        - formula (dict): A single entry of the "formulae" array.
+        - requested (Optional[str]): The name the formula was queried by (e.g. an alias or tap-qualified name).
+
+    Behavior:
+        - Records `versions.stable` in `LATEST_VERSIONS`.
+        - Records the last `installed[].version` in `INSTALLED_VERSIONS` when the formula is installed.
+        - Both are stored under the canonical `name` and, when given, the requested name.
+    """,
+    "formula_available": """
+    Function: formula_available(package: str) -> bool
+    Description:
+        Checks whether Homebrew provides a formula for the package.
+
+    Parameters:
+        - package (str): The name of the package to check.
+
+    Returns:
+        - bool: True if Homebrew knows the formula, otherwise False.
+
+    Behavior:
+        - Answers from `LATEST_VERSIONS` when the formula was already queried (a None entry is a known miss).
+        - Otherwise runs a single 'brew info --json=v2 --formula <package>' and records its versions.
+        - An unknown formula is recorded as None in `LATEST_VERSIONS`.
+
+    Error Handling:
+        - Returns False without caching if Brew is missing or returns unexpected JSON.
+    """,
+    "clear_versions": """
+    Function: clear_versions() -> None
+    Description:
+        Discards the versions collected by `prefetch_versions()`.
+
+    Behavior:
+        - Called after installations so that later lookups query Brew again.
+    """,
 }
 
 VARIABLE_DOCSTRINGS = {
+    "INSTALLED_VERSIONS": """
+    - Description: Installed Homebrew versions recorded from `brew info --json=v2` entries by `record_formula()`.
+    - Type: dict
+    - Usage: Checked by `version()` before running `brew list`.
+    """,
+    "LATEST_VERSIONS": """
+    - Description: Latest stable Homebrew versions collected by `prefetch_versions()` (None: unknown formula).
+    - Type: dict
+    - Usage: Checked by `latest_version()` before running `brew info`.
+    """,
     "LIB_DIR": """
     - Description: Defines the library directory path.
     - Type: Path
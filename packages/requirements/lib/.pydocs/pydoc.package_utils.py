@@ -35,6 +35,7 @@ Dependencies:
     - subprocess - Executes shell commands for package management.
     - shutil - Verifies presence of external utilities.
     - json - Handles structured dependency files.
+    - ijson (optional) - Streams dependency entries from large JSON files; `json` is used when unavailable.
     - importlib.metadata - Retrieves installed package versions.
     - functools.lru_cache - Caches function calls for efficiency.
     - pathlib - Ensures platform-independent file path resolution.
@@ -64,12 +65,48 @@ FUNCTION_DOCSTRINGS = {
         - None: Writes the package list to the specified file.
 
     Behavior:
-        - Runs 'pip freeze' to capture all installed packages.
+        - Builds the package list in-process with `freeze_packages()` (no 'pip freeze' subprocess).
         - Saves the package list to the specified file.
         - Logs the operation success or failure.
 
     Error Handling:
-        - Captures subprocess errors if the 'pip freeze' command fails.
+        - Logs a warning if the file cannot be written.
+    """,
+    "freeze_packages": """
+    Function: freeze_packages(all_packages: bool = False, direct_urls: bool = True) -> list
+    Description:
+        Lists installed Python packages as requirement lines, without spawning Pip.
+
+    Parameters:
+        - all_packages (bool): Also list pip, setuptools, wheel and distribute (like 'pip freeze --all').
+        - direct_urls (bool): Render PEP 610 `direct_url.json` origins (editable and URL installs).
+
+    Returns:
+        - list: Sorted requirement lines. The defaults match 'pip freeze';
+          `all_packages=True, direct_urls=False` matches 'pip list --format=freeze'.
+
+    Behavior:
+        - Walks `importlib.metadata.distributions()` once, keeping the first match on sys.path.
+        - Keeps each project's original name (`Name` metadata), as Pip prints it.
+        - Skips the same packages 'pip freeze' omits by default (pip, and on Python < 3.12 setuptools, wheel and distribute).
+        - Formats each line with `freeze_line()`.
+    """,
+    "freeze_line": """
+    Function: freeze_line(name: str, version: str, direct_url: Optional[str] = None) -> str
+    Description:
+        Formats one installed distribution the way 'pip freeze' does.
+
+    Parameters:
+        - name (str): The project name as recorded in the distribution metadata.
+        - version (str): The installed version.
+        - direct_url (Optional[str]): The contents of the distribution's `direct_url.json` (PEP 610), if any.
+
+    Returns:
+        - str: "-e <url>" for editable installs, "name @ vcs+url@commit" for VCS installs,
+          "name @ url[#hash]" for other direct URLs, otherwise "name==version".
+
+    Error Handling:
+        - An unreadable `direct_url.json` falls back to "name==version".
     """,
     "install_package": """
     Function: install_package(package: str, version: Optional[str] = None, configs: dict = None) -> None
@@ -92,6 +129,46 @@ FUNCTION_DOCSTRINGS = {
     Error Handling:
         - Logs an error if installation fails due to system constraints.
         - Provides manual installation instructions when Pip installation is restricted.
+
+    Notes:
+        - Thin wrapper around `install_packages()` for a single package.
+    """,
+    "install_packages": """
+    Function: install_packages(packages: list, configs: dict) -> None
+    Description:
+        Installs several packages at once using Homebrew (if applicable) or Pip.
+
+    Parameters:
+        - packages (list): (package, version) pairs; a version of None means latest.
+        - configs (dict): Configuration dictionary for logging and system constraints.
+
+    Returns:
+        - None: Executes the installation process.
+
+    Behavior:
+        - Checks each package with `brew_utils.formula_available()` (answered from the prefetched
+          versions when possible) and installs every match with a single `brew install`.
+        - Installs all remaining packages with a single `pip install` via `pip_install()`.
+        - Uses '--break-system-packages' when forced in an externally managed environment.
+
+    Error Handling:
+        - Provides manual installation instructions when Pip installation is restricted.
+    """,
+    "pip_install": """
+    Function: pip_install(command: list, specs: list) -> None
+    Description:
+        Runs one Pip installation for a batch of requirement specifiers.
+
+    Parameters:
+        - command (list): The base `pip install` command and options.
+        - specs (list): Requirement specifiers such as "rich" or "typer==0.6.0".
+
+    Returns:
+        - None: Executes the installation process.
+
+    Behavior:
+        - Resolves and installs all specifiers in a single Pip run.
+        - If the batch fails, retries each specifier on its own so one bad spec does not block the rest.
     """,
     "install_requirements": """
     Function: install_requirements(configs: dict, bypass: bool = False) -> None
@@ -107,8 +184,10 @@ FUNCTION_DOCSTRINGS = {
 
     Behavior:
         - Evaluates package policies for installation, upgrade, or downgrade.
+        - Collects every pending package and installs them together via `install_packages()`.
         - Installs packages using Brew or Pip based on system constraints.
         - Logs installation steps and policy decisions.
+        - Clears the cached `version_utils.installed_index()` and Homebrew versions once all packages are processed.
 
     Error Handling:
         - Logs warnings for missing configurations or restricted environments.
@@ -140,9 +219,11 @@ FUNCTION_DOCSTRINGS = {
         - None: Executes the migration process.
 
     Behavior:
-        - Extracts installed packages using 'pip list'.
+        - Extracts every installed package (pip, setuptools and wheel included) as "name==version" lines
+          with `freeze_packages(all_packages=True, direct_urls=False)`, like 'pip list --format=freeze'.
         - Saves package names before re-installing them.
-        - Installs all packages in the new environment.
+        - Installs all packages in the new environment with a single `pip_install()` run.
+        - Clears the cached `version_utils.installed_index()` afterwards.
 
     Error Handling:
         - Logs errors if package retrieval or installation fails.
@@ -159,12 +240,30 @@ FUNCTION_DOCSTRINGS = {
         - None: Displays installed packages and their status.
 
     Behavior:
-        - Reads `installed.json` and logs package names and versions.
+        - Streams `installed.json` through `read_dependencies()` and logs each package as it is parsed.
         - Checks compliance against required versions.
 
     Error Handling:
         - Logs an error if `installed.json` is missing or corrupted.
     """,
+    "read_dependencies": """
+    Function: read_dependencies(file_path: Union[str, Path]) -> Iterator[dict]
+    Description:
+        Yields the entries of the "dependencies" list in a requirements or installed JSON file.
+
+    Parameters:
+        - file_path (Union[str, Path]): Path to `requirements.json` or `installed.json`.
+
+    Returns:
+        - Iterator[dict]: One dependency entry at a time.
+
+    Behavior:
+        - Streams entries with `ijson.items(f, "dependencies.item")` when `ijson` is installed.
+        - Otherwise loads the file with `json.load()` and yields its "dependencies" list.
+
+    Error Handling:
+        - Raises one of `JSON_ERRORS` if the file is not valid JSON.
+    """,
     "restore_packages": """
     Function: restore_packages(file_path: str, configs: dict) -> None
     Description:
@@ -180,6 +279,7 @@ FUNCTION_DOCSTRINGS = {
     Behavior:
         - Reads the package list and installs them using Pip.
         - Ensures compatibility with existing package versions.
+        - Clears the cached `version_utils.installed_index()` afterwards.
 
     Error Handling:
         - Logs errors if installation fails or if the backup file is missing.
@@ -196,7 +296,8 @@ FUNCTION_DOCSTRINGS = {
         - list: A list of reviewed package data including installation status.
 
     Behavior:
-        - Compares installed versions against required versions.
+        - Prefetches Homebrew versions in one batch when `INSTALL_METHOD` is "brew".
+        - Compares installed versions against required versions via `version_utils.compare_versions()`.
         - Determines whether a package is installed, outdated, or missing.
         - Writes updated package statuses to `installed.json`.
 
@@ -216,6 +317,11 @@ VARIABLE_DOCSTRINGS = {
     - Type: module
     - Usage: Provides access to configuration and logging utilities.
     """,
+    "JSON_ERRORS": """
+    - Description: Exception types raised while parsing a dependencies file, with or without `ijson`.
+    - Type: tuple
+    - Usage: Caught by `packages_installed()` to report an invalid `installed.json`.
+    """,
     "installed_filepath": """
     - Description: Stores the path to `installed.json`, tracking installed package statuses.
     - Type: Path
@@ -30,10 +30,12 @@ Dependencies:
     - sys - Handles system-level functions such as process termination.
     - subprocess - Executes shell commands for package management.
     - json - Handles structured dependency files.
+    - concurrent.futures - Resolves latest package versions concurrently.
     - importlib.metadata - Retrieves installed package versions.
     - functools.lru_cache - Caches function calls for efficiency.
     - pathlib - Ensures platform-independent file path resolution.
     - packages.appflow_tracer.lib.log_utils - Provides structured logging.
+    - brew_utils - Batches Homebrew version queries.
     - package_utils - Retrieves installed.json and manages package installation.
     - version_utils - Retrieves installed and latest package versions.
 
@@ -60,6 +62,10 @@ FUNCTION_DOCSTRINGS = {
         - list: The updated list of dependencies with policy-based statuses.
 
     Behavior:
+        - Prefetches Homebrew versions in one batch when `INSTALL_METHOD` is "brew".
+        - Prefetches the latest available version of every dependency in a thread pool (up to 16 workers),
+          after resolving `version_utils.pip_config_index()` once so the workers share its cached result.
+        - Compares versions with `version_utils.compare_versions()` rather than raw string ordering.
         - Analyzes installed packages and determines policy actions (install, upgrade, downgrade, or skip).
         - Updates `installed.json` with the latest package states.
         - Logs compliance decisions for debugging and tracking.
@@ -30,7 +30,9 @@ Dependencies:
     - sys - Handles system-level functions such as process termination.
     - subprocess - Executes shell commands for package management.
     - json - Handles structured dependency files.
-    - importlib.metadata - Retrieves installed package versions.
+    - urllib.request - Queries the PyPI JSON API for latest package versions.
+    - packaging.version (optional) - PEP 440 version comparison; numeric release tuples are used when unavailable.
+    - importlib.metadata - Retrieves installed package versions (scanned once and cached).
     - functools.lru_cache - Caches function calls for efficiency.
     - pathlib - Ensures platform-independent file path resolution.
     - packages.appflow_tracer.lib.log_utils - Provides structured logging.
@@ -77,10 +79,70 @@ FUNCTION_DOCSTRINGS = {
         - Optional[str]: The installed package version if found, otherwise None.
 
     Behavior:
-        - Uses multiple detection methods, prioritizing Pip before system-level package managers.
+        - Looks the package up in `installed_index()` (one cached scan of the Python environment).
+        - Returns None when the package is not an installed Python distribution
+          (the system-level package manager branches are not consulted).
         - Logs version evaluation details for debugging.
     """,
 
+    "installed_index": """
+    Function: installed_index() -> dict
+    Description:
+        Builds a lookup table of every installed Python distribution.
+
+    Returns:
+        - dict: Normalized package names mapped to their installed versions.
+
+    Behavior:
+        - Walks `importlib.metadata.distributions()` once instead of once per package.
+        - Cached with `lru_cache(maxsize=1)`; call `installed_index.cache_clear()` after installs.
+    """,
+
+    "version_key": """
+    Function: version_key(version: str) -> Optional[object]
+    Description:
+        Parses a version string into a comparable key.
+
+    Parameters:
+        - version (str): The version string to parse.
+
+    Returns:
+        - Optional[object]: A `packaging.version.Version`, or a tuple of release numbers when
+          `packaging` is not installed; None if the string cannot be parsed.
+
+    Behavior:
+        - Cached with `lru_cache`, so each version string is parsed only once per run.
+    """,
+
+    "compare_versions": """
+    Function: compare_versions(left: str, right: str) -> int
+    Description:
+        Compares two version strings numerically (e.g. "1.10" > "1.9", "10.0" > "9.0").
+
+    Parameters:
+        - left (str): The first version.
+        - right (str): The second version.
+
+    Returns:
+        - int: -1 if left < right, 0 if they are equal, 1 if left > right.
+
+    Behavior:
+        - Uses `version_key()` for both sides.
+        - Falls back to plain string ordering if either version cannot be parsed.
+    """,
+
+    "normalize_name": """
+    Function: normalize_name(package: str) -> str
+    Description:
+        Normalizes a package name according to PEP 503.
+
+    Parameters:
+        - package (str): The package name to normalize.
+
+    Returns:
+        - str: The lowercase name with runs of "-", "_" and "." collapsed to "-".
+    """,
+
     "pip_latest_version": """
     Function: pip_latest_version(package: str) -> Optional[str]
     Description:
@@ -93,10 +155,43 @@ FUNCTION_DOCSTRINGS = {
         - Optional[str]: The latest available version as a string if found, otherwise None.
 
     Behavior:
-        - Uses `pip index versions <package>` to retrieve the latest available version.
+        - Queries the PyPI JSON API first via `pypi_latest_version()`.
+        - Falls back to `pip index versions <package>` when offline, when the response is unusable,
+          or when pip is pointed at a custom index (`PIP_INDEX_URL` / `PIP_EXTRA_INDEX_URL`,
+          or an `index-url` / `extra-index-url` in pip's configuration, see `pip_config_index()`).
         - Requires internet access to fetch version information from PyPI.
     """,
 
+    "pip_config_index": """
+    Function: pip_config_index() -> bool
+    Description:
+        Checks whether pip's configuration files set a package index.
+
+    Returns:
+        - bool: True when `pip config list` reports an `index-url` or `extra-index-url`, otherwise False.
+
+    Behavior:
+        - Runs `pip config list` once; cached with `lru_cache(maxsize=1)`.
+        - Returns False when pip cannot be run or its configuration cannot be read.
+    """,
+
+    "pypi_latest_version": """
+    Function: pypi_latest_version(package: str) -> Optional[str]
+    Description:
+        Retrieves the latest released version of a package from the PyPI JSON API.
+
+    Parameters:
+        - package (str): The package name to check.
+
+    Returns:
+        - Optional[str]: The `info.version` field of `https://pypi.org/pypi/<package>/json`,
+          or None if PyPI reports the package as missing (HTTP 404).
+
+    Behavior:
+        - Performs a single HTTPS request instead of spawning a `pip` subprocess.
+        - Raises `OSError` / `ValueError` on network or payload errors so callers can fall back.
+    """,
+
     "linux_version": """
     Function: linux_version(package: str) -> Optional[str]
     Description:
@@ -161,3 +256,16 @@ FUNCTION_DOCSTRINGS = {
         - Requires administrator privileges for execution.
     """,
 }
+
+VARIABLE_DOCSTRINGS = {
+    "PYPI_JSON_URL": """
+    - Description: URL template of the PyPI JSON API used for latest-version lookups.
+    - Type: str
+    - Usage: Formatted with the package name by `pypi_latest_version()`.
+    """,
+    "PYPI_TIMEOUT": """
+    - Description: Timeout in seconds for each PyPI JSON API request.
+    - Type: int
+    - Usage: Bounds how long an offline lookup waits before falling back to `pip index versions`.
+    """,
+}
@@ -31,7 +31,8 @@ from pathlib import Path
 from typing import Optional, Union
 
 # Define base directories
-LIB_DIR = Path(__file__).resolve().parent.parent.parent / "lib"
+_HERE = Path(__file__).resolve()  # Resolved once; every path below derives from it
+LIB_DIR = _HERE.parent.parent.parent / "lib"
 if str(LIB_DIR) not in sys.path:
     sys.path.insert(0, str(LIB_DIR))  # Dynamically add `lib/` to sys.path only if not present
 
@@ -41,11 +42,17 @@ if str(LIB_DIR) not in sys.path:
 #     print(f'  - {path}')
 
 # Ensure the current directory is added to sys.path
-sys.path.insert(0, str(Path(__file__).resolve().parent))
+_HERE_DIR = str(_HERE.parent)
+if _HERE_DIR not in sys.path:
+    sys.path.insert(0, _HERE_DIR)  # Insert once; every lib module shares this directory
 
 from lib import system_variables as environment
 from packages.appflow_tracer.lib import log_utils
 
+# Versions collected by `prefetch_versions()`; per-package queries only run on a miss
+INSTALLED_VERSIONS = {}
+LATEST_VERSIONS = {}
+
 ## -----------------------------------------------------------------------------
 
 @lru_cache(maxsize=1)  # Cache the result to avoid redundant subprocess calls
@@ -54,21 +61,8 @@ def check_availability() -> bool:
     if sys.platform != "darwin":  # Ensure it only runs on macOS
         return False  # Prevents false positives on Ubuntu runners
 
-    # Fast check: If Brew binary is not found, return False immediately
-    brew_path = shutil.which("brew")
-    if not brew_path:
-        return False
-
-    try:
-        subprocess.run(
-            [ "brew", "--version" ],
-            capture_output=True,
-            check=True,
-            text=True
-        )
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return False
+    # A PATH lookup is enough; `brew --version` would start Brew's Ruby runtime just to answer this
+    return shutil.which("brew") is not None
 
 ## -----------------------------------------------------------------------------
 
@@ -115,8 +109,8 @@ def detect_environment() -> dict:
         try:
             result = subprocess.run(
                 [ "brew", "--prefix", "python" ],
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,  # Only the exit status matters
+                stderr=subprocess.DEVNULL,
                 check=True
             )
             if result.returncode == 0:
@@ -127,14 +121,15 @@ def detect_environment() -> dict:
     # Linux: Check if Python is installed via APT (Debian/Ubuntu) or DNF (Fedora)
     elif env_info["OS"] == "linux":
         try:
-            result = subprocess.run(["dpkg", "-l", "python3"], capture_output=True, text=True)
+            result = subprocess.run(["dpkg", "-l", "python3"], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
             if "python3" in result.stdout:
                 env_info["INSTALL_METHOD"] = "system"  # APT-managed
         except FileNotFoundError:
             try:
                 result = subprocess.run(
                     [ "rpm", "-q", "python3" ],
-                    capture_output=True,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,  # Only stdout is parsed
                     text=True
                 )
                 if "python3" in result.stdout:
@@ -151,7 +146,8 @@ def detect_environment() -> dict:
         try:
             result = subprocess.run(
                 [ "python", "-m", "ensurepip" ],
-                capture_output=True,
+                stdout=subprocess.DEVNULL,  # Only stderr is inspected
+                stderr=subprocess.PIPE,
                 text=True,
                 check=True
             )
@@ -165,12 +161,113 @@ def detect_environment() -> dict:
 
 # ------------------------------------------------------
 
+def prefetch_versions(packages: list) -> None:
+
+    # Names already answered (by an earlier prefetch or per-package query) need no new Brew call
+    pending = [package for package in packages if package not in LATEST_VERSIONS]
+    if not pending:
+        return
+
+    # One `brew info`: each entry carries both the stable and the installed versions.
+    # Brew rejects the whole batch if any formula is unknown.
+    try:
+        result = subprocess.run(
+            [ "brew", "info", "--json=v2", "--formula", *pending ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            check=True
+        )
+        formulae = json.loads(result.stdout).get("formulae", [])
+        for package in pending:
+            for formula in formulae:
+                if package in formula_names(formula):
+                    record_formula(formula, package)
+                    break
+    except FileNotFoundError:
+        return  # Brew is not installed
+    except subprocess.CalledProcessError:
+        # At least one unknown formula: query each name on its own
+        for package in pending:
+            if package not in LATEST_VERSIONS:
+                formula_available(package)
+    except (json.JSONDecodeError, KeyError):
+        pass  # Leave latest versions to the per-package query
+
+## -----------------------------------------------------------------------------
+
+def formula_names(formula: dict) -> set:
+
+    # Every name Brew resolves to this formula: canonical, tap-qualified, aliases and former names
+    name = formula["name"]
+    full_name = formula.get("full_name") or name
+    return {
+        name,
+        full_name,
+        f'{formula.get("tap") or "homebrew/core"}/{name}',
+        *(formula.get("aliases") or []),
+        *(formula.get("oldnames") or [])
+    }
+
+## -----------------------------------------------------------------------------
+
+def record_formula(formula: dict, requested: Optional[str] = None) -> None:
+
+    # One `brew info --json=v2` entry carries both the stable and the installed versions
+    stable = formula["versions"]["stable"]
+    installed = formula.get("installed") or []
+    names = {formula["name"], requested} - {None}  # Requested aliases / tap-qualified names hit the cache too
+    for name in names:
+        LATEST_VERSIONS[name] = stable
+        if installed:
+            INSTALLED_VERSIONS[name] = installed[-1]["version"]
+
+## -----------------------------------------------------------------------------
+
+def formula_available(package: str) -> bool:
+
+    if package in LATEST_VERSIONS:
+        return LATEST_VERSIONS[package] is not None  # Seen by `prefetch_versions()` or an earlier query
+
+    try:
+        result = subprocess.run(
+            [ "brew", "info", "--json=v2", "--formula", package ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            check=True
+        )
+        formulae = json.loads(result.stdout).get("formulae", [])
+        for formula in formulae:
+            record_formula(formula, package)
+        if formulae:
+            return True
+    except subprocess.CalledProcessError:
+        pass  # Unknown formula
+    except (json.JSONDecodeError, KeyError, FileNotFoundError):
+        return False  # Unreadable answer (or Brew missing): nothing is cached
+    LATEST_VERSIONS[package] = None  # Remember the miss for `latest_version()` and later checks
+    return False
+
+## -----------------------------------------------------------------------------
+
+def clear_versions() -> None:
+
+    INSTALLED_VERSIONS.clear()
+    LATEST_VERSIONS.clear()
+
+## -----------------------------------------------------------------------------
+
 def version(package: str) -> Optional[str]:
 
+    if package in INSTALLED_VERSIONS:
+        return INSTALLED_VERSIONS[package]
+
     try:
         result = subprocess.run(
             [ "brew", "list", "--versions", package ],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
             check=True
         )
@@ -182,6 +279,9 @@ def version(package: str) -> Optional[str]:
 
 def latest_version(package: str) -> Optional[str]:
 
+    if package in LATEST_VERSIONS:
+        return LATEST_VERSIONS[package]
+
     # try:
     #     result = subprocess.run(
     #         [ "brew", "info", package ],
@@ -198,7 +298,8 @@ def latest_version(package: str) -> Optional[str]:
     try:
         result = subprocess.run(
             ["brew", "info", package],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
             check=True
         )
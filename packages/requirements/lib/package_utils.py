@@ -27,10 +27,20 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 # Standard library imports - Type hinting (kept in a separate group)
-from typing import Optional, Union
+from typing import Iterator, Optional, Union
+
+# Third-party imports - Optional streaming JSON parser (falls back to `json`)
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Errors raised while parsing a dependencies file, with or without `ijson`
+JSON_ERRORS = (json.JSONDecodeError, ijson.JSONError) if ijson else (json.JSONDecodeError,)
 
 # Define base directories
-LIB_DIR = Path(__file__).resolve().parent.parent.parent / "lib"
+_HERE = Path(__file__).resolve()  # Resolved once; every path below derives from it
+LIB_DIR = _HERE.parent.parent.parent / "lib"
 if str(LIB_DIR) not in sys.path:
     sys.path.insert(0, str(LIB_DIR))  # Dynamically add `lib/` to sys.path only if not present
 
@@ -40,12 +50,17 @@ if str(LIB_DIR) not in sys.path:
 #     print(f'  - {path}')
 
 # Ensure the current directory is added to sys.path
-sys.path.insert(0, str(Path(__file__).resolve().parent))
+_HERE_DIR = str(_HERE.parent)
+if _HERE_DIR not in sys.path:
+    sys.path.insert(0, _HERE_DIR)  # Insert once; every lib module shares this directory
 
 from lib import system_variables as environment
 from packages.appflow_tracer.lib import log_utils
 
-from . import version_utils
+from . import (
+    brew_utils,
+    version_utils
+)
 
 ## -----------------------------------------------------------------------------
 
@@ -53,17 +68,13 @@ def backup_packages(file_path: str, configs: dict) -> None:
 
     try:
         with open(file_path, "w") as f:
-            subprocess.run(
-                [sys.executable, "-m", "pip", "freeze"],
-                stdout=f,
-                check=True
-            )
+            f.writelines(f'{line}\n' for line in freeze_packages())
         log_utils.log_message(
             f'[INFO] Installed packages list saved to {file_path}',
             environment.category.info.id,
             configs=configs
         )
-    except subprocess.CalledProcessError as e:
+    except OSError as e:
         log_utils.log_message(
             f'[WARNING] Failed to save installed packages: {e}',
             environment.category.warning.id,
@@ -72,79 +83,141 @@ def backup_packages(file_path: str, configs: dict) -> None:
 
 ## -----------------------------------------------------------------------------
 
+def freeze_packages(all_packages: bool = False, direct_urls: bool = True) -> list:
+
+    # `pip freeze` skips its own tooling unless `--all` is given
+    if all_packages:
+        excluded = set()
+    else:
+        excluded = {"pip"} if sys.version_info >= (3, 12) else {"pip", "setuptools", "wheel", "distribute"}
+    lines = {}
+    for dist in importlib.metadata.distributions():
+        name = dist.metadata["Name"]
+        if not name:
+            continue
+        key = version_utils.normalize_name(name)
+        if key in excluded or key in lines:
+            continue  # First match on sys.path wins
+        direct_url = dist.read_text("direct_url.json") if direct_urls else None
+        lines[key] = freeze_line(name, dist.version, direct_url)
+    return [lines[key] for key in sorted(lines)]
+
+## -----------------------------------------------------------------------------
+
+def freeze_line(name: str, version: str, direct_url: Optional[str] = None) -> str:
+
+    # PEP 610: distributions installed from a URL (or in editable mode) record where they came from
+    if not direct_url:
+        return f'{name}=={version}'
+    try:
+        origin = json.loads(direct_url)
+        url = origin["url"]
+    except (json.JSONDecodeError, KeyError, TypeError):
+        return f'{name}=={version}'
+    if origin.get("dir_info", {}).get("editable"):
+        return f'-e {url}'
+    vcs_info = origin.get("vcs_info")
+    if vcs_info:
+        return f'{name} @ {vcs_info["vcs"]}+{url}@{vcs_info["commit_id"]}'
+    archive_hash = origin.get("archive_info", {}).get("hash")
+    return f'{name} @ {url}#{archive_hash}' if archive_hash else f'{name} @ {url}'
+
+## -----------------------------------------------------------------------------
+
 def install_package(package: str, version: Optional[str] = None, configs: dict = None) -> None:
 
+    install_packages([(package, version)], configs)
+
+## -----------------------------------------------------------------------------
+
+def install_packages(packages: list, configs: dict) -> None:
+
     # Fetch environment details
     env_info = configs.get("environment", {})
     brew_available = env_info.get("INSTALL_METHOD") == "brew"  # Python is managed via Brew
     externally_managed = env_info.get("EXTERNALLY_MANAGED", False)  # Check if Pip is restricted
     forced_install = configs.get("packages", {}).get("installation", {}).get("forced", False)
 
-    # Check if Brew is available & controls Python
-    if brew_available:
-        log_utils.log_message(
-            f'[INFO]    Checking if "{package}" is available via Homebrew...',
-            configs=configs
-        )
-        brew_list = subprocess.run(
-            ["brew", "info", package],
-            capture_output=True,
-            text=True
-        )
+    pip_packages = []
+    brew_packages = []
 
-        if "Error:" not in brew_list.stderr:
-            # If Brew has the package, install it
-            log_utils.log_message(
-                f'\n[INSTALL] Installing "{package}" via Homebrew...',
-                environment.category.error.id,
-                configs=configs
-            )
-            subprocess.run(["brew", "install", package], check=False)
-            return
-        else:
+    # Check if Brew is available & controls Python
+    for package, version in packages:
+        if brew_available:
             log_utils.log_message(
-                f'[WARNING] Package "{package}" is not available via Brew. Falling back to Pip...',
+                f'[INFO]    Checking if "{package}" is available via Homebrew...',
                 configs=configs
             )
+            if brew_utils.formula_available(package):
+                # If Brew has the package, install it
+                log_utils.log_message(
+                    f'\n[INSTALL] Installing "{package}" via Homebrew...',
+                    environment.category.error.id,
+                    configs=configs
+                )
+                brew_packages.append(package)
+                continue
+            else:
+                log_utils.log_message(
+                    f'[WARNING] Package "{package}" is not available via Brew. Falling back to Pip...',
+                    configs=configs
+                )
+
+        pip_packages.append((package, version))
+
+    # One `brew install` for every Brew-managed package
+    if brew_packages:
+        subprocess.run(["brew", "install", *brew_packages], check=False)
+
+    if not pip_packages:
+        return
 
     # Use Pip (if Brew is not managing Python OR package not found in Brew)
     pip_install_cmd = [sys.executable, "-m", "pip", "install", "--quiet", "--user"]
-
-    if version:
-        pip_install_cmd.append(f'{package}=={version}')
-    else:
-        pip_install_cmd.append(package)
+    pip_specs = [f'{package}=={version}' if version else package for package, version in pip_packages]
 
     if externally_managed:
         # 2A: Pip is restricted → Handle controlled environment
         if forced_install:
-            log_utils.log_message(
-                f'[INSTALL] Installing "{package}" via Pip using `--break-system-packages` (forced mode)...',
-                environment.category.error.id,
-                configs=configs
-            )
-            pip_install_cmd.append("--break-system-packages")
-            subprocess.run(pip_install_cmd, check=False)
+            for package, _ in pip_packages:
+                log_utils.log_message(
+                    f'[INSTALL] Installing "{package}" via Pip using `--break-system-packages` (forced mode)...',
+                    environment.category.error.id,
+                    configs=configs
+                )
+            pip_install(pip_install_cmd + ["--break-system-packages"], pip_specs)
         else:
+            for package, _ in pip_packages:
+                log_utils.log_message(
+                    f'[INFO]    Package "{package}" requires installation via Pip in a controlled environment.\n'
+                    f'\nRun the following command manually if needed:\n'
+                    f'    {sys.executable} -m pip install --user {package}',
+                    configs=configs
+                )
+    else:
+        # 2B: Normal Pip installation (default)
+        for package, _ in pip_packages:
             log_utils.log_message(
-                f'[INFO]    Package "{package}" requires installation via Pip in a controlled environment.\n'
-                f'\nRun the following command manually if needed:\n'
-                f'    {sys.executable} -m pip install --user {package}',
+                f'[INSTALL] Installing "{package}" via Pip (default mode)...',
+                environment.category.error.id,
                 configs=configs
             )
-    else:
-        # 2B: Normal Pip installation (default)
-        log_utils.log_message(
-            f'[INSTALL] Installing "{package}" via Pip (default mode)...',
-            environment.category.error.id,
-            configs=configs
-        )
-        subprocess.run(pip_install_cmd, check=False)
+        pip_install(pip_install_cmd, pip_specs)
 
     return  # Exit after installation
 
 ## -----------------------------------------------------------------------------
 
+def pip_install(command: list, specs: list) -> None:
+
+    # A single resolver run for all packages; Pip rejects the whole batch if one spec fails
+    result = subprocess.run(command + specs, check=False)
+    if result.returncode != 0 and len(specs) > 1:
+        for spec in specs:  # Retry one by one so a single bad spec does not block the rest
+            subprocess.run(command + [spec], check=False)
+
+## -----------------------------------------------------------------------------
+
 def install_requirements(configs: dict, bypass: bool = False) -> None:
 
     log_utils.log_message(
@@ -163,6 +236,7 @@ def install_requirements(configs: dict, bypass: bool = False) -> None:
 
     # Use `review_packages()` to get the evaluated package statuses
     reviewed_packages = review_packages(configs)
+    pending_packages = []  # (package, version) pairs, installed together after the review
 
     for dep in reviewed_packages:
         package = dep["package"]
@@ -183,25 +257,24 @@ def install_requirements(configs: dict, bypass: bool = False) -> None:
                 environment.category.error.id,
                 configs=configs
             )
-            install_package(
+            pending_packages.append((
                 package,
-                latest_version if policy_mode == "latest" else target_version,
-                configs
-            )
+                latest_version if policy_mode == "latest" else target_version
+            ))
 
         elif status == "upgrading" or status == "outdated":
             log_utils.log_message(
                 f'\n[UPGRADE] Upgrading "{package}" to latest version ({latest_version})...',
                 configs=configs
             )
-            install_package(package, None, configs)  # None means latest
+            pending_packages.append((package, None))  # None means latest
 
         elif status == "downgraded" or (status == "upgraded" and policy_mode == "enforce"):
             log_utils.log_message(
                 f'[DOWNGRADE] Downgrading "{package}" to {target_version}...',
                 configs=configs
             )
-            install_package(package, target_version, configs)
+            pending_packages.append((package, target_version))
 
         elif status in ["restricted", "matched"]:
             log_utils.log_message(
@@ -215,7 +288,15 @@ def install_requirements(configs: dict, bypass: bool = False) -> None:
                 f'[AD-HOC] Forcing "{package}" installation (bypassing policy checks) ...',
                 configs=configs
             )
-            install_package(package, None, configs)
+            pending_packages.append((package, None))
+
+    # Install everything in one Brew and one Pip invocation instead of one per package
+    if pending_packages:
+        install_packages(pending_packages, configs)
+
+    # Installs changed the environment; drop the cached version lookups
+    version_utils.installed_index.cache_clear()
+    brew_utils.clear_versions()
 
     # Write back to `installed.json` **only once** after processing all packages
     with installed_filepath.open("w") as f:
@@ -236,83 +317,6 @@ def install_requirements(configs: dict, bypass: bool = False) -> None:
 
 ## -----------------------------------------------------------------------------
 
-def install_requirements__legacy(configs: dict) -> None:
-
-    log_utils.log_message(
-        f'\n[INSTALL] Starting installation process...',
-        environment.category.error.id,
-        configs=configs
-    )
-
-    installed_filepath = installed_configfile(configs)  # Fetch dynamically
-    if not installed_filepath.exists():
-        log_utils.log_message(
-            f'[ERROR] Missing installed.json path in CONFIGS.',
-            configs=configs
-        )
-        sys.exit(1)  # Exit to prevent further failures
-
-    # Use the `requirements` list from `CONFIGS`
-    requirements = configs["requirements"]
-
-    for dep in requirements:
-        package = dep["package"]
-        version_info = dep["version"]
-        status = version_info["status"]
-        target_version = version_info["target"]
-        latest_version = version_info["latest"]
-        policy_mode = version_info["policy"]
-
-        if status == "installing":
-            log_utils.log_message(
-                f'[INSTALL] Installing {package} ({"latest" if policy_mode == "latest" else target_version})...',
-                environment.category.error.id,
-                configs=configs
-            )
-            install_package(
-                package,
-                latest_version if policy_mode == "latest" else target_version,
-                configs
-            )
-
-        elif status == "upgrading":
-            log_utils.log_message(
-                f'\n[UPGRADE] Upgrading "{package}" to latest version ({latest_version})...',
-                configs=configs
-            )
-            install_package(package, None, configs)  # None means latest
-
-        elif status == "downgraded":
-            log_utils.log_message(
-                f'[DOWNGRADE] Downgrading "{package}" to {target_version}...',
-                configs=configs
-            )
-            install_package(package, target_version, configs)
-
-        elif status in ["restricted", "matched"]:
-            log_utils.log_message(
-                f'[SKIP]    Skipping "{package}" is {status}, no changes needed.',
-                environment.category.warning.id,
-                configs=configs
-            )
-
-    # Write back to `installed.json` **only once** after processing all packages
-    with installed_filepath.open("w") as f:
-        json.dump({ "dependencies": requirements }, f, indent=4)
-
-    log_utils.log_message(
-        f'\n[INSTALL] Package Configuration updated at {installed_filepath}',
-        environment.category.error.id,
-        configs=configs
-    )
-    log_utils.log_message(
-        f'\n[INSTALL] Installation process completed.\n',
-        environment.category.error.id,
-        configs=configs
-    )
-
-## -----------------------------------------------------------------------------
-
 def installed_configfile(configs: dict) -> Path:
 
     # return configs.get("packages", {}).get("installation", {}).get("configs", None)
@@ -327,24 +331,19 @@ def installed_configfile(configs: dict) -> Path:
 def migrate_packages(file_path: str, configs: dict) -> None:
 
     try:
-        result = subprocess.run(
-            [sys.executable, "-m", "pip", "list", "--format=freeze"],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        installed_packages = result.stdout.splitlines()
+        installed_packages = freeze_packages(all_packages=True, direct_urls=False)  # `pip list --format=freeze`
 
         # Save package list before migration
         with open(file_path, "w") as f:
             f.write("\n".join(installed_packages))
 
-        for package in installed_packages:
-            pkg_name = package.split("==")[0]
-            subprocess.run(
-                [sys.executable, "-m", "pip", "install", "--user", pkg_name],
-                check=False
+        # One Pip run for every package instead of one per package
+        if installed_packages:
+            pip_install(
+                [sys.executable, "-m", "pip", "install", "--user"],
+                [package.split("==")[0] for package in installed_packages]
             )
+        version_utils.installed_index.cache_clear()  # Environment changed
 
         log_utils.log_message(
             f'[INFO] Packages have been migrated and the list is saved to {file_path}.',
@@ -352,7 +351,7 @@ def migrate_packages(file_path: str, configs: dict) -> None:
             configs=configs
         )
 
-    except subprocess.CalledProcessError as e:
+    except OSError as e:
         log_utils.log_message(
             f'[WARNING] Failed to migrate packages: {e}',
             environment.category.info.id,
@@ -373,21 +372,14 @@ def packages_installed(configs: dict) -> None:
         return
 
     try:
-        with installed_filepath.open("r") as f:
-            installed_data = json.load(f)
+        found = False
 
-        dependencies = installed_data.get("dependencies", [])
+        # Entries are logged as they are parsed rather than after the whole file is loaded
+        for dep in read_dependencies(installed_filepath):
+            if not found:
+                log_utils.log_message("\n[INSTALLED PACKAGES]", configs=configs)
+                found = True
 
-        if not dependencies:
-            log_utils.log_message(
-                "[INFO] No installed packages found.",
-                configs=configs
-            )
-            return
-
-        log_utils.log_message("\n[INSTALLED PACKAGES]", configs=configs)
-
-        for dep in dependencies:
             package = dep.get("package", "Unknown")
             target_version = dep.get("version", {}).get("target", "N/A")
             get_installed_version = dep.get("version", {}).get("latest", "Not Installed")
@@ -398,7 +390,13 @@ def packages_installed(configs: dict) -> None:
                 configs=configs
             )
 
-    except json.JSONDecodeError:
+        if not found:
+            log_utils.log_message(
+                "[INFO] No installed packages found.",
+                configs=configs
+            )
+
+    except JSON_ERRORS:
         log_utils.log_message(
             f'[ERROR] Invalid JSON structure in {installed_filepath}.',
             configs=configs
@@ -406,6 +404,18 @@ def packages_installed(configs: dict) -> None:
 
 ## -----------------------------------------------------------------------------
 
+def read_dependencies(file_path: Union[str, Path]) -> Iterator[dict]:
+
+    with open(file_path, "rb") as f:
+        if ijson:
+            # Stream one dependency at a time instead of materializing the whole document
+            yield from ijson.items(f, "dependencies.item", use_float=True)
+        else:
+            data = json.load(f)
+            yield from (data.get("dependencies", []) if isinstance(data, dict) else [])
+
+## -----------------------------------------------------------------------------
+
 def restore_packages(file_path: str, configs: dict) -> None:
 
     try:
@@ -413,6 +423,7 @@ def restore_packages(file_path: str, configs: dict) -> None:
             [sys.executable, "-m", "pip", "install", "--user", "-r", file_path],
             check=True
         )
+        version_utils.installed_index.cache_clear()  # Environment changed
         log_utils.log_message(
             f'[INFO] Installed packages restored successfully from {file_path}.',
             environment.category.info.id,
@@ -434,6 +445,10 @@ def review_packages(configs: dict) -> list:
     dependencies = configs.get("requirements", [])  # Ensure it defaults to an empty list
     installed_data = []
 
+    # Query Brew once for all packages instead of once per package
+    if configs.get("environment", {}).get("INSTALL_METHOD") == "brew":
+        brew_utils.prefetch_versions([dep["package"] for dep in dependencies])
+
     for dep in dependencies:
         package_name = dep["package"]
         package_policy = dep["version"]["policy"]
@@ -441,12 +456,13 @@ def review_packages(configs: dict) -> list:
 
         installed_version = version_utils.installed_version(package_name, configs)
 
-        # Determine package-name status
-        if installed_version == target_version:
+        # Determine package-name status (parsed versions, so "1.10" > "1.9")
+        comparison = version_utils.compare_versions(installed_version, target_version) if installed_version else None
+        if comparison == 0:
             status = "latest"
-        elif installed_version and installed_version > target_version:
+        elif comparison is not None and comparison > 0:
             status = "upgraded"
-        elif installed_version and installed_version < target_version:
+        elif comparison is not None and comparison < 0:
             status = "outdated"
         else:
             status = "missing"  # Package is not installed
@@ -20,6 +20,9 @@ import importlib.metadata
 # Standard library imports - Function tools
 from functools import lru_cache
 
+# Standard library imports - Concurrency
+from concurrent.futures import ThreadPoolExecutor
+
 # Standard library imports - Date and time handling
 from datetime import datetime, timezone
 
@@ -30,7 +33,8 @@ from pathlib import Path
 from typing import Optional, Union
 
 # Define base directories
-LIB_DIR = Path(__file__).resolve().parent.parent.parent / "lib"
+_HERE = Path(__file__).resolve()  # Resolved once; every path below derives from it
+LIB_DIR = _HERE.parent.parent.parent / "lib"
 if str(LIB_DIR) not in sys.path:
     sys.path.insert(0, str(LIB_DIR))  # Dynamically add `lib/` to sys.path only if not present
 
@@ -40,12 +44,15 @@ if str(LIB_DIR) not in sys.path:
 #     print(f'  - {path}')
 
 # Ensure the current directory is added to sys.path
-sys.path.insert(0, str(Path(__file__).resolve().parent))
+_HERE_DIR = str(_HERE.parent)
+if _HERE_DIR not in sys.path:
+    sys.path.insert(0, _HERE_DIR)  # Insert once; every lib module shares this directory
 
 from lib import system_variables as environment
 from packages.appflow_tracer.lib import log_utils
 
 from . import (
+    brew_utils,
     package_utils,
     version_utils
 )
@@ -57,6 +64,24 @@ def policy_management(configs: dict) -> list:
     dependencies = configs["requirements"]  # Use already-loaded requirements
     installed_filepath = package_utils.installed_configfile(configs)  # Fetch dynamically
 
+    packages = [dep["package"] for dep in dependencies]
+
+    # Query Brew once for all packages instead of once per package
+    if configs.get("environment", {}).get("INSTALL_METHOD") == "brew":
+        brew_utils.prefetch_versions(packages)
+
+    # Latest-version lookups are network-bound; resolve them all in one concurrent wave
+    available = {}
+    if packages:
+        # Resolve the cached pip index check once here: `lru_cache` does not stop concurrent first calls,
+        # so every worker would otherwise spawn its own `pip config list`
+        version_utils.pip_config_index()
+        with ThreadPoolExecutor(max_workers=min(16, len(packages))) as executor:
+            available = dict(zip(
+                packages,
+                executor.map(lambda package: version_utils.latest_version(package, configs), packages)
+            ))
+
     for dep in dependencies:
         package = dep["package"]
         version_info = dep["version"]
@@ -65,7 +90,7 @@ def policy_management(configs: dict) -> list:
         target_version = version_info.get("target")
 
         installed_ver = version_utils.installed_version(package, configs)  # Get installed version
-        available_ver = version_utils.latest_version(package, configs)  # Get latest available version
+        available_ver = available[package]  # Latest available version (prefetched above)
 
         # Update version keys in `CONFIGS["requirements"]`
         version_info["latest"] = available_ver  # Store the latest available version
@@ -91,11 +116,14 @@ def policy_management(configs: dict) -> list:
         policy_header = f'[POLICY]  Package "{package}"'
         log_message = ""
 
+        # Compare parsed versions ("1.10" > "1.9"), not raw strings
+        comparison = version_utils.compare_versions(installed_ver, target_version) if installed_ver else 0
+
         # Policy decision-making
         if not installed_ver:
             version_info["status"] = "installing"
             log_message = f'{policy_header} is missing. Installing {"latest" if policy_mode == "latest" else target_version}.'
-        elif installed_ver < target_version:
+        elif comparison < 0:
             if policy_mode == "latest":
                 version_info["status"] = "upgrading"
                 log_message = f'{policy_header} is outdated ({installed_ver} < {target_version}). Upgrading...\n'
@@ -111,8 +139,8 @@ def policy_management(configs: dict) -> list:
         #         version_info["status"] = "matched"
         #         log_message = f'{policy_header} matches the target version. No action needed.'
 
-        elif installed_ver == target_version:
-            if policy_mode == "latest" and available_ver and available_ver > installed_ver:
+        elif comparison == 0:
+            if policy_mode == "latest" and available_ver and version_utils.compare_versions(available_ver, installed_ver) > 0:
                 version_info["status"] = "outdated"  # Wrong when installed == target
                 log_message = f'{policy_header} matches target but a newer version ({available_ver}) is available. Marking as outdated.'
             else:
@@ -135,9 +163,10 @@ def policy_management(configs: dict) -> list:
             )
 
     # Save modified `requirements` to `installed.json`
+    # (encoded in one pass and written in one call; json.dump() writes chunk by chunk)
     try:
         with open(installed_filepath, "w") as f:
-            json.dump({"dependencies": dependencies}, f, indent=4)
+            f.write(json.dumps({"dependencies": dependencies}, indent=4))
         log_message = f'\n[DEBUG]   Package Configuration updated at {installed_filepath}'
         log_utils.log_message(
             log_message,
@@ -10,10 +10,16 @@ import shutil
 
 # Standard library imports - Utility modules
 import json
+import re
 import argparse
 import platform
 import logging
 
+# Standard library imports - Network access
+import os
+import urllib.error
+import urllib.request
+
 # Standard library imports - Import system
 import importlib.metadata
 
@@ -29,8 +35,15 @@ from pathlib import Path
 # Standard library imports - Type hinting (kept in a separate group)
 from typing import Optional, Union
 
+# Third-party imports - Optional PEP 440 version parsing (falls back to numeric release tuples)
+try:
+    from packaging.version import InvalidVersion, Version
+except ImportError:
+    InvalidVersion = Version = None
+
 # Define base directories
-LIB_DIR = Path(__file__).resolve().parent.parent.parent / "lib"
+_HERE = Path(__file__).resolve()  # Resolved once; every path below derives from it
+LIB_DIR = _HERE.parent.parent.parent / "lib"
 if str(LIB_DIR) not in sys.path:
     sys.path.insert(0, str(LIB_DIR))  # Dynamically add `lib/` to sys.path only if not present
 
@@ -40,13 +53,19 @@ if str(LIB_DIR) not in sys.path:
 #     print(f'  - {path}')
 
 # Ensure the current directory is added to sys.path
-sys.path.insert(0, str(Path(__file__).resolve().parent))
+_HERE_DIR = str(_HERE.parent)
+if _HERE_DIR not in sys.path:
+    sys.path.insert(0, _HERE_DIR)  # Insert once; every lib module shares this directory
 
 from lib import system_variables as environment
 from packages.appflow_tracer.lib import log_utils
 
 from . import brew_utils
 
+# PyPI JSON API endpoint and per-request timeout (seconds) for latest-version lookups
+PYPI_JSON_URL = "https://pypi.org/pypi/{package}/json"
+PYPI_TIMEOUT = 10
+
 # ------------------------------------------------------
 
 def latest_version(package: str, configs: dict) -> Optional[str]:
@@ -77,7 +96,8 @@ def linux_version(package: str) -> Optional[str]:
     try:
         result = subprocess.run(
             [ "dpkg", "-s", package ],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,  # Only stdout is parsed
             text=True,
             check=True
         )
@@ -90,7 +110,8 @@ def linux_version(package: str) -> Optional[str]:
     try:
         result = subprocess.run(
             [ "rpm", "-q", package ],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
             check=True
         )
@@ -105,7 +126,8 @@ def linux_latest_version(package: str) -> Optional[str]:
     try:
         result = subprocess.run(
             [ "apt-cache", "madison", package ],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
             check=True
         )
@@ -117,7 +139,8 @@ def linux_latest_version(package: str) -> Optional[str]:
     try:
         result = subprocess.run(
             [ "dnf", "list", "available", package ],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
             check=True
         )
@@ -133,7 +156,8 @@ def windows_version(package: str) -> Optional[str]:
     try:
         result = subprocess.run(
             [ "powershell", "-Command", f'(Get-AppxPackage -Name {package}).Version' ],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
             check=True
         )
@@ -149,7 +173,8 @@ def windows_latest_version(package: str) -> Optional[str]:
     try:
         result = subprocess.run(
             [ "powershell", "-Command", f'(Find-Package -Name {package}).Version' ],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
             check=True
         )
@@ -159,120 +184,75 @@ def windows_latest_version(package: str) -> Optional[str]:
 
 ## -----------------------------------------------------------------------------
 
-def installed_version(package: str, configs: dict) -> Optional[str]:
+@lru_cache(maxsize=None)  # Each version string is parsed once per run
+def version_key(version: str) -> Optional[object]:
 
-    env = configs.get("environment", {})
-    install_method = env.get("INSTALL_METHOD")
+    if Version is not None:
+        try:
+            return Version(version)
+        except InvalidVersion:
+            return None
 
-    debug_package = f'[DEBUG]   Package "{package}"'
+    match = re.match(r"\d+(?:\.\d+)*", version.strip().lstrip("vV"))
+    if not match:
+        return None
+    release = [int(part) for part in match.group().split(".")]
+    while len(release) > 1 and release[-1] == 0:
+        release.pop()  # "1.0" == "1.0.0"
+    return tuple(release)
 
-    # Check Pip First (Preferred)
-    if not env.get("EXTERNALLY_MANAGED", False):  # Only check Pip if not externally managed
-        try:
-            # Fetch list of installed packages in JSON format
-            result = subprocess.run(
-                [sys.executable, "-m", "pip", "list", "--format=json"],
-                capture_output=True,
-                text=True,
-                check=True
-            )
+## -----------------------------------------------------------------------------
 
-            installed_packages = json.loads(result.stdout)
-            package_versions = {pkg["name"].lower(): pkg["version"] for pkg in installed_packages}
-
-            if package.lower() in package_versions:
-                version = package_versions[package.lower()]
-                log_utils.log_message(
-                    f'{debug_package} detected via Pip list: {version}',
-                    environment.category.debug.id,
-                    configs=configs
-                )
-                return version
-            else:
-                log_utils.log_message(
-                    f'{debug_package} NOT found via Pip list.',
-                    environment.category.debug.id,
-                    configs=configs
-                )
-
-        except (subprocess.CalledProcessError, json.JSONDecodeError) as e:
-            log_utils.log_message(
-                f'[ERROR] Pip list failed: {e}',
-                configs=configs
-            )
+def compare_versions(left: str, right: str) -> int:
 
-    # # If not found, fallback to `importlib.metadata.version()`
-    # try:
-    #     version = importlib.metadata.version(package)
-    #     log_utils.log_message(
-    #         f'\n{debug_package} detected via importlib: {version}',
-    #         environment.category.debug.id,
-    #         configs=configs
-    #     )
-    #     return version
-    # except importlib.metadata.PackageNotFoundError:
-    #     log_utils.log_message(
-    #         f'{debug_package} NOT found via importlib.',
-    #         environment.category.debug.id,
-    #         configs=configs
-    #     )
-    #     return "not installed"  # Ensure we return a value instead of None
-    # except KeyError:  # Handle missing 'Version' field explicitly
-    #     log_utils.log_message(
-    #         f'{debug_package} metadata exists but lacks a version field.',
-    #         environment.category.debug.id,
-    #         configs=configs
-    #     )
-    #     return "unknown"  # Avoid crash when 'Version' field is missing
-
-    # try:
-    #     version = importlib.metadata.version(package)
-    #
-    #     if not version:  # ✅ Covers both None and empty string cases
-    #         raise importlib.metadata.PackageNotFoundError  # ✅ Raise the correct exception
-    #
-    #     log_utils.log_message(
-    #         f'\n{debug_package} detected via importlib: {version}',
-    #         environment.category.debug.id,
-    #         configs=configs
-    #     )
-    #     return version
-    #
-    # except (importlib.metadata.PackageNotFoundError, KeyError):  # ✅ Catch both exceptions properly
-    #     log_utils.log_message(
-    #         f'{debug_package} NOT found via importlib or missing version field.',
-    #         environment.category.debug.id,
-    #         configs=configs
-    #     )
-    #     return None  # ✅ Ensures None is returned correctly
+    left_key, right_key = version_key(str(left)), version_key(str(right))
+    if left_key is None or right_key is None:
+        left_key, right_key = str(left), str(right)  # Unparseable: plain string ordering
+    return (left_key > right_key) - (left_key < right_key)
 
-    try:
-        dist = importlib.metadata.distribution(package)  # ✅ Fetch distribution first
+## -----------------------------------------------------------------------------
 
-        if "Version" in dist.metadata:  # ✅ Explicitly check if "Version" exists
-            version = dist.metadata["Version"]
+def normalize_name(package: str) -> str:
 
-            log_utils.log_message(
-                f'\n{debug_package} detected via importlib: {version}',
-                environment.category.debug.id,
-                configs=configs
-            )
-            return version
-        else:
-            log_utils.log_message(
-                f'{debug_package} metadata exists but lacks a version field.',
-                environment.category.debug.id,
-                configs=configs
-            )
-            return None  # ✅ Return None if "Version" is missing
+    return re.sub(r"[-_.]+", "-", package).lower()  # PEP 503 name normalization
+
+## -----------------------------------------------------------------------------
+
+@lru_cache(maxsize=1)
+def installed_index() -> dict:
+
+    index = {}
+    for dist in importlib.metadata.distributions():
+        name = dist.metadata["Name"]
+        if name:
+            index.setdefault(normalize_name(name), dist.version)  # First match on sys.path wins
+    return index
 
-    except importlib.metadata.PackageNotFoundError:
+## -----------------------------------------------------------------------------
+
+def installed_version(package: str, configs: dict) -> Optional[str]:
+
+    env = configs.get("environment", {})
+    install_method = env.get("INSTALL_METHOD")
+
+    debug_package = f'[DEBUG]   Package "{package}"'
+
+    # Check Python distributions first (single cached scan of the environment)
+    version = installed_index().get(normalize_name(package))
+    if version:
         log_utils.log_message(
-            f'{debug_package} NOT found via importlib.',
+            f'{debug_package} detected via importlib: {version}',
             environment.category.debug.id,
             configs=configs
         )
-        return None  # ✅ Ensures proper return when package is missing
+        return version
+
+    log_utils.log_message(
+        f'{debug_package} NOT found via importlib.',
+        environment.category.debug.id,
+        configs=configs
+    )
+    return None  # Ensures proper return when package is missing
 
     debug_checking = f'[DEBUG]   Checking "{package}"'
     # Use the correct package manager based on INSTALL_METHOD
@@ -315,12 +295,56 @@ def installed_version(package: str, configs: dict) -> Optional[str]:
 
 ## -----------------------------------------------------------------------------
 
+def pypi_latest_version(package: str) -> Optional[str]:
+
+    url = PYPI_JSON_URL.format(package=package)
+    try:
+        with urllib.request.urlopen(url, timeout=PYPI_TIMEOUT) as response:
+            return json.load(response)["info"]["version"] or None
+    except urllib.error.HTTPError as e:
+        if e.code == 404:
+            return None  # PyPI answered: the package does not exist
+        raise
+
+## -----------------------------------------------------------------------------
+
+@lru_cache(maxsize=1)  # pip's configuration files do not change during a run
+def pip_config_index() -> bool:
+
+    try:
+        result = subprocess.run(
+            [ sys.executable, "-m", "pip", "config", "list" ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return False
+    # Matches both `<scope>.index-url` and `<scope>.extra-index-url`
+    return "index-url" in result.stdout
+
+## -----------------------------------------------------------------------------
+
 def pip_latest_version(package: str) -> Optional[str]:
 
+    # A custom index is only honoured by pip itself; otherwise ask PyPI directly
+    custom_index = (
+        os.environ.get("PIP_INDEX_URL")
+        or os.environ.get("PIP_EXTRA_INDEX_URL")
+        or pip_config_index()
+    )
+    if not custom_index:
+        try:
+            return pypi_latest_version(package)
+        except (OSError, ValueError, KeyError):
+            pass  # Offline or unexpected payload, fall back to `pip index versions`
+
     try:
         result = subprocess.run(
             [ sys.executable, "-m", "pip", "index", "versions", package ],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,  # Pip's warnings (e.g. experimental command) are not needed
             text=True,
             check=True
         )
@@ -116,6 +116,11 @@ def test_is_project_file() -> None:
     invalid_path = "/outside/module.py"
     assert file_utils.is_project_file(valid_path) is True
     assert file_utils.is_project_file(invalid_path) is False
+    # Repeated checks are served from the cache with the same answer
+    hits_before = file_utils.is_project_file.cache_info().hits
+    assert file_utils.is_project_file(valid_path) is True
+    assert file_utils.is_project_file.cache_info().hits > hits_before
+    assert file_utils.is_project_file("") is False
 
 def test_manage_logfiles() -> None:
     """
@@ -75,7 +75,10 @@ if str(ROOT_DIR) not in sys.path:
 from lib import system_variables as environment
 
 from packages.appflow_tracer import tracing
-from packages.appflow_tracer.lib import log_utils
+from packages.appflow_tracer.lib import (
+    log_utils,
+    trace_utils
+)
 
 # Initialize CONFIGS
 CONFIGS = tracing.setup_logging(
@@ -141,6 +144,101 @@ def test_log_message(
         if CONFIGS["tracing"].get("enable", False):
             mock_output_console.assert_called_once()
 
+@pytest.mark.parametrize(
+    "log_category, expected_level", [
+        (environment.category.warning.id, logging.WARNING),
+        ("warning", logging.WARNING),
+        ("unknown", logging.INFO),
+    ]
+)
+def test_log_message_level(
+    mock_logger,
+    log_category,
+    expected_level
+) -> None:
+    """
+    Test that `log_utils.log_message()` resolves log levels for exact and lower-case categories.
+
+    Args:
+        mock_logger (MagicMock): Mock logger object used to capture log output.
+        log_category (str): The category passed to `log_message()`.
+        expected_level (int): The logging level expected to reach `output_logfile()`.
+
+    Returns:
+        None: This function does not return a value. It asserts the resolved log level.
+    """
+
+    configs = json.loads(json.dumps(CONFIGS))
+    configs["logging"]["enable"] = True
+    configs["tracing"]["enable"] = False
+    with patch(
+        "packages.appflow_tracer.lib.log_utils.output_logfile"
+    ) as mock_output_logfile:
+        log_utils.log_message(
+            "Level test",
+            log_category,
+            configs=configs,
+            handler=mock_logger
+        )
+        assert mock_output_logfile.call_args[0][2] == expected_level
+
+def test_validate_colors() -> None:
+    """
+    Test that `log_utils._validate_colors()` builds and caches a validated color table.
+
+    This test ensures that:
+    - Entries that are not ANSI escape codes are replaced with the `RESET` code.
+    - The same palette returns the cached table on subsequent calls.
+    - Mutating the palette in place rebuilds the table.
+
+    Returns:
+        None: This function does not return a value. It asserts the validated colors and cache reuse.
+    """
+
+    colors = {
+        "INFO": "\033[97m",
+        "BROKEN": "not-a-color",
+        "RESET": "\033[0m"
+    }
+    table, reset = log_utils._validate_colors(colors)
+    assert reset == "\033[0m"
+    assert table["INFO"] == "\033[97m"
+    assert table["BROKEN"] == reset
+    assert table["info"] == table["INFO"]
+    assert table[environment.category.calls.id] == reset
+    assert log_utils._validate_colors(colors)[0] is table
+    colors["BROKEN"] = "\033[31m"
+    rebuilt, _ = log_utils._validate_colors(colors)
+    assert rebuilt is not table
+    assert rebuilt["BROKEN"] == "\033[31m"
+
+@pytest.mark.parametrize(
+    "message, expected", [
+        ("Test log entry", True),
+        ("  padded  ", True),
+        ("", False),
+        ("   ", False),
+        ("\n\t", False),
+    ]
+)
+def test_has_content(
+    message,
+    expected
+) -> None:
+    """
+    Test that `log_utils._has_content()` matches the `message.strip()` existence check.
+
+    Args:
+        message (str): The message to inspect.
+        expected (bool): Whether the message should be considered non-empty.
+
+    Returns:
+        None: This function does not return a value. It asserts that empty and whitespace-only messages are rejected.
+    """
+
+    assert log_utils._has_content(message) is expected
+    assert log_utils._has_content(message) is bool(message.strip())
+
 def test_output_logfile(
     mock_logger
 ) -> None:
@@ -175,8 +273,11 @@ def test_output_logfile(
             {"extra": "data"},
             separators=(',', ':')
         )
-        actual_call = mock_logger_info.call_args[0][0]
+        # Entries are logged lazily (%-style); render them the way the handler would
+        log_format, *log_args = mock_logger_info.call_args[0]
+        actual_call = log_format % tuple(log_args)
         # print("DEBUG: Actual logged message ->", actual_call)  # Debug output
+        assert actual_call.split("\n", 1)[0] == expected_message
         actual_json = actual_call.split("\n", 1)[-1]
         assert json.loads(actual_json) == json.loads(expected_json)
 
@@ -235,7 +336,7 @@ def test_output_console(
     # Backup CONFIGS and restore it after test
     original_configs = json.loads(json.dumps(CONFIGS))
     # Ensure tracing is disabled
-    sys.settrace(None)
+    trace_utils.stop_tracing()
     CONFIGS["tracing"]["enable"] = False  # Ensure tracing is off
     CONFIGS["tracing"]["json"]["compressed"] = compressed_setting
     try:
@@ -251,12 +352,15 @@ def test_output_console(
             ansi_escape = re.compile(
                 r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])'
             )
-            log_messages = [ansi_escape.sub('', call) for call in actual_calls if "Console log test" in call]
-            assert log_messages, f'Expected log message not found: {actual_calls}'
-            assert log_messages[0] == "Console log test", f'Expected:\nConsole log test\nGot:\n{log_messages[0]}'
+            # Message and JSON payload are emitted together in a single print call
+            assert len(actual_calls) == 1, f'Expected a single console write, got: {actual_calls}'
+            log_lines = ansi_escape.sub('', actual_calls[0]).split("\n", 1)
+            assert log_lines[0] == "Console log test", f'Expected:\nConsole log test\nGot:\n{log_lines[0]}'
             if expect_json:
-                assert expected_format in actual_calls, f'Expected JSON:\n{expected_format}\nGot:\n{actual_calls}'
+                assert log_lines[1] == expected_format, f'Expected JSON:\n{expected_format}\nGot:\n{log_lines[1]}'
+            else:
+                assert len(log_lines) == 1, f'Unexpected JSON output: {log_lines}'
     finally:
         # Restore CONFIGS after the test
         CONFIGS = original_configs
-        sys.settrace(None)  # Ensure tracing remains off
+        trace_utils.stop_tracing()  # Ensure tracing remains off
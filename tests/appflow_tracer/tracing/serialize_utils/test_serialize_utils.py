@@ -46,6 +46,7 @@ import os
 import json
 import pytest
 
+from collections import OrderedDict
 from pathlib import Path
 
 # Ensure the root project directory is in sys.path
@@ -83,45 +84,119 @@ def test_safe_serialize() -> None:
         {"key": "value"},
         configs=CONFIGS
     )
-    assert result["success"] is True
+    assert isinstance(result, serialize_utils.SerializeResult)
+    assert result.success is True
     assert json.loads(
-        result["serialized"]
+        result.serialized
     ) == {"key": "value"}
-    assert result["type"] == "dict"
+    assert result.type == "dict"
+    assert result.error is None
 
     result_verbose = serialize_utils.safe_serialize(
         {"key": "value"},
         configs=CONFIGS,
         verbose=True
     )
-    assert result_verbose["success"] is True
+    assert result_verbose.success is True
     assert json.loads(
-        result_verbose["serialized"]
+        result_verbose.serialized
     ) == {"key": "value"}
-    assert result_verbose["type"] == "dict"
+    assert result_verbose.type == "dict"
 
     # Test primitive data types
     assert serialize_utils.safe_serialize(
         123,
         configs=CONFIGS
-    )["serialized"] == "123"
+    ).serialized == "123"
     assert json.loads(
         serialize_utils.safe_serialize(
             [1, 2, 3],
             configs=CONFIGS
-        )["serialized"]
+        ).serialized
     ) == [1, 2, 3]
 
+    # Test scalar fast path matches the JSON encoder
+    for value in (None, True, False, 0, -7, 2**70, 1.5, 1e-300):
+        result_scalar = serialize_utils.safe_serialize(
+            value,
+            configs=CONFIGS
+        )
+        assert result_scalar.success is True
+        assert result_scalar.serialized == json.dumps(value)
+        assert result_scalar.type == type(value).__name__
+
+    # Test built-in subclasses are still serialized natively
+    result_subclass = serialize_utils.safe_serialize(
+        OrderedDict(key="value"),
+        configs=CONFIGS
+    )
+    assert result_subclass.success is True
+    assert json.loads(
+        result_subclass.serialized
+    ) == {"key": "value"}
+
     # Test handling of non-serializable objects
     result_unserializable = serialize_utils.safe_serialize(
         object(),
         configs=CONFIGS
     )
     # print("DEBUG: serialize_utils.safe_serialize(object()) ->", result_unserializable)
-    assert result_unserializable["success"] is False
-    assert result_unserializable["serialized"] == "[Unserializable data]"
-    assert "error" in result_unserializable
-    assert result_unserializable["type"] == "object"
+    assert result_unserializable.success is False
+    assert result_unserializable.serialized == "[Unserializable data]"
+    assert result_unserializable.error
+    assert result_unserializable.type == "object"
+
+    # Test custom objects fall back to their attributes
+    class Sample:
+        def __init__(self):
+            self.name = "sample"
+            self.size = 3
+    result_attributes = serialize_utils.safe_serialize(
+        Sample(),
+        configs=CONFIGS
+    )
+    assert result_attributes.success is False
+    assert json.loads(
+        result_attributes.serialized
+    ) == {"name": "sample", "size": "3"}
+    assert result_attributes.type == "Sample"
+
+    # Test iterators are materialized into a list
+    result_iterator = serialize_utils.safe_serialize(
+        iter([1, 2]),
+        configs=CONFIGS
+    )
+    assert result_iterator.type == "iterator"
+    assert json.loads(
+        result_iterator.serialized
+    ) == [1, 2]
+
+def test_json_dumps() -> None:
+    """
+    Ensure `serialize_utils.json_dumps()` produces consistent JSON with or without `orjson`.
+
+    This test verifies:
+    - Compact output contains no whitespace separators.
+    - Indented output honors the requested indentation.
+    - Unicode characters are preserved (not escaped).
+    - The `default` encoder is applied to unsupported types.
+
+    Returns:
+        None: This test function does not return a value. It asserts that the encoded JSON strings are correct.
+    """
+
+    data = {"key": "välue", "items": [1, 2]}
+    assert serialize_utils.json_dumps(data) == '{"key":"välue","items":[1,2]}'
+    assert serialize_utils.json_dumps(
+        data,
+        indent=4
+    ) == json.dumps(data, indent=4, ensure_ascii=False)
+    assert serialize_utils.json_dumps(
+        {"path": Path("/tmp")},
+        default=str
+    ) == '{"path":"/tmp"}'
+    with pytest.raises(TypeError):
+        serialize_utils.json_dumps({"obj": object()})
 
 def test_sanitize_token_string() -> None:
     """
@@ -152,3 +227,46 @@ def test_sanitize_token_string() -> None:
         "# full line comment"
     ) == ""
     assert serialize_utils.sanitize_token_string("") == ""
+    assert serialize_utils.sanitize_token_string(
+        "value = compute(1, 2)"
+    ) == "value = compute(1, 2)"
+    assert serialize_utils.sanitize_token_string(
+        'x = "a # b"  # c'
+    ) == 'x = "a # b"'
+    assert serialize_utils.sanitize_token_string(
+        "note = 'it\\'s # here'  # trailing"
+    ) == "note = 'it\\'s # here'"
+    assert serialize_utils.sanitize_token_string(
+        'tag = "#hash"'
+    ) == 'tag = "#hash"'
+    # Inner spacing is kept as written on every path (no token re-joining)
+    assert serialize_utils.sanitize_token_string(
+        "total  =  a+b  # sum"
+    ) == "total  =  a+b"
+    assert serialize_utils.sanitize_token_string(
+        "msg = 'x'  +  y  # concat"
+    ) == "msg = 'x'  +  y"
+
+def test_sanitize_token_string_cache() -> None:
+    """
+    Ensure `serialize_utils.sanitize_token_string()` caches results for repeated lines.
+
+    This test checks:
+    - Repeated calls with the same line are served from the cache.
+    - `cache_clear()` resets the cache statistics.
+
+    Returns:
+        None: This test function does not return a value. It validates the caching behavior of the sanitizer.
+    """
+
+    serialize_utils.sanitize_token_string.cache_clear()
+    line = 'label = "# not a comment"  # trailing comment'
+    first = serialize_utils.sanitize_token_string(line)
+    hits_before = serialize_utils.sanitize_token_string.cache_info().hits
+    second = serialize_utils.sanitize_token_string(line)
+    hits_after = serialize_utils.sanitize_token_string.cache_info().hits
+    assert first == second == 'label = "# not a comment"'
+    assert hits_after > hits_before
+
+    serialize_utils.sanitize_token_string.cache_clear()
+    assert serialize_utils.sanitize_token_string.cache_info().hits == 0
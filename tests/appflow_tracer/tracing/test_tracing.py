@@ -19,7 +19,16 @@ It ensures that tracing, logging, and ANSI handling functions operate correctly.
        - Ensures `tracing.PrintCapture` properly captures and logs print statements.
        - Simulates `sys.stdout.write()` to verify expected output.
 
-    3. **`test_ansi_file_handler()`**
+    3. **`test_cached_configs()`**
+       - Ensures `tracing.cached_configs()` reuses parsed configs until their JSON file changes.
+
+    4. **`test_setup_logging_keeps_handlers()`**
+       - Ensures a repeated `tracing.setup_logging()` call for the same log file keeps the running listener.
+
+    5. **`test_print_logged()`**
+       - Ensures `tracing.print_logged()` joins print arguments into a single `logger.info()` message.
+
+    6. **`test_ansi_file_handler()`**
        - Ensures `tracing.ANSIFileHandler` removes ANSI escape sequences before writing logs.
        - Uses a helper function `remove_ansi()` to strip escape codes before emitting logs.
 
@@ -36,8 +45,14 @@ import os
 import json
 import logging
 import pytest
+import queue
 import re
 
+from logging.handlers import (
+    QueueHandler,
+    QueueListener
+)
+
 from datetime import (
     datetime,
     timezone
@@ -177,6 +192,7 @@ def test_print_capture(
     This test ensures:
     - The `PrintCapture` handler captures print statements directed to `sys.stdout`.
     - Validates that the captured output is logged as expected.
+    - Verifies `flush()` flushes the real stdout rather than the handler's own stream.
 
     Args:
         mock_logger (MagicMock): Mock logger used to verify the captured logs.
@@ -209,6 +225,98 @@ def test_print_capture(
             call[0][0] for call in mock_stdout.call_args_list
         )
         assert expected_output.strip() in captured_output.strip()
+    # The handler's own emit() writes the formatted record to the real stdout
+    handler._stdout_write = MagicMock()
+    handler._stdout_flush = MagicMock()
+    handler.emit(record)
+    handler._stdout_write.assert_called_once_with("Test message\n")
+    handler._stdout_flush.assert_called_once()
+    # flush() targets the real stdout, never the (possibly closed) stream captured at construction
+    handler.stream = MagicMock()
+    handler.stream.flush.side_effect = ValueError("I/O operation on closed file.")
+    handler.flush()
+    assert handler._stdout_flush.call_count == 2
+
+def test_cached_configs(
+    tmp_path: Path
+) -> None:
+    """
+    Ensure `tracing.cached_configs()` reuses parsed configs until the config file changes.
+
+    This test ensures:
+    - A second call with the same arguments does not call `pkgconfig.setup_configs()` again.
+    - Each call returns an independent copy of the configuration.
+    - Modifying the JSON file on disk invalidates the cached entry.
+
+    Args:
+        tmp_path (Path): Temporary directory provided by pytest for the module and its config file.
+
+    Returns:
+        None: This test does not return a value but asserts how often the configuration is loaded.
+    """
+
+    module_path = tmp_path / "module.py"
+    config_file = tmp_path / "module.json"
+    config_file.write_text("{}")
+    with patch.object(tracing.pkgconfig, "setup_configs", return_value={"logging": {}}) as mock_setup, \
+         patch.dict(tracing.CONFIG_CACHE, clear=True):
+        first = tracing.cached_configs(module_path, "module", ["call"])
+        first["logging"]["changed"] = True
+        second = tracing.cached_configs(module_path, "module", ["call"])
+        assert mock_setup.call_count == 1
+        assert second == {"logging": {}}
+        os.utime(config_file, ns=(0, 0))  # Simulate an edit on disk
+        tracing.cached_configs(module_path, "module", ["call"])
+        assert mock_setup.call_count == 2
+
+def test_setup_logging_keeps_handlers() -> None:
+    """
+    Ensure repeated `tracing.setup_logging()` calls for the same log file keep the running listener.
+
+    This test ensures:
+    - The module-level call's `QueueListener` (and its open file handler) is reused, not restarted.
+    - The logger still has exactly one `QueueHandler` attached afterwards.
+
+    Returns:
+        None: This test does not return a value but asserts the listener and handlers are unchanged.
+    """
+
+    logger_name = f'{CONFIGS["logging"]["package_name"]}.{CONFIGS["logging"]["module_name"]}'
+    listener = tracing.LISTENERS[logger_name]
+    handlers = list(logging.getLogger(logger_name).handlers)
+    with patch.object(tracing, "stop_logging") as mock_stop:
+        tracing.setup_logging(
+            logname_override='logs/tests/test_tracing.log'
+        )
+    mock_stop.assert_not_called()
+    assert tracing.LISTENERS[logger_name] is listener
+    assert logging.getLogger(logger_name).handlers == handlers
+
+def test_print_logged() -> None:
+    """
+    Ensure `tracing.print_logged()` routes print-style arguments to the global logger.
+
+    `setup_logging()` binds `logger.info` once, so the test patches that binding
+    (`tracing._log_info`) rather than `tracing.logger`.
+
+    This test ensures:
+    - Arguments are converted with `str()` and joined with the default (or given) separator.
+    - `print()`-only keywords (`end`, `file`, `flush`) are accepted without affecting the logged message.
+
+    Returns:
+        None: This test does not return a value but asserts the messages handed to `logger.info()`.
+    """
+
+    assert tracing._log_info == tracing.logger.info  # Bound by the module-level setup_logging() call
+    with patch.object(tracing, "_log_info") as mock_info:
+        tracing.print_logged("Tracing", 1, None)
+        tracing.print_logged("a", "b", sep="-", end="", file=sys.stderr, flush=True)
+        tracing.print_logged("x", "y", sep=None)
+    assert [call.args[0] for call in mock_info.call_args_list] == [
+        "Tracing 1 None",
+        "a-b",
+        "x y"
+    ]
 
 def test_ansi_file_handler(
     mock_logger: MagicMock
@@ -284,3 +392,170 @@ def test_ansi_file_handler(
         ]
         assert any("Error message" in call for call in write_calls)
         assert all("\033[31m" not in call for call in write_calls)
+
+def test_stop_logging() -> None:
+    """
+    Ensure `tracing.stop_logging()` drains queued records and stops the background listener.
+
+    This test:
+    - Registers a `QueueListener` that owns a `MagicMock` handler.
+    - Enqueues a record and verifies it is handled once the listener is stopped.
+    - Ensures the listener is removed from `tracing.LISTENERS` and its handler is closed.
+
+    Returns:
+        None: This test does not return a value but asserts that pending records are flushed on shutdown.
+    """
+
+    log_queue = queue.SimpleQueue()
+    handler = MagicMock()
+    handler.level = logging.NOTSET
+    listener = QueueListener(
+        log_queue,
+        handler,
+        respect_handler_level=True
+    )
+    tracing.LISTENERS["tests.stop_logging"] = listener
+    listener.start()
+    QueueHandler(log_queue).emit(
+        logging.LogRecord(
+            name="tests.stop_logging",
+            level=logging.INFO,
+            pathname="",
+            lineno=0,
+            msg="Queued message",
+            args=(),
+            exc_info=None
+        )
+    )
+    tracing.stop_logging("tests.stop_logging")
+    assert "tests.stop_logging" not in tracing.LISTENERS
+    handler.handle.assert_called_once()
+    handler.close.assert_called_once_with()
+
+def test_ansi_file_handler_buffering(
+    tmp_path: Path
+) -> None:
+    """
+    Ensure `tracing.ANSIFileHandler` buffers records and writes them on `flush()`.
+
+    This test:
+    - Emits a record and verifies it is held in the stream buffer rather than flushed per record.
+    - Verifies `flush()` writes the buffered record to the log file synchronously.
+    - Verifies a record emitted after `flush_interval` has elapsed flushes the buffer.
+
+    Args:
+        tmp_path (Path): Temporary directory provided by pytest for the log file.
+
+    Returns:
+        None: This test does not return a value but asserts that log writes are batched.
+    """
+
+    log_file = tmp_path / "buffered.log"
+    handler = tracing.ANSIFileHandler(
+        log_file,
+        mode="w"
+    )
+    handler.flush_interval = 60  # Keep emit() from flushing during the test
+    handler.setFormatter(
+        logging.Formatter("%(message)s")
+    )
+
+    def record(message: str) -> logging.LogRecord:
+        return logging.LogRecord(
+            name="test",
+            level=logging.INFO,
+            pathname="",
+            lineno=0,
+            msg=message,
+            args=(),
+            exc_info=None
+        )
+
+    handler.emit(record("Buffered message"))
+    assert log_file.read_text() == ""
+    handler.flush()
+    assert log_file.read_text() == "Buffered message\n"
+    handler.flush_interval = 0  # Every record is now past the interval
+    handler.emit(record("Timed message"))
+    assert log_file.read_text() == "Buffered message\nTimed message\n"
+    handler.close()
+
+def test_flushing_queue_listener() -> None:
+    """
+    Ensure `tracing.FlushingQueueListener` flushes its handlers once its queue drains.
+
+    This test:
+    - Handles a record while another is still queued and verifies no flush happens.
+    - Handles the last queued record and verifies every handler is flushed.
+
+    Returns:
+        None: This test does not return a value but asserts that bursts end with a flush.
+    """
+
+    log_queue = queue.SimpleQueue()
+    handler = MagicMock()
+    handler.level = logging.NOTSET
+    listener = tracing.FlushingQueueListener(
+        log_queue,
+        handler
+    )
+    record = logging.LogRecord(
+        name="test",
+        level=logging.INFO,
+        pathname="",
+        lineno=0,
+        msg="Queued message",
+        args=(),
+        exc_info=None
+    )
+
+    log_queue.put(record)  # One more record pending: the burst is not over
+    listener.handle(record)
+    handler.handle.assert_called_once_with(record)
+    handler.flush.assert_not_called()
+    listener.handle(log_queue.get())  # Queue is now empty
+    handler.flush.assert_called_once_with()
+
+def test_ansi_file_handler_skips_logging_internals(
+    tmp_path: Path
+) -> None:
+    """
+    Ensure `tracing.ANSIFileHandler` drops records raised from `logging/__init__.py` only.
+
+    This test:
+    - Emits a record whose path is the logging module's `__init__.py` and verifies it is skipped.
+    - Emits a record from another package's `__init__.py` and verifies it is still written.
+
+    Args:
+        tmp_path (Path): Temporary directory provided by pytest for the log file.
+
+    Returns:
+        None: This test does not return a value but asserts which records reach the log file.
+    """
+
+    log_file = tmp_path / "filtered.log"
+    handler = tracing.ANSIFileHandler(
+        log_file,
+        mode="w"
+    )
+    handler.setFormatter(
+        logging.Formatter("%(message)s")
+    )
+    for pathname, message in (
+        (logging.__file__, "Internal message"),
+        (os.path.join("package", "__init__.py"), "Package message")
+    ):
+        handler.emit(
+            logging.LogRecord(
+                name="test",
+                level=logging.INFO,
+                pathname=pathname,
+                lineno=0,
+                msg=message,
+                args=(),
+                exc_info=None
+            )
+        )
+    handler.flush()
+    assert log_file.read_text() == "Package message\n"
+    handler.close()
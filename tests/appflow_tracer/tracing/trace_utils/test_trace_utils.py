@@ -17,8 +17,9 @@ It ensures correct function execution tracing and structured logging, covering:
 ## Use Cases:
     1. **Validate `trace_utils.start_tracing()` activation**
        - Ensures tracing starts **only when enabled** in the configuration.
-       - Prevents redundant activations by checking `sys.gettrace()`.
-       - Verifies that `sys.settrace()` is correctly called.
+       - Prevents redundant activations by checking `trace_utils.tracing_active()`.
+       - Verifies that PEP 669 monitoring is preferred, with `sys.setprofile()` as the fallback.
+       - Confirms `trace_utils.monitor_events()` reports project calls/returns from the tracing thread only.
 
     2. **Ensure `trace_utils.trace_all()` generates a valid trace function**
        - Confirms the trace function **properly processes events** (calls and returns).
@@ -36,7 +37,7 @@ It ensures correct function execution tracing and structured logging, covering:
        - Validates that primitive types and complex objects are handled correctly.
 
 ## Improvements Implemented:
-    - **Mocking of `sys.settrace()`** to avoid real tracing activation.
+    - **Mocking of `sys.setprofile()` and `trace_utils.monitor_events()`** to avoid real tracing activation.
     - **Ensuring `CONFIGS` are respected** when enabling tracing.
     - **Patching of logging utilities** to isolate logs per test.
 
@@ -48,13 +49,16 @@ It ensures correct function execution tracing and structured logging, covering:
 """
 
 import sys
+import argparse
 import os
 
 import json
 import logging
+import threading
 import pytest
 
 from unittest.mock import (
+    ANY,
     patch,
     MagicMock
 )
@@ -69,7 +73,11 @@ if str(ROOT_DIR) not in sys.path:
 from lib.system_variables import category
 
 from packages.appflow_tracer import tracing
-from packages.appflow_tracer.lib import trace_utils
+from packages.appflow_tracer.lib import (
+    log_utils,
+    serialize_utils,
+    trace_utils
+)
 
 CONFIGS = tracing.setup_logging(
     logname_override='logs/tests/test_serialize_utils.log'
@@ -115,9 +123,7 @@ def mock_configs() -> dict:
         "logging": {"enable": True}
     }
 
-@patch("sys.settrace")
 def test_start_tracing(
-    mock_settrace: MagicMock,
     mock_logger: MagicMock,
     mock_configs: dict
 ) -> None:
@@ -125,12 +131,11 @@ def test_start_tracing(
     Ensure `trace_utils.start_tracing()` initializes tracing only when enabled.
 
     This test ensures:
-    - `sys.settrace()` is called only when tracing is enabled in `CONFIGS`.
-    - Prevents multiple activations by checking `sys.gettrace()` before applying tracing.
+    - `sys.setprofile()` is called only when tracing is enabled in `CONFIGS` (PEP 669 monitoring unavailable).
+    - Prevents multiple activations by checking `trace_utils.tracing_active()` before applying tracing.
     - Verifies that tracing is correctly configured via `CONFIGS`.
 
     Args:
-        mock_settrace (MagicMock): Mock for `sys.settrace()` to verify it is called or not.
         mock_logger (MagicMock): Mock logger for tracing output.
         mock_configs (dict): Mock configuration for tracing settings.
 
@@ -138,27 +143,170 @@ def test_start_tracing(
         None: This test function does not return a value. It verifies that tracing is activated correctly.
     """
 
-    sys.settrace(None)  # Reset trace before running the test
-    trace_utils.start_tracing(
-        logger=mock_logger,
-        configs=mock_configs
-    )
-    mock_settrace.assert_called_once()
+    trace_utils.stop_tracing()  # Reset trace before running the test
+    with patch.object(trace_utils, "_MONITORING", None), patch("sys.setprofile") as mock_setprofile:
+        trace_utils.start_tracing(
+            logger=mock_logger,
+            configs=mock_configs
+        )
+    mock_setprofile.assert_called_once()
+
+@pytest.mark.skipif(not hasattr(sys, "monitoring"), reason="PEP 669 monitoring requires Python 3.12+")
+def test_start_tracing_monitoring(
+    mock_logger: MagicMock,
+    mock_configs: dict
+) -> None:
+    """
+    Ensure `trace_utils.start_tracing()` prefers PEP 669 monitoring over `sys.setprofile()`.
+
+    This test ensures:
+    - `trace_utils.monitor_events()` receives the trace function when `sys.monitoring` is available.
+    - `sys.setprofile()` is not installed alongside it.
 
-@patch("sys.settrace")
+    Args:
+        mock_logger (MagicMock): Mock logger for tracing output.
+        mock_configs (dict): Mock configuration for tracing settings.
+
+    Returns:
+        None: This test function does not return a value. It verifies which tracing backend is selected.
+    """
+
+    trace_utils.stop_tracing()  # Reset trace before running the test
+    with patch.object(trace_utils, "monitor_events") as mock_monitor, patch("sys.setprofile") as mock_setprofile:
+        trace_utils.start_tracing(
+            logger=mock_logger,
+            configs=mock_configs
+        )
+    mock_monitor.assert_called_once()
+    mock_setprofile.assert_not_called()
+
+@pytest.mark.skipif(not hasattr(sys, "monitoring"), reason="PEP 669 monitoring requires Python 3.12+")
+def test_monitor_events() -> None:
+    """
+    Ensure `trace_utils.monitor_events()` delivers profile-style events for project code.
+
+    This test ensures:
+    - Calls and returns (including generator resumes/yields and exception exits) reach the trace function
+      as `(frame, event, arg)`, where `frame` is the monitored function's own frame.
+    - Non-project code and other threads never reach the trace function.
+    - `trace_utils.tracing_active()` reports the monitoring tool until `trace_utils.stop_tracing()` frees it.
+
+    Returns:
+        None: This test function does not return a value. It asserts the recorded events.
+    """
+
+    def doubled(value: int) -> int:
+        return value * 2
+
+    def counter() -> object:
+        yield 1
+
+    def failing() -> None:
+        raise ValueError("expected")
+
+    recorded = []
+
+    def record(frame, event, arg) -> None:
+        if frame.f_code.co_name in ("doubled", "counter", "failing"):
+            recorded.append((frame.f_code.co_name, event, arg))
+
+    trace_utils.stop_tracing()  # Reset trace before running the test
+    trace_utils.monitor_events(record)
+    try:
+        assert trace_utils.tracing_active()
+        doubled(2)
+        list(counter())
+        suspended = counter()
+        next(suspended)
+        suspended.close()  # Throws GeneratorExit into the suspended generator
+        try:
+            failing()
+        except ValueError:
+            pass
+        json.dumps({"key": "value"})  # Non-project code
+        worker = threading.Thread(target=doubled, args=(5,))
+        worker.start()
+        worker.join()
+    finally:
+        trace_utils.stop_tracing()
+    assert not trace_utils.tracing_active()
+    assert recorded == [
+        ("doubled", "call", None),
+        ("doubled", "return", 4),
+        ("counter", "call", None),
+        ("counter", "return", 1),
+        ("counter", "call", None),
+        ("counter", "return", None),
+        ("counter", "call", None),
+        ("counter", "return", 1),
+        ("counter", "call", ANY),
+        ("counter", "return", None),
+        ("failing", "call", None),
+        ("failing", "return", None)
+    ]
+
+@pytest.mark.skipif(not hasattr(sys, "monitoring"), reason="PEP 669 monitoring requires Python 3.12+")
+def test_monitor_events_symlinked_project(
+    tmp_path: Path
+) -> None:
+    """
+    Ensure `trace_utils.monitor_events()` keeps tracing project code reached through a symlink.
+
+    This test ensures:
+    - A code object whose filename lives under a symlink to the project root does not match the
+      resolved project-root prefix, yet still reaches the trace function (instead of being disabled).
+    - Pseudo-files such as `<frozen ...>` are not resolved against the working directory and stay untraced.
+
+    Args:
+        tmp_path (Path): Temporary directory provided by pytest for the symlink.
+
+    Returns:
+        None: This test function does not return a value. It asserts the recorded events.
+    """
+
+    link = tmp_path / "checkout"
+    try:
+        link.symlink_to(trace_utils.project_root, target_is_directory=True)
+    except OSError:
+        pytest.skip("Symlinks are not supported on this platform")
+    namespace = {}
+    exec(
+        compile("def linked(value):\n    return value + 1\n", str(link / "linked.py"), "exec"),
+        namespace
+    )
+    exec(
+        compile("def frozen(value):\n    return value\n", "<frozen linked>", "exec"),
+        namespace
+    )
+    recorded = []
+
+    def record(frame, event, arg) -> None:
+        if frame.f_code.co_name in ("linked", "frozen"):
+            recorded.append((event, arg))
+
+    trace_utils.stop_tracing()  # Reset trace before running the test
+    trace_utils.monitor_events(record)
+    try:
+        namespace["linked"](1)
+        namespace["frozen"](1)
+    finally:
+        trace_utils.stop_tracing()
+    assert recorded == [("call", None), ("return", 2)]
+
+@patch("sys.setprofile")
 def test_start_tracing_disabled(
-    mock_settrace: MagicMock,
+    mock_setprofile: MagicMock,
     mock_logger: MagicMock
 ) -> None:
     """
     Ensure `trace_utils.start_tracing()` does not initialize tracing when disabled.
 
     This test ensures:
-    - `sys.settrace()` is **not called** when tracing is disabled in `CONFIGS`.
+    - `sys.setprofile()` is **not called** when tracing is disabled in `CONFIGS`.
     - Verifies that `trace_utils.start_tracing()` respects the configuration settings.
 
     Args:
-        mock_settrace (MagicMock): Mock for `sys.settrace()` to ensure it's not called.
+        mock_setprofile (MagicMock): Mock for `sys.setprofile()` to ensure it's not called.
         mock_logger (MagicMock): Mock logger for testing.
 
     Returns:
@@ -174,7 +322,7 @@ def test_start_tracing_disabled(
         logger=mock_logger,
         configs=mock_configs
     )
-    mock_settrace.assert_not_called()
+    mock_setprofile.assert_not_called()
 
 @patch("packages.appflow_tracer.lib.trace_utils.trace_all")
 def test_trace_all(
@@ -215,8 +363,8 @@ def test_trace_all(
 )
 @patch("packages.appflow_tracer.lib.log_utils.log_message")
 def test_call_events(
-    mock_is_project_file: MagicMock,
     mock_log_message: MagicMock,
+    mock_is_project_file: MagicMock,
     mock_logger: MagicMock,
     mock_configs: dict
 ) -> None:
@@ -247,7 +395,13 @@ def test_call_events(
     }
     frame_mock = MagicMock()
     frame_mock.f_code.co_name = "test_function"
+    frame_mock.f_code.co_filename = __file__
+    frame_mock.f_code.co_varnames = ()
+    frame_mock.f_code.co_argcount = 0
+    frame_mock.f_code.co_kwonlyargcount = 0
     frame_mock.f_back.f_code.co_name = "caller_function"
+    frame_mock.f_back.f_code.co_filename = __file__
+    frame_mock.f_back.f_lineno = 1
     frame_mock.f_globals.get.return_value = os.path.join(
         CONFIGS["logging"]["logs_dirname"],
         "test_file.py"
@@ -268,8 +422,8 @@ def test_call_events(
 )
 @patch("packages.appflow_tracer.lib.log_utils.log_message")
 def test_return_events(
-    mock_is_project_file: MagicMock,
     mock_log_message: MagicMock,
+    mock_is_project_file: MagicMock,
     mock_logger: MagicMock,
     mock_configs: dict
 ) -> None:
@@ -299,6 +453,8 @@ def test_return_events(
     }
     frame_mock = MagicMock()
     frame_mock.f_code.co_name = "test_function"
+    frame_mock.f_code.co_filename = __file__
+    frame_mock.f_lineno = 1
     frame_mock.f_globals.get.return_value = os.path.join(
         CONFIGS["logging"]["logs_dirname"],
         "test_file.py"
@@ -312,3 +468,304 @@ def test_return_events(
     )
     # Ensure log_message was called
     assert mock_log_message.called, "Expected log_message() to be called, but it wasn't."
+
+def test_coerce() -> None:
+    """
+    Ensure `trace_utils._coerce()` matches a `json.loads(json.dumps(..., default=str))` round-trip.
+
+    This test:
+    - Verifies nested containers, tuples, and non-string keys are converted like the JSON round-trip.
+    - Ensures boolean, `None` and float keys use their JSON spelling rather than `str()`.
+    - Ensures unsupported objects are stringified.
+    - Confirms unsupported keys raise a `TypeError` and circular references raise a `ValueError`.
+
+    Returns:
+        None: This test function does not return a value. It validates the converted argument data.
+    """
+
+    data = {
+        "path": Path("/tmp"),
+        "items": (1, 2.5, None, True),
+        "nested": {"key": [Path("/var"), {"deep": "value"}]},
+        3: "numeric key",
+        True: "boolean key",
+        None: "null key",
+        float("inf"): "float key"
+    }
+    expected = json.loads(json.dumps(data, default=str))
+    assert trace_utils._coerce(data) == expected
+    assert {"true", "null", "Infinity"} <= trace_utils._coerce(data).keys()
+
+    with pytest.raises(TypeError):
+        json.dumps({(1, 2): "tuple key"}, default=str)
+    with pytest.raises(TypeError):
+        trace_utils._coerce({(1, 2): "tuple key"})
+
+    circular = []
+    circular.append(circular)
+    with pytest.raises(ValueError):
+        trace_utils._coerce(circular)
+
+@patch("packages.appflow_tracer.lib.serialize_utils.safe_serialize")
+@patch("packages.appflow_tracer.lib.log_utils.log_message")
+def test_events_disabled(
+    mock_log_message: MagicMock,
+    mock_safe_serialize: MagicMock,
+    mock_logger: MagicMock,
+    mock_configs: dict
+) -> None:
+    """
+    Ensure `trace_utils.call_events()` and `trace_utils.return_events()` exit early when their events are disabled.
+
+    Args:
+        mock_log_message (MagicMock): Mock for the `log_message()` function.
+        mock_safe_serialize (MagicMock): Mock for `safe_serialize()` to confirm no serialization happens.
+        mock_logger (MagicMock): Mock logger for tracing output.
+        mock_configs (dict): Mock configuration for tracing and logging settings.
+
+    Returns:
+        None: This test function does not return a value. It validates that disabled events do no work.
+    """
+
+    mock_configs["events"] = {
+        category.calls.id.lower(): False,
+        category.returns.id.lower(): False
+    }
+    frame_mock = MagicMock()
+    trace_utils.call_events(
+        mock_logger,
+        frame_mock,
+        "test_file.py",
+        None,
+        mock_configs
+    )
+    trace_utils.return_events(
+        mock_logger,
+        frame_mock,
+        "test_file.py",
+        "return_value",
+        mock_configs
+    )
+    mock_log_message.assert_not_called()
+    mock_safe_serialize.assert_not_called()
+    mock_logger.error.assert_not_called()
+
+@patch("packages.appflow_tracer.lib.log_utils.log_message")
+def test_call_events_arguments(
+    mock_log_message: MagicMock,
+    mock_logger: MagicMock,
+    mock_configs: dict
+) -> None:
+    """
+    Ensure `trace_utils.call_events()` logs the same named arguments `inspect.getargvalues()` reports.
+
+    Args:
+        mock_log_message (MagicMock): Mock for the `log_message()` function.
+        mock_logger (MagicMock): Mock logger for tracing output.
+        mock_configs (dict): Mock configuration for tracing and logging settings.
+
+    Returns:
+        None: This test function does not return a value. It validates positional and keyword-only arguments are logged.
+    """
+
+    mock_configs["events"] = {category.calls.id.lower(): True}
+
+    def callee(first, second=2, *extra, third, **options):
+        local_value = "ignored"
+        return sys._getframe()
+
+    frame = callee(1, 2, 3, third=Path("/tmp"), flag=True)
+    trace_utils.call_events(
+        mock_logger,
+        frame,
+        frame.f_code.co_filename,
+        None,
+        mock_configs
+    )
+    mock_logger.error.assert_not_called()
+    assert mock_log_message.call_args.kwargs["json_data"] == {"first": 1, "second": 2, "third": "/tmp"}
+
+def test_relative_name() -> None:
+    """
+    Ensure `trace_utils._relative_name()` returns an interned, cached project-relative filename.
+
+    This test:
+    - Resolves the current file into its project-relative name.
+    - Confirms repeated lookups return the very same (interned) string object from the cache.
+
+    Returns:
+        None: This test function does not return a value. It validates the interned relative filename.
+    """
+
+    filename = sys._getframe().f_code.co_filename
+    relative = trace_utils._relative_name(filename)
+    assert relative == "tests/appflow_tracer/tracing/trace_utils/test_trace_utils"
+    assert relative is sys.intern("tests/appflow_tracer/tracing/trace_utils/test_trace_utils")
+    hits_before = trace_utils._relative_name.cache_info().hits
+    assert trace_utils._relative_name(filename) is relative
+    assert trace_utils._relative_name.cache_info().hits > hits_before
+
+def test_frame_context() -> None:
+    """
+    Ensure `trace_utils._frame_context()` returns the relative filename and sanitized source line, and caches them.
+
+    This test:
+    - Resolves the current frame's location into a relative path and its source line.
+    - Confirms repeated lookups for the same location are served from the cache.
+
+    Returns:
+        None: This test function does not return a value. It validates the cached frame context.
+    """
+
+    frame = sys._getframe()
+    filename, lineno = frame.f_code.co_filename, frame.f_lineno
+    relative, line = trace_utils._frame_context(filename, lineno)
+    assert relative == "tests/appflow_tracer/tracing/trace_utils/test_trace_utils"
+    assert "sys._getframe()" not in line and "f_lineno" in line
+    assert line == line.strip()  # Returned already sanitized
+    hits_before = trace_utils._frame_context.cache_info().hits
+    assert trace_utils._frame_context(filename, lineno) == (relative, line)
+    assert trace_utils._frame_context.cache_info().hits > hits_before
+
+def test_excluded_codes() -> None:
+    """
+    Ensure `trace_utils._excluded_codes()` matches the tracer's own helpers by code object, not by name.
+
+    This test:
+    - Confirms logging/serialization helpers and `logging.Handler.emit()` overrides are excluded.
+    - Confirms an unrelated function that happens to be named `emit` is still traced.
+
+    Returns:
+        None: This test function does not return a value. It validates the identity-based exclusion set.
+    """
+
+    def emit() -> None:
+        pass
+
+    excluded = trace_utils._excluded_codes()
+    assert log_utils.log_message.__code__ in excluded
+    assert serialize_utils.safe_serialize.__code__ in excluded
+    assert serialize_utils.sanitize_token_string.__wrapped__.__code__ in excluded
+    assert logging.StreamHandler.emit.__code__ in excluded
+    assert emit.__code__ not in excluded
+
+@pytest.mark.parametrize("monitoring", [True, False])
+def test_setup_frames_not_traced(
+    mock_logger: MagicMock,
+    monitoring: bool
+) -> None:
+    """
+    Ensure the frames that install the tracer do not report their returns.
+
+    This test ensures:
+    - `start_tracing()`, `monitor_events()` and the caller that installed the tracer (e.g. `tracing.setup_logging()`)
+      are already on the stack when tracing starts, yet none of their returns reach `return_events()`.
+    - Project functions called afterwards are still traced.
+
+    Args:
+        mock_logger (MagicMock): Mock logger for tracing output.
+        monitoring (bool): Use PEP 669 monitoring (when available) or `sys.setprofile()`.
+
+    Returns:
+        None: This test function does not return a value. It asserts which returns are reported.
+    """
+
+    if monitoring and not hasattr(sys, "monitoring"):
+        pytest.skip("PEP 669 monitoring requires Python 3.12+")
+    configs = {
+        "tracing": {"enable": True},
+        "logging": {"enable": True},
+        "events": {"call": False, "return": True}
+    }
+    returned = []
+
+    def installer() -> dict:
+        trace_utils.start_tracing(logger=mock_logger, configs=configs)
+        return configs
+
+    def doubled(value: int) -> int:
+        return value * 2
+
+    trace_utils.stop_tracing()  # Reset trace before running the test
+    with patch.object(trace_utils, "_MONITORING", trace_utils._MONITORING if monitoring else None), \
+         patch.object(trace_utils, "return_events", side_effect=lambda **kwargs: returned.append(kwargs["frame"].f_code.co_name)):
+        try:
+            installer()
+            doubled(2)
+        finally:
+            trace_utils.stop_tracing()
+    assert "doubled" in returned
+    assert not {"installer", "start_tracing", "monitor_events", "trace_all"} & set(returned)
+
+@patch("packages.appflow_tracer.lib.log_utils.log_message")
+def test_return_events_iterator(
+    mock_log_message: MagicMock,
+    mock_logger: MagicMock,
+    mock_configs: dict
+) -> None:
+    """
+    Ensure `trace_utils.return_events()` does not consume returned iterators.
+
+    Args:
+        mock_log_message (MagicMock): Mock for the `log_message()` function.
+        mock_logger (MagicMock): Mock logger for tracing output.
+        mock_configs (dict): Mock configuration for tracing and logging settings.
+
+    Returns:
+        None: This test function does not return a value. It validates that the traced return value is left intact.
+    """
+
+    mock_configs["events"] = {
+        category.calls.id.lower(): True,
+        category.returns.id.lower(): True
+    }
+    returned = iter([1, 2, 3])
+    trace_utils.return_events(
+        mock_logger,
+        sys._getframe(),
+        __file__,
+        returned,
+        mock_configs
+    )
+    assert mock_log_message.called, "Expected log_message() to be called, but it wasn't."
+    mock_logger.error.assert_not_called()
+    assert list(returned) == [1, 2, 3]
+
+@patch("packages.appflow_tracer.lib.log_utils.log_message")
+def test_return_events_values(
+    mock_log_message: MagicMock,
+    mock_logger: MagicMock,
+    mock_configs: dict
+) -> None:
+    """
+    Ensure `trace_utils.return_events()` logs scalars as-is and complex objects through their attributes.
+
+    Args:
+        mock_log_message (MagicMock): Mock for the `log_message()` function.
+        mock_logger (MagicMock): Mock logger for tracing output.
+        mock_configs (dict): Mock configuration for tracing and logging settings.
+
+    Returns:
+        None: This test function does not return a value. It validates the logged return data and message.
+    """
+
+    mock_configs["events"] = {category.returns.id.lower(): True}
+    namespace = argparse.Namespace(verbose=True)
+    for returned, expected, suffix in (
+        (None, None, "-> NoneType: None"),
+        (False, False, "-> bool: False"),
+        (42, 42, "-> int:"),
+        ("", "", "-> str:"),
+        (namespace, {"verbose": True}, "-> Namespace:")
+    ):
+        trace_utils.return_events(
+            mock_logger,
+            sys._getframe(),
+            __file__,
+            returned,
+            mock_configs
+        )
+        message = mock_log_message.call_args.args[0]
+        assert mock_log_message.call_args.kwargs["json_data"] == expected
+        assert message.endswith(suffix), message
+    mock_logger.error.assert_not_called()
@@ -49,6 +49,7 @@ These tests validate:
 | `detect_environment()`   | Identifies Python installation method.          | `brew`, `system`, or `standalone` |
 | `version(package)`       | Retrieves installed version of a package.       | Installed version (`str`) or `None` |
 | `latest_version(package)`| Retrieves latest available package version.     | Latest version (`str`) or `None` |
+| `prefetch_versions(pkgs)`| Batches installed/latest lookups into two calls. | Cached versions (`dict`) |
 
 ---
 ## **Mock Data Sources**
@@ -65,6 +66,7 @@ These tests validate:
 """
 
 import sys
+import json
 
 import pytest
 import subprocess
@@ -102,8 +104,9 @@ def test_check_availability_success():
     - Verify that `check_availability()` correctly detects when Homebrew is installed.
 
     **Test Strategy:**
+    - **Clear `lru_cache`** before execution to ensure fresh results.
     - **Mock `shutil.which()`** to return a valid `brew` path.
-    - **Mock `subprocess.run()`** to simulate a successful `brew --version` command.
+    - **Mock `subprocess.run()`** to ensure no `brew --version` process is started.
 
     **Expected Outcome:**
     - Returns `True` when Homebrew is detected.
@@ -112,9 +115,12 @@ def test_check_availability_success():
     - Homebrew is installed and accessible via `/usr/local/bin/brew`.
     """
 
+    brew_utils.check_availability.cache_clear()  # Clear cache BEFORE calling the function.
+
     with patch("shutil.which", return_value="/usr/local/bin/brew"), \
-         patch("subprocess.run", return_value=subprocess.CompletedProcess(args=[], returncode=0)):
+         patch("subprocess.run") as mock_run:
         assert brew_utils.check_availability() is True
+        mock_run.assert_not_called()
 
 # -----------------------------------------------------------------------------
 
@@ -316,3 +322,68 @@ def test_latest_version_failure():
 
     with patch("subprocess.run", side_effect=subprocess.CalledProcessError(1, "brew")):
         assert brew_utils.latest_version("nonexistent-package") is None
+
+# -----------------------------------------------------------------------------
+# Test: prefetch_versions(packages)
+# -----------------------------------------------------------------------------
+
+def test_prefetch_versions():
+    """
+    Ensure `prefetch_versions()` fills the version caches with a single Brew call.
+
+    **Test Strategy:**
+        - Mocks `subprocess.run` to return batched `brew info --json=v2` output.
+        - Ensures `version()` and `latest_version()` read the cache without calling Brew again.
+        - Ensures aliases hit the cache and a repeated prefetch runs no Brew command.
+    """
+
+    brew_info = subprocess.CompletedProcess(args=[], returncode=0, stdout=json.dumps({
+        "formulae": [
+            {"name": "wget", "versions": {"stable": "1.24.5"}, "installed": [{"version": "1.21.4"}]},
+            {"name": "openssl@3", "aliases": ["openssl"], "versions": {"stable": "3.3.1"}, "installed": []}
+        ]
+    }))
+
+    brew_utils.clear_versions()
+    try:
+        with patch("subprocess.run", side_effect=[brew_info]) as mock_run:
+            brew_utils.prefetch_versions(["wget", "openssl"])
+            assert mock_run.call_count == 1
+
+            assert brew_utils.version("wget") == "1.21.4"
+            assert brew_utils.latest_version("wget") == "1.24.5"
+            assert brew_utils.latest_version("openssl") == "3.3.1"
+            assert brew_utils.latest_version("openssl@3") == "3.3.1"
+            brew_utils.prefetch_versions(["wget", "openssl"])  # Already cached
+            assert mock_run.call_count == 1  # Served from the cache
+    finally:
+        brew_utils.clear_versions()
+
+def test_prefetch_versions_unknown_formula():
+    """
+    Ensure `prefetch_versions()` falls back to per-name queries when Brew rejects the batch.
+
+    **Test Strategy:**
+        - Mocks a failing batched `brew info` followed by one successful and one failing per-name query.
+        - Ensures the known formula is cached and the unknown one is cached as a miss.
+    """
+
+    wget_info = subprocess.CompletedProcess(args=[], returncode=0, stdout=json.dumps({
+        "formulae": [{"name": "wget", "versions": {"stable": "1.24.5"}}]
+    }))
+    unknown = subprocess.CalledProcessError(1, "brew")
+
+    brew_utils.clear_versions()
+    try:
+        with patch("subprocess.run", side_effect=[unknown, wget_info, unknown]) as mock_run:
+            brew_utils.prefetch_versions(["wget", "no-such-formula"])
+            assert mock_run.call_count == 3
+
+            assert brew_utils.latest_version("wget") == "1.24.5"
+            assert brew_utils.formula_available("wget") is True
+            assert brew_utils.formula_available("no-such-formula") is False
+            assert brew_utils.latest_version("no-such-formula") is None
+            brew_utils.prefetch_versions(["wget", "no-such-formula"])
+            assert mock_run.call_count == 3  # Served from the cache
+    finally:
+        brew_utils.clear_versions()
@@ -38,6 +38,7 @@ This module contains unit tests for the `package_utils.py` submodule within `pac
     2. `install_package(package, version, configs)`**
        - Installs a package using **Brew (if applicable)** or **Pip**.
        - Ensures installation compliance with externally managed Python environments.
+       - `install_packages(packages, configs)` batches several packages into one Pip invocation.
 
     3. `install_requirements(configs)`**
        - Processes dependency installations based on **predefined policies** (install, upgrade, downgrade, skip).
@@ -104,7 +105,18 @@ if str(ROOT_DIR) not in sys.path:
     sys.path.insert(0, str(ROOT_DIR))
 
 from tests.mocks.config_loader import load_mock_requirements, load_mock_installed
-from packages.requirements.lib import package_utils, policy_utils
+from packages.requirements.lib import brew_utils, package_utils, policy_utils
+
+class FakeDist:
+    """Minimal stand-in for `importlib.metadata.Distribution` (name, version and `direct_url.json`)."""
+
+    def __init__(self, name, version, direct_url=None):
+        self.metadata = {"Name": name}
+        self.version = version
+        self.direct_url = direct_url
+
+    def read_text(self, filename):
+        return self.direct_url if filename == "direct_url.json" else None
 
 # ------------------------------------------------------------------------------
 # Test: backup_packages()
@@ -115,32 +127,35 @@ def test_backup_packages(requirements_config):
     Validate that `backup_packages()` correctly saves the list of installed packages.
 
     **Mocked Components**:
-        - `subprocess.run()` to simulate `pip freeze`.
+        - `importlib.metadata.distributions()` to simulate installed distributions.
         - `open()` to avoid writing to an actual file.
         - `log_utils.log_message()` to prevent dependency on `configs["logging"]`.
 
     **Expected Behavior**:
-        - Ensures `pip freeze` runs correctly.
-        - Writes package output to a file.
+        - Writes `pip freeze`-style lines without running Pip.
     """
 
     mock_file = mock_open()
+    installed = [
+        FakeDist("rich", "13.9.4"),
+        FakeDist("pip", "24.3.1"),
+        FakeDist("FastAPI", "0.115.11")
+    ]
 
     with patch("builtins.open", mock_file), \
+         patch("importlib.metadata.distributions", return_value=installed), \
          patch("subprocess.run") as mock_run, \
          patch("packages.appflow_tracer.lib.log_utils.log_message") as mock_log:  # Mock log_message
 
         package_utils.backup_packages("test_backup.txt", requirements_config)
 
-        # Ensure subprocess is correctly called to get package list
-        mock_run.assert_called_with(
-            [sys.executable, "-m", "pip", "freeze"],
-            stdout=mock_file.return_value,
-            check=True
-        )
+        # Ensure no subprocess is needed to get the package list
+        mock_run.assert_not_called()
 
-        # Ensure file writing is correctly triggered
+        # Ensure file writing is correctly triggered, sorted, with original names and without `pip`
         mock_file.assert_called_with("test_backup.txt", "w")
+        written = "".join("".join(call.args[0]) for call in mock_file().writelines.call_args_list)
+        assert written == "FastAPI==0.115.11\nrich==13.9.4\n"
 
         # Ensure logging was triggered (but no need for `configs["logging"]`)
         mock_log.assert_any_call(
@@ -149,6 +164,49 @@ def test_backup_packages(requirements_config):
             configs=requirements_config
         )
 
+# ------------------------------------------------------------------------------
+# Test: freeze_packages()
+# ------------------------------------------------------------------------------
+
+def test_freeze_packages():
+    """
+    Validate that `freeze_packages()` matches `pip freeze` and `pip list --format=freeze`.
+
+    **Mocked Components**:
+        - `importlib.metadata.distributions()` with plain, editable, VCS, archive and duplicate installs.
+
+    **Expected Behavior**:
+        - PEP 610 origins render as `-e <url>` or `name @ url` lines by default.
+        - `all_packages=True, direct_urls=False` lists every package (pip included) as `name==version`.
+    """
+
+    installed = [
+        FakeDist("pip", "24.3.1"),
+        FakeDist("my_tool", "0.1.0", json.dumps({"url": "file:///src/my_tool", "dir_info": {"editable": True}})),
+        FakeDist("Requests", "2.32.3", json.dumps({
+            "url": "https://github.com/psf/requests",
+            "vcs_info": {"vcs": "git", "commit_id": "0e322af"}
+        })),
+        FakeDist("wheelhouse", "1.0", json.dumps({
+            "url": "https://example.com/wheelhouse-1.0.tar.gz",
+            "archive_info": {"hash": "sha256=abc"}
+        })),
+        FakeDist("requests", "2.0.0")  # Shadowed by the first match on sys.path
+    ]
+
+    with patch("importlib.metadata.distributions", return_value=installed):
+        assert package_utils.freeze_packages() == [
+            "-e file:///src/my_tool",
+            "Requests @ git+https://github.com/psf/requests@0e322af",
+            "wheelhouse @ https://example.com/wheelhouse-1.0.tar.gz#sha256=abc"
+        ]
+        assert package_utils.freeze_packages(all_packages=True, direct_urls=False) == [
+            "my_tool==0.1.0",
+            "pip==24.3.1",
+            "Requests==2.32.3",
+            "wheelhouse==1.0"
+        ]
+
 # ------------------------------------------------------------------------------
 # Test: install_package()
 # ------------------------------------------------------------------------------
@@ -202,7 +260,12 @@ def test_install_package_brew(installed_config):
 
     package_name = installed_config["requirements"][0]["package"]
 
-    with patch("subprocess.run") as mock_run, \
+    brew_info = subprocess.CompletedProcess(args=[], returncode=0, stdout=json.dumps({
+        "formulae": [{"name": package_name, "versions": {"stable": "1.0.0"}, "installed": []}]
+    }))
+
+    brew_utils.clear_versions()
+    with patch("subprocess.run", side_effect=[brew_info, None]) as mock_run, \
          patch("packages.requirements.lib.brew_utils.check_availability", return_value=True), \
          patch("packages.appflow_tracer.lib.log_utils.log_message") as mock_log:
 
@@ -217,7 +280,8 @@ def test_install_package_brew(installed_config):
         # Print actual logs for debugging
         print("LOGGED MESSAGES:", mock_log.call_args_list)
 
-        # Ensure `brew install` was called
+        # Ensure availability came from `brew info --json=v2`, then `brew install` was called
+        assert mock_run.call_args_list[0].args[0] == ["brew", "info", "--json=v2", "--formula", package_name]
         mock_run.assert_called_with(["brew", "install", package_name], check=False)
 
         # Normalize log messages for assertion
@@ -227,6 +291,33 @@ def test_install_package_brew(installed_config):
         expected_log = f"[INSTALL] Installing \"{package_name}\" via Homebrew..."
         assert any(expected_log in msg for msg in logged_messages), f"Expected log message '{expected_log}' not found in {logged_messages}"
 
+    brew_utils.clear_versions()
+
+# ------------------------------------------------------------------------------
+
+def test_install_packages_batch(requirements_config):
+    """
+    Ensure `install_packages()` installs several packages with a single Pip invocation.
+
+    **Test Strategy:**
+        - Mocks `subprocess.run` to report success, then failure of the batch.
+        - Ensures a failed batch is retried one package at a time.
+    """
+
+    packages = [("rich", None), ("typer", "0.6.0")]
+    expected_cmd = [sys.executable, "-m", "pip", "install", "--quiet", "--user", "rich", "typer==0.6.0"]
+
+    with patch("subprocess.run", return_value=subprocess.CompletedProcess(args=[], returncode=0)) as mock_run, \
+         patch("packages.appflow_tracer.lib.log_utils.log_message"):
+        package_utils.install_packages(packages, requirements_config)
+        mock_run.assert_called_once_with(expected_cmd, check=False)
+
+    with patch("subprocess.run", return_value=subprocess.CompletedProcess(args=[], returncode=1)) as mock_run, \
+         patch("packages.appflow_tracer.lib.log_utils.log_message"):
+        package_utils.install_packages(packages, requirements_config)
+        assert mock_run.call_count == 3  # Batch, then each package on its own
+        mock_run.assert_called_with(expected_cmd[:-2] + ["typer==0.6.0"], check=False)
+
 # ------------------------------------------------------------------------------
 # Test: install_requirements()
 # ------------------------------------------------------------------------------
@@ -236,11 +327,15 @@ def test_install_requirements(requirements_config):
     Ensure `install_requirements()` correctly installs dependencies based on `mock_requirements.json`.
     """
 
-    with patch("packages.requirements.lib.package_utils.install_package") as mock_install:
+    with patch("packages.requirements.lib.package_utils.install_packages") as mock_install:
         package_utils.install_requirements(requirements_config)
 
+        # All pending packages are installed in a single batch
+        mock_install.assert_called_once()
+        pending_packages, configs = mock_install.call_args.args
+        assert configs is requirements_config
         for dep in requirements_config["requirements"]:
-            mock_install.assert_any_call(dep["package"], None, requirements_config)
+            assert (dep["package"], None) in pending_packages
 
 # ------------------------------------------------------------------------------
 
@@ -258,7 +353,7 @@ def test_install_requirements_adhoc(requirements_config):
     # Modify `requirements_config` to force installation
     requirements_config["requirements"][0]["version"]["status"] = "adhoc"
 
-    with patch("packages.requirements.lib.package_utils.install_package") as mock_install, \
+    with patch("packages.requirements.lib.package_utils.install_packages") as mock_install, \
          patch("packages.appflow_tracer.lib.log_utils.log_message") as mock_log:
 
         # Execute package installation
@@ -278,9 +373,10 @@ def test_install_requirements_adhoc(requirements_config):
             for message in log_messages
         ), "Expected '[AD-HOC]' log message not found!"
 
-        # Ensure `install_package()` was called for **all** dependencies
+        # Ensure `install_packages()` received **all** dependencies
+        pending_packages = mock_install.call_args.args[0]
         for dep in requirements_config["requirements"]:
-            mock_install.assert_any_call(dep["package"], None, requirements_config)
+            assert (dep["package"], None) in pending_packages
 
 # ------------------------------------------------------------------------------
 # Test: restore_packages()
@@ -343,3 +439,26 @@ def test_installed_configfile(installed_config):
 
     result = package_utils.installed_configfile(installed_config)
     assert result == installed_config["packages"]["installation"]["configs"]
+
+# ------------------------------------------------------------------------------
+# Test: read_dependencies()
+# ------------------------------------------------------------------------------
+
+@pytest.mark.parametrize("streaming", [True, False])
+def test_read_dependencies(tmp_path, streaming):
+    """
+    Ensure `read_dependencies()` yields every dependency entry, with or without `ijson`.
+    """
+
+    if streaming and package_utils.ijson is None:
+        pytest.skip("ijson is not installed")
+
+    dependencies = [
+        {"package": "rich", "version": {"policy": "latest", "target": "12.0.0", "latest": False, "status": False}},
+        {"package": "typer", "version": {"policy": "restricted", "target": "0.6.0", "latest": "0.6.0", "status": "matched"}}
+    ]
+    file_path = tmp_path / "installed.json"
+    file_path.write_text(json.dumps({"dependencies": dependencies}))
+
+    with patch.object(package_utils, "ijson", package_utils.ijson if streaming else None):
+        assert list(package_utils.read_dependencies(file_path)) == dependencies
@@ -69,6 +69,7 @@ def test_policy_management(requirements_config, installed_config):
         - **Mocks** `installed_version()` & `latest_version()` to simulate system state.
         - **Ensures correct status assignment** (`installing`, `upgrading`, `matched`, etc.).
         - **Verifies structured logging** without requiring exact message matching.
+        - **Ensures** `pip_config_index()` is resolved once before the latest-version thread pool.
 
     ## Assertions:
         - `setuptools` should be **marked as `upgraded`**.
@@ -88,6 +89,7 @@ def test_policy_management(requirements_config, installed_config):
 
     with patch("packages.requirements.lib.version_utils.installed_version") as mock_installed, \
          patch("packages.requirements.lib.version_utils.latest_version") as mock_latest, \
+         patch("packages.requirements.lib.version_utils.pip_config_index", return_value=False) as mock_index, \
          patch("packages.requirements.lib.package_utils.installed_configfile", return_value=Path("/tmp/test_installed.json")), \
          patch("packages.appflow_tracer.lib.log_utils.log_message") as mock_log:
 
@@ -102,6 +104,9 @@ def test_policy_management(requirements_config, installed_config):
 
         result = policy_utils.policy_management(requirements_config)
 
+        # The pip index check is resolved once, before the worker pool starts
+        mock_index.assert_called_once_with()
+
         # Ensure package statuses are correctly assigned
         status_map = {dep["package"]: dep["version"]["status"] for dep in result}
 
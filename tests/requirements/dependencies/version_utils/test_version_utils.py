@@ -20,6 +20,7 @@ __version__ = "0.1.1"  ## Updated Test Module version
 ## Test Coverage:
     1. `installed_version(package, configs)`
        - Retrieves installed package versions dynamically from system package managers.
+       - `installed_index()` builds the cached distribution lookup it relies on.
 
     2. `latest_version(package, configs)`
        - Fetches the latest available package version from package repositories.
@@ -33,9 +34,18 @@ __version__ = "0.1.1"  ## Updated Test Module version
     5. `pip_latest_version(package)`
        - Uses Pip to fetch the latest available package version.
 
+    6. `pypi_latest_version(package)`
+       - Queries the PyPI JSON API for the latest released version.
+
+    7. `pip_config_index()`
+       - Detects an `index-url` / `extra-index-url` set in pip's configuration.
+
+    8. `compare_versions(left, right)`
+       - Compares versions numerically rather than as strings.
+
 ## Mocking Strategy:
     - `subprocess.run()` → Mocks CLI calls for `pip list`, `dpkg -s`, `powershell`, etc.
-    - `importlib.metadata.version()` → Mocks package version retrieval for Python packages.
+    - `importlib.metadata.distributions()` → Mocks the installed distribution scan.
     - `log_utils.log_message()` → Mocks structured logging calls.
 
 ## Expected Behavior:
@@ -51,6 +61,8 @@ import subprocess
 import random
 import string
 import importlib.metadata  # ✅ Use metadata to get the actual installed version
+import io
+import urllib.error
 
 from unittest.mock import patch, ANY
 from pathlib import Path
@@ -84,33 +96,48 @@ def test_installed_version(package, installed_version, requirements_config):
     Ensure `installed_version()` correctly retrieves the installed package version.
 
     **Test Strategy:**
-        - Mocks `pip list --format=json` to simulate installed packages.
-        - Ensures correct version retrieval from Pip.
+        - Rebuilds the cached `installed_index()` from the real environment.
+        - Ensures correct version retrieval without spawning any subprocess.
         - Ensures `None` is returned if the package is not installed.
     """
 
-    mock_pip_list = json.dumps([
-        {"name": "requests", "version": "2.26.0"},
-        {"name": "pandas", "version": "1.4.2"}
-    ])
-
-    with patch("subprocess.run") as mock_run, \
-         patch("importlib.metadata.version") as mock_metadata:
+    version_utils.installed_index.cache_clear()
 
-        # Simulate `pip list` failure (so that `importlib.metadata.version()` is used)
-        mock_run.side_effect = subprocess.CalledProcessError(1, "pip")
-
-        # Ensure `importlib.metadata.version()` is used for fallback
-        # mock_metadata.side_effect = lambda pkg: {"requests": "2.26.0", "pandas": "1.4.2"}.get(pkg.lower(), None)
-        mock_metadata.side_effect = lambda pkg: {
-            "requests": "2.26.0",
-            "pandas": "1.4.2",
-            "numpy": "2.2.3"  # Add numpy to the mock
-        }.get(pkg.lower(), None)
+    with patch("subprocess.run") as mock_run:
 
         result = version_utils.installed_version(package, requirements_config)
 
         assert result == installed_version, f"Expected {installed_version}, but got {result}"
+        mock_run.assert_not_called()  # No pip list, brew or system package manager lookups
+
+# ------------------------------------------------------------------------------
+# Test: installed_index()
+# ------------------------------------------------------------------------------
+
+def test_installed_index():
+    """
+    Ensure `installed_index()` scans distributions once and normalizes their names.
+
+    **Test Strategy:**
+        - Mocks `importlib.metadata.distributions()` with two fake distributions.
+        - Ensures repeated lookups reuse the cached index until `cache_clear()`.
+    """
+
+    class FakeDist:
+        def __init__(self, name, version):
+            self.metadata = {"Name": name}
+            self.version = version
+
+    fake_dists = [FakeDist("Typing_Extensions", "4.12.2"), FakeDist("zope.interface", "7.0")]
+
+    version_utils.installed_index.cache_clear()
+    try:
+        with patch("importlib.metadata.distributions", return_value=fake_dists) as mock_dists:
+            assert version_utils.installed_index() == {"typing-extensions": "4.12.2", "zope-interface": "7.0"}
+            assert version_utils.installed_index() is version_utils.installed_index()
+            mock_dists.assert_called_once()
+    finally:
+        version_utils.installed_index.cache_clear()
 
 # ------------------------------------------------------------------------------
 # Test: latest_version()
@@ -125,13 +152,17 @@ def test_latest_version(package, latest_version, requirements_config):
     Ensure `latest_version()` correctly fetches the latest available package version.
 
     **Test Strategy:**
+        - Simulates an offline PyPI JSON API to force the Pip fallback.
         - Mocks `pip index versions <package>` to simulate the latest version retrieval.
         - Ensures correct version extraction from Pip.
     """
 
     mock_pip_versions = f"Available versions: {latest_version}, 1.21.2, 1.18.5"
 
-    with patch("subprocess.run") as mock_run:
+    with patch("packages.requirements.lib.version_utils.pypi_latest_version",
+               side_effect=urllib.error.URLError("offline")), \
+         patch("packages.requirements.lib.version_utils.pip_config_index", return_value=False), \
+         patch("subprocess.run") as mock_run:
         mock_run.return_value.stdout = mock_pip_versions
 
         result = version_utils.latest_version(package, requirements_config)
@@ -195,18 +226,116 @@ def test_pip_latest_version(package, latest_version):
     Ensure `pip_latest_version()` retrieves the correct latest package version.
 
     **Test Strategy:**
+    - Simulates an offline PyPI JSON API to force the Pip fallback.
     - Mocks `pip index versions <package>` to simulate version retrieval.
     - Ensures correct parsing of available versions.
     """
 
     mock_pip_versions = f"Available versions: {latest_version}, 2.27.0, 2.26.0"
 
-    with patch("subprocess.run") as mock_run:
+    with patch("packages.requirements.lib.version_utils.pypi_latest_version",
+               side_effect=urllib.error.URLError("offline")), \
+         patch("packages.requirements.lib.version_utils.pip_config_index", return_value=False), \
+         patch("subprocess.run") as mock_run:
         mock_run.return_value.stdout = mock_pip_versions
 
         result = version_utils.pip_latest_version(package)
         assert result == latest_version, f"Expected {latest_version}, but got {result}"
 
+# ------------------------------------------------------------------------------
+# Test: pypi_latest_version()
+# ------------------------------------------------------------------------------
+
+def test_pypi_latest_version():
+    """
+    Ensure `pypi_latest_version()` reads `info.version` from the PyPI JSON API.
+
+    **Test Strategy:**
+    - Mocks `urllib.request.urlopen()` with a JSON payload and with an HTTP 404.
+    - Ensures `pip_latest_version()` uses the API result without spawning `pip`.
+    """
+
+    payload = json.dumps({"info": {"version": "2.32.3"}}).encode()
+
+    with patch("urllib.request.urlopen", return_value=io.BytesIO(payload)) as mock_urlopen, \
+         patch("packages.requirements.lib.version_utils.pip_config_index", return_value=False), \
+         patch("subprocess.run") as mock_run, \
+         patch.dict("os.environ", {}, clear=False) as env:
+        env.pop("PIP_INDEX_URL", None)
+        env.pop("PIP_EXTRA_INDEX_URL", None)
+
+        assert version_utils.pip_latest_version("requests") == "2.32.3"
+        mock_urlopen.assert_called_once_with("https://pypi.org/pypi/requests/json", timeout=ANY)
+        mock_run.assert_not_called()
+
+    not_found = urllib.error.HTTPError("https://pypi.org", 404, "Not Found", {}, None)
+    with patch("urllib.request.urlopen", side_effect=not_found):
+        assert version_utils.pypi_latest_version("no-such-package") is None
+
+# ------------------------------------------------------------------------------
+# Test: pip_config_index()
+# ------------------------------------------------------------------------------
+
+def test_pip_config_index():
+    """
+    Ensure `pip_config_index()` detects an index configured in pip's configuration files.
+
+    **Test Strategy:**
+    - Mocks `pip config list` with and without an `index-url` entry.
+    - Ensures `pip_latest_version()` skips the PyPI JSON API when an index is configured.
+    """
+
+    config = subprocess.CompletedProcess([], 0, stdout="global.index-url='https://mirror.example/simple'\n")
+
+    version_utils.pip_config_index.cache_clear()
+    with patch("subprocess.run", return_value=subprocess.CompletedProcess([], 0, stdout="")):
+        assert version_utils.pip_config_index() is False
+
+    version_utils.pip_config_index.cache_clear()
+    with patch("urllib.request.urlopen") as mock_urlopen, \
+         patch("subprocess.run", side_effect=[
+             config,
+             subprocess.CompletedProcess([], 0, stdout="Available versions: 1.2.0, 1.1.0")
+         ]) as mock_run, \
+         patch.dict("os.environ", {}, clear=False) as env:
+        env.pop("PIP_INDEX_URL", None)
+        env.pop("PIP_EXTRA_INDEX_URL", None)
+
+        assert version_utils.pip_latest_version("internal-lib") == "1.2.0"
+        mock_urlopen.assert_not_called()
+        assert mock_run.call_args_list[0].args[0][-2:] == ["config", "list"]
+    version_utils.pip_config_index.cache_clear()
+
+# ------------------------------------------------------------------------------
+# Test: compare_versions()
+# ------------------------------------------------------------------------------
+
+@pytest.mark.parametrize("left, right, expected", [
+    ("1.10", "1.9", 1),     # Lexically smaller, numerically greater
+    ("9.0", "10.0", -1),
+    ("1.0", "1.0.0", 0),
+    ("2.0.0rc1", "2.0.0", -1),
+])
+@pytest.mark.parametrize("with_packaging", [True, False])
+def test_compare_versions(left, right, expected, with_packaging):
+    """
+    Ensure `compare_versions()` orders versions numerically, with or without `packaging`.
+    """
+
+    if not with_packaging and "rc" in left:
+        pytest.skip("Pre-releases need `packaging`")
+
+    version_utils.version_key.cache_clear()
+    try:
+        if with_packaging:
+            result = version_utils.compare_versions(left, right)
+        else:
+            with patch.object(version_utils, "Version", None):
+                result = version_utils.compare_versions(left, right)
+        assert result == expected, f"Expected {expected}, but got {result}"
+    finally:
+        version_utils.version_key.cache_clear()
+
 # ------------------------------------------------------------------------------
 # Test: Brew version retrieval
 # ------------------------------------------------------------------------------